@@ -8,7 +8,7 @@ import os
 from pathlib import Path
 
 import dj_database_url
-from decouple import config
+from decouple import Csv, config
 
 # ---------------------------------------------------------------------
 # BASE DIR
@@ -42,6 +42,7 @@ INSTALLED_APPS = [
     "api_auth",
     "users",
     "projects",
+    "jobs",
 ]
 
 # ---------------------------------------------------------------------
@@ -49,6 +50,8 @@ INSTALLED_APPS = [
 # ---------------------------------------------------------------------
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "utils.compression.CompressionMiddleware",
+    "utils.db_routers.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -92,10 +95,86 @@ DATABASES = {
 
 # Si DATABASE_URL est défini (GitHub Actions, production, etc.)
 DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Pool de connexions psycopg 3 (PostgreSQL uniquement, Django ≥ 5.1)
+DB_POOL = config("DB_POOL", default=False, cast=bool)
+DB_POOL_MIN_SIZE = config("DB_POOL_MIN_SIZE", default=2, cast=int)
+DB_POOL_MAX_SIZE = config("DB_POOL_MAX_SIZE", default=10, cast=int)
+# Attente maximale (s) d’une connexion libre avant erreur
+DB_POOL_TIMEOUT = config("DB_POOL_TIMEOUT", default=10.0, cast=float)
+# Durée (s) avant fermeture d’une connexion inutilisée / recyclage
+DB_POOL_MAX_IDLE = config("DB_POOL_MAX_IDLE", default=600.0, cast=float)
+DB_POOL_MAX_LIFETIME = config(
+    "DB_POOL_MAX_LIFETIME", default=3600.0, cast=float
+)
+
 if DATABASE_URL:
+    use_pool = DB_POOL and DATABASE_URL.startswith(("postgres", "pgsql"))
+    # Le pool remplace les connexions persistantes (CONN_MAX_AGE = 0)
     DATABASES["default"] = dj_database_url.parse(
-        DATABASE_URL, conn_max_age=600
+        DATABASE_URL,
+        conn_max_age=0 if use_pool else 600,
+        conn_health_checks=not use_pool,
     )
+    if use_pool:
+        from psycopg_pool import ConnectionPool
+
+        DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+            "min_size": DB_POOL_MIN_SIZE,
+            "max_size": DB_POOL_MAX_SIZE,
+            "timeout": DB_POOL_TIMEOUT,
+            "max_idle": DB_POOL_MAX_IDLE,
+            "max_lifetime": DB_POOL_MAX_LIFETIME,
+            # Vérifie chaque connexion avant de la prêter
+            "check": ConnectionPool.check_connection,
+        }
+
+# Profil SQLite « production » : WAL (lecteurs non bloqués par
+# l’écrivain), mmap, cache de pages, attente des verrous et transactions
+# IMMEDIATE (évite les « database is locked » entre workers gunicorn).
+SQLITE_TUNING = config("SQLITE_TUNING", default=False, cast=bool)
+SQLITE_MMAP_SIZE = config(
+    "SQLITE_MMAP_SIZE", default=256 * 1024 * 1024, cast=int
+)
+SQLITE_CACHE_SIZE_KB = config("SQLITE_CACHE_SIZE_KB", default=65536, cast=int)
+# Attente maximale (ms) d’un verrou avant « database is locked »
+SQLITE_BUSY_TIMEOUT = config("SQLITE_BUSY_TIMEOUT", default=5000, cast=int)
+# Intervalle (s) des checkpoints WAL lancés par le worker (0 = jamais)
+SQLITE_CHECKPOINT_INTERVAL = config(
+    "SQLITE_CHECKPOINT_INTERVAL", default=300, cast=int
+)
+SQLITE_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+    f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}",
+    f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT}",
+    "PRAGMA temp_store=MEMORY",
+]
+if SQLITE_TUNING and DATABASES["default"]["ENGINE"].endswith("sqlite3"):
+    DATABASES["default"].setdefault("OPTIONS", {}).update(
+        {
+            "init_command": ";".join(SQLITE_PRAGMAS),
+            "transaction_mode": "IMMEDIATE",
+            "timeout": SQLITE_BUSY_TIMEOUT / 1000,
+        }
+    )
+
+# Réplicas en lecture seule (URL séparées par des virgules), alias
+# replica_1, replica_2… ; lus par les requêtes GET via le routeur.
+READ_REPLICAS = []
+for index, url in enumerate(
+    config("DATABASE_REPLICA_URLS", default="", cast=Csv()), start=1
+):
+    alias = f"replica_{index}"
+    DATABASES[alias] = dj_database_url.parse(url, conn_max_age=600)
+    # En test, le réplica est la base principale elle-même
+    DATABASES[alias]["TEST"] = {"MIRROR": "default"}
+    READ_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["utils.db_routers.PrimaryReplicaRouter"]
+# Durée (s) pendant laquelle un client ayant écrit lit sur la principale
+REPLICA_PIN_SECONDS = config("REPLICA_PIN_SECONDS", default=5, cast=int)
 
 # ---------------------------------------------------------------------
 # VALIDATION DES MOTS DE PASSE
@@ -193,17 +272,92 @@ OAUTH2_PROVIDER = {
 # ---------------------------------------------------------------------
 # CACHE (OPTIMISATION LOCALE)
 # ---------------------------------------------------------------------
+# Un seul fichier SQLite (WAL) partagé par tous les workers de l’hôte
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
-        "LOCATION": BASE_DIR / "cache",
+        "BACKEND": "utils.sqlite_cache.SQLiteCache",
+        "LOCATION": BASE_DIR / "cache" / "softdesk_cache.sqlite3",
         "TIMEOUT": 600,
-    }
+        "OPTIONS": {
+            "MAX_ENTRIES": config(
+                "CACHE_MAX_ENTRIES", default=10000, cast=int
+            ),
+            "CULL_FREQUENCY": 4,
+        },
+    },
+    # Octets compressés à part : ils n’évincent pas les entrées chaudes
+    "compression": {
+        "BACKEND": "utils.sqlite_cache.SQLiteCache",
+        "LOCATION": BASE_DIR / "cache" / "softdesk_compression.sqlite3",
+        "TIMEOUT": 600,
+        "OPTIONS": {
+            "MAX_ENTRIES": config(
+                "COMPRESSION_CACHE_MAX_ENTRIES", default=500, cast=int
+            ),
+            "CULL_FREQUENCY": 4,
+        },
+    },
 }
 
+# ---------------------------------------------------------------------
+# COMPRESSION DES RÉPONSES (gzip / brotli)
+# ---------------------------------------------------------------------
+# Taille minimale (octets) en dessous de laquelle la réponse reste brute
+COMPRESSION_MIN_SIZE = config("COMPRESSION_MIN_SIZE", default=1024, cast=int)
+COMPRESSION_GZIP_LEVEL = config("COMPRESSION_GZIP_LEVEL", default=6, cast=int)
+COMPRESSION_BROTLI_QUALITY = config(
+    "COMPRESSION_BROTLI_QUALITY", default=5, cast=int
+)
+# Alias de cache dédié aux octets compressés des réponses elles-mêmes en
+# cache (`cache_compressed`, schéma OpenAPI) ; vide = pas de cache
+COMPRESSION_CACHE_ALIAS = config(
+    "COMPRESSION_CACHE_ALIAS", default="compression"
+)
+# Durée de conservation des octets compressés en cache (0 = désactivé)
+COMPRESSION_CACHE_TIMEOUT = config(
+    "COMPRESSION_CACHE_TIMEOUT", default=600, cast=int
+)
+
+# ---------------------------------------------------------------------
+# FILE DE TÂCHES (manage.py run_softdesk_worker)
+# ---------------------------------------------------------------------
+# True : tâches exécutées immédiatement dans la requête (dev / tests).
+# Par défaut suit DEBUG : en production, sans réglage explicite, les
+# tâches partent au worker
+JOBS_EAGER = config("JOBS_EAGER", default=DEBUG, cast=bool)
+JOBS_MAX_ATTEMPTS = config("JOBS_MAX_ATTEMPTS", default=5, cast=int)
+# Délai de base (s) doublé à chaque échec, plafonné à JOBS_RETRY_BACKOFF_MAX
+JOBS_RETRY_BACKOFF = config("JOBS_RETRY_BACKOFF", default=5, cast=int)
+JOBS_RETRY_BACKOFF_MAX = config(
+    "JOBS_RETRY_BACKOFF_MAX", default=3600, cast=int
+)
+JOBS_POLL_INTERVAL = config("JOBS_POLL_INTERVAL", default=1.0, cast=float)
+# Délai (s) après lequel une tâche RUNNING est considérée abandonnée
+JOBS_LOCK_TIMEOUT = config("JOBS_LOCK_TIMEOUT", default=300, cast=int)
+# Lignes supprimées par transaction lors des purges de projets / comptes
+JOBS_DELETE_BATCH_SIZE = config(
+    "JOBS_DELETE_BATCH_SIZE", default=500, cast=int
+)
+
+# ---------------------------------------------------------------------
+# PRÉCHAUFFAGE DU CACHE (manage.py warm_softdesk_cache)
+# ---------------------------------------------------------------------
+# Utilisateurs récents traités, en parallèle, et démarrés par seconde
+CACHE_WARMUP_USERS = config("CACHE_WARMUP_USERS", default=100, cast=int)
+CACHE_WARMUP_WORKERS = config("CACHE_WARMUP_WORKERS", default=4, cast=int)
+CACHE_WARMUP_RATE = config("CACHE_WARMUP_RATE", default=20.0, cast=float)
+# True : `migrate` (donc chaque déploiement) publie un préchauffage
+CACHE_WARMUP_AFTER_MIGRATE = config(
+    "CACHE_WARMUP_AFTER_MIGRATE", default=False, cast=bool
+)
+
 # ---------------------------------------------------------------------
 # DOCUMENTATION
 # ---------------------------------------------------------------------
+# Dossier des schémas précompilés (manage.py build_openapi_schema) ;
+# vide : schéma généré au premier appel puis mémorisé par processus
+OPENAPI_SCHEMA_DIR = config("OPENAPI_SCHEMA_DIR", default="")
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "SoftDesk API",
     "DESCRIPTION": (
@@ -285,6 +439,10 @@ LOGGING = {
             "format": "{levelname}: {message}",
             "style": "{",
         },
+        # Une ligne JSON par événement (champs `extra` inclus)
+        "json": {
+            "()": "utils.log_handlers.JsonFormatter",
+        },
     },
     "handlers": {
         # Fichier dédié aux logs des invitations
@@ -294,18 +452,46 @@ LOGGING = {
             "filename": os.path.join(BASE_DIR, "logs", "invites.log"),
             "maxBytes": 2 * 1024 * 1024,  # 2 MB max
             "backupCount": 5,  # garde 5 fichiers de rotation
-            "formatter": "verbose",
+            "formatter": "json",
         },
         # Console (utile pour debug local)
         "console": {
             "class": "logging.StreamHandler",
             "formatter": "simple",
         },
+        # File bornée non bloquante vers le fichier et la console : la
+        # rotation et les écritures se font dans le thread du listener.
+        # Clés natives de dictConfig (Python 3.12+) ; sous 3.11, le nom
+        # doit être classé après ceux des handlers cibles.
+        "queue_invites": {
+            "class": "utils.log_handlers.BoundedQueueHandler",
+            "queue": {
+                "()": "queue.Queue",
+                "maxsize": config(
+                    "LOG_QUEUE_MAXSIZE", default=10000, cast=int
+                ),
+            },
+            "listener": "utils.log_handlers.DrainingQueueListener",
+            "handlers": ["invites_file", "console"],
+            "respect_handler_level": True,
+        },
     },
     "loggers": {
         # Logger pour les tentatives d’ajout / suppression
         "projects.invites": {
-            "handlers": ["invites_file", "console"],
+            "handlers": ["queue_invites"],
+            "level": "INFO",
+            "propagate": False,
+        },
+        # État des files de logs (pertes sur file pleine)
+        "logs": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
+        # Pool de connexions et checkpoints SQLite (db.pool, db.sqlite)
+        "db": {
+            "handlers": ["console"],
             "level": "INFO",
             "propagate": False,
         },
@@ -6,11 +6,8 @@ Regroupe les endpoints d'administration, d'API, d'authentification, OAuth2 et do
 from django.contrib import admin
 from django.shortcuts import redirect
 from django.urls import include, path
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
+from utils.openapi_cache import CachedSpectacularAPIView
 
 urlpatterns = [
     # Interface d’administration Django
@@ -24,7 +21,7 @@ urlpatterns = [
     # OAuth2 Provider : token, refresh, revoke, introspect
     path("o/", include("oauth2_provider.urls", namespace="oauth2_provider")),
     # Documentation OpenAPI & interfaces Swagger / ReDoc
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", CachedSpectacularAPIView.as_view(), name="schema"),
     path(
         "api/docs/",
         SpectacularSwaggerView.as_view(url_name="schema"),
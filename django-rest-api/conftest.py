@@ -0,0 +1,36 @@
+"""
+Configuration commune des tests.
+Fixe explicitement les réglages dont la valeur par défaut dépend de
+l’environnement (`DEBUG`), pour que la suite se comporte partout de même,
+et isole les fichiers de cache dans un dossier temporaire.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+from django.conf import settings
+
+_CACHE_DIR = None
+
+
+def pytest_configure(config):
+    """Range les caches SQLite dans un dossier temporaire de session."""
+    global _CACHE_DIR
+    _CACHE_DIR = Path(tempfile.mkdtemp(prefix="softdesk-cache-"))
+    for alias in settings.CACHES.values():
+        if alias["BACKEND"] == "utils.sqlite_cache.SQLiteCache":
+            alias["LOCATION"] = _CACHE_DIR / Path(alias["LOCATION"]).name
+
+
+def pytest_unconfigure(config):
+    """Supprime le dossier temporaire des caches."""
+    if _CACHE_DIR is not None:
+        shutil.rmtree(_CACHE_DIR, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def eager_jobs(settings):
+    """Exécute les tâches dans la requête (aucun worker en test)."""
+    settings.JOBS_EAGER = True
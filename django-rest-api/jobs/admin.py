@@ -0,0 +1,31 @@
+"""
+Configuration de l’administration Django pour la file de tâches.
+Permet de suivre l’état, les tentatives et les erreurs des tâches.
+"""
+
+from django.contrib import admin
+
+from .models import Job
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """Configuration d’affichage du modèle Job."""
+
+    list_display = (
+        "id",
+        "name",
+        "status",
+        "attempts",
+        "run_at",
+        "finished_time",
+    )
+    search_fields = ("name", "idempotency_key")
+    list_filter = ("status", "name")
+    ordering = ("-id",)
+    readonly_fields = (
+        "created_time",
+        "locked_at",
+        "finished_time",
+        "progress",
+    )
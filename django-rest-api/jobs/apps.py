@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "jobs"
+
+    def ready(self):
+        """Charge les modules `tasks` de chaque application installée."""
+        from django.utils.module_loading import autodiscover_modules
+
+        autodiscover_modules("tasks")
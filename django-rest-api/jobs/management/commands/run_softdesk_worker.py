@@ -0,0 +1,89 @@
+"""
+Commande `run_softdesk_worker` : consommateur de la file de tâches.
+Réserve et exécute les tâches en attente jusqu’à interruption (SIGINT /
+SIGTERM), ou une seule passe avec `--once`.
+"""
+
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from jobs.queue import (
+    claim_next,
+    default_worker_id,
+    release_stale_jobs,
+    run_job,
+)
+from utils.db_pool import log_pool_stats
+from utils.log_handlers import flush_log_queues, log_queue_stats
+from utils.sqlite_tuning import maybe_checkpoint
+
+
+class Command(BaseCommand):
+    """Exécute les tâches de la file SoftDesk."""
+
+    help = "Exécute les tâches en arrière-plan de la file SoftDesk."
+
+    def add_arguments(self, parser):
+        """Déclare les options de la commande."""
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Vide la file une fois puis s’arrête.",
+        )
+        parser.add_argument(
+            "--max-jobs",
+            type=int,
+            default=None,
+            help="Nombre maximal de tâches à exécuter avant l’arrêt.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=settings.JOBS_POLL_INTERVAL,
+            help="Attente (s) entre deux scrutations d’une file vide.",
+        )
+
+    def handle(self, *args, **options):
+        """Boucle principale du worker."""
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        worker_id = default_worker_id()
+        done = failed = 0
+        self.stdout.write(f"Worker {worker_id} démarré.")
+
+        while not self.stopping:
+            if options["max_jobs"] and done + failed >= options["max_jobs"]:
+                break
+
+            job = claim_next(worker_id)
+            if job is None:
+                release_stale_jobs()
+                maybe_checkpoint()
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+
+            if run_job(job):
+                done += 1
+            else:
+                failed += 1
+
+        # Écrit les logs encore en file avant la fin du processus
+        log_pool_stats()
+        log_queue_stats()
+        flush_log_queues()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Worker arrêté : {done} tâche(s) réussie(s), "
+                f"{failed} en échec."
+            )
+        )
+
+    def _stop(self, signum, frame):
+        """Termine la tâche en cours puis arrête la boucle."""
+        self.stopping = True
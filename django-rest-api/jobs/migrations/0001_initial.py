@@ -0,0 +1,75 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:18
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name='Job',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('name', models.CharField(max_length=100)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[
+                            ('PENDING', 'En attente'),
+                            ('RUNNING', 'En cours'),
+                            ('DONE', 'Terminée'),
+                            ('FAILED', 'En échec'),
+                        ],
+                        default='PENDING',
+                        max_length=10,
+                    ),
+                ),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('max_attempts', models.PositiveIntegerField(default=5)),
+                (
+                    'run_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    'idempotency_key',
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                ('locked_by', models.CharField(blank=True, max_length=100)),
+                ('locked_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_time', models.DateTimeField(auto_now_add=True)),
+                ('finished_time', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Tâche',
+                'verbose_name_plural': 'Tâches',
+                'ordering': ['run_at', 'id'],
+                'indexes': [
+                    models.Index(
+                        fields=['status', 'run_at', 'id'], name='job_claim_idx'
+                    )
+                ],
+                'constraints': [
+                    models.UniqueConstraint(
+                        condition=models.Q(('status', 'PENDING')),
+                        fields=('idempotency_key',),
+                        name='unique_pending_job_key',
+                    )
+                ],
+            },
+        ),
+    ]
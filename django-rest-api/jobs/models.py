@@ -0,0 +1,66 @@
+"""
+Modèle de la file de tâches en arrière-plan.
+Chaque ligne représente une tâche à exécuter par le worker
+(`manage.py run_softdesk_worker`), avec son état, ses tentatives
+et sa clé d’idempotence.
+"""
+
+from django.db import models
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """Tâche différée stockée en base de données."""
+
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+    STATUS_CHOICES = [
+        (PENDING, "En attente"),
+        (RUNNING, "En cours"),
+        (DONE, "Terminée"),
+        (FAILED, "En échec"),
+    ]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=PENDING
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    idempotency_key = models.CharField(max_length=255, null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    # Avancement publié par la tâche (ex: {"done": 500, "total": 2000})
+    progress = models.JSONField(default=dict, blank=True)
+    created_time = models.DateTimeField(auto_now_add=True)
+    finished_time = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            # Une seule tâche en attente par clé ; une tâche déjà en cours
+            # n’empêche pas d’en publier une nouvelle
+            models.UniqueConstraint(
+                fields=["idempotency_key"],
+                condition=models.Q(status="PENDING"),
+                name="unique_pending_job_key",
+            )
+        ]
+        indexes = [
+            # Sélection par le worker : tâches dues, les plus anciennes
+            models.Index(
+                fields=["status", "run_at", "id"], name="job_claim_idx"
+            ),
+        ]
+        ordering = ["run_at", "id"]
+        verbose_name = "Tâche"
+        verbose_name_plural = "Tâches"
+
+    def __str__(self):
+        """Retourne le nom, l’identifiant et l’état de la tâche."""
+        return f"{self.name} #{self.pk} ({self.status})"
@@ -0,0 +1,328 @@
+"""
+File de tâches légère adossée à la base de données.
+Les vues publient des tâches via `enqueue()` ; le worker
+(`manage.py run_softdesk_worker`) les réserve par UPDATE conditionnel,
+les exécute et les replanifie avec un délai exponentiel en cas d’échec.
+Une tâche en cours rafraîchit son verrou à chaque avancement publié ;
+chaque changement de statut vérifie que le worker détient encore le
+verrou.
+"""
+
+import logging
+import os
+import socket
+from contextvars import ContextVar
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from jobs.models import Job
+
+logger = logging.getLogger("jobs")
+
+_HANDLERS = {}
+
+# Tâche en cours d’exécution (pour report_progress)
+_current_job = ContextVar("current_job", default=None)
+
+
+class JobLockLost(Exception):
+    """Le verrou de la tâche a expiré et a été repris par un autre worker."""
+
+
+# ---------------------------------------------------------------------
+# REGISTRE
+# ---------------------------------------------------------------------
+def register(name):
+    """
+    Décorateur enregistrant une fonction comme tâche.
+
+    La fonction reçoit le contenu de `payload` en arguments nommés ;
+    elle doit être idempotente, une tâche pouvant être rejouée.
+    """
+
+    def decorator(func):
+        _HANDLERS[name] = func
+        return func
+
+    return decorator
+
+
+def get_handler(name):
+    """Renvoie la fonction associée à une tâche, ou None."""
+    return _HANDLERS.get(name)
+
+
+# ---------------------------------------------------------------------
+# PUBLICATION
+# ---------------------------------------------------------------------
+def enqueue(name, payload=None, key=None, delay=0, max_attempts=None):
+    """
+    Publie une tâche.
+
+    En mode `JOBS_EAGER` (par défaut avec `DEBUG`, et forcé en tests),
+    la tâche est exécutée immédiatement dans la requête.
+    Sinon elle est enregistrée dans la transaction courante : le worker
+    ne la voit qu’une fois celle-ci validée.
+
+    Args:
+        name (str): nom enregistré via `register()`.
+        payload (dict): arguments JSON de la tâche.
+        key (str): clé d’idempotence ; une tâche en attente portant la
+            même clé n’est pas dupliquée.
+        delay (int): délai minimal d’exécution, en secondes.
+        max_attempts (int): nombre maximal de tentatives.
+
+    Returns:
+        Job | None: la tâche publiée (ou existante), None en mode eager.
+    """
+    payload = payload or {}
+    if get_handler(name) is None:
+        raise ValueError(f"Tâche inconnue : {name}")
+
+    if settings.JOBS_EAGER:
+        get_handler(name)(**payload)
+        return None
+
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name,
+                payload=payload,
+                idempotency_key=key,
+                run_at=timezone.now() + timedelta(seconds=delay),
+                max_attempts=max_attempts or settings.JOBS_MAX_ATTEMPTS,
+            )
+    except IntegrityError:
+        if key is None:
+            raise
+        return Job.objects.filter(
+            idempotency_key=key, status=Job.PENDING
+        ).first()
+
+
+# ---------------------------------------------------------------------
+# EXÉCUTION
+# ---------------------------------------------------------------------
+def default_worker_id():
+    """Identifiant du worker courant (hôte et PID)."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def claim_next(worker_id):
+    """
+    Réserve la prochaine tâche due.
+
+    La réservation est un UPDATE conditionnel sur le statut : si deux
+    workers visent la même ligne, un seul la fait passer à RUNNING.
+    """
+    candidates = Job.objects.filter(
+        status=Job.PENDING, run_at__lte=timezone.now()
+    ).values_list("pk", flat=True)[:10]
+
+    for pk in candidates:
+        claimed = Job.objects.filter(pk=pk, status=Job.PENDING).update(
+            status=Job.RUNNING,
+            locked_by=worker_id,
+            locked_at=timezone.now(),
+            attempts=F("attempts") + 1,
+        )
+        if claimed:
+            return Job.objects.get(pk=pk)
+    return None
+
+
+def retry_delay(attempts):
+    """Délai avant nouvelle tentative : exponentiel et plafonné."""
+    delay = settings.JOBS_RETRY_BACKOFF * 2 ** max(attempts - 1, 0)
+    return min(delay, settings.JOBS_RETRY_BACKOFF_MAX)
+
+
+def _owned(job):
+    """
+    Ligne de la tâche, tant que ce worker détient son verrou.
+
+    Un worker dont le verrou a expiré (tâche remise en attente puis
+    réservée ailleurs) ne peut plus modifier ni le statut ni l’avancement.
+    """
+    return Job.objects.filter(
+        pk=job.pk, status=Job.RUNNING, locked_by=job.locked_by
+    )
+
+
+def _lock_lost(job):
+    """Journalise une transition refusée faute de verrou."""
+    logger.warning(
+        "job_lock_lost",
+        extra={"job": job.pk, "job_name": job.name, "worker": job.locked_by},
+    )
+
+
+def _finish(job, status, error="", rows=None):
+    """Marque une tâche comme terminée ou définitivement en échec."""
+    rows = _owned(job) if rows is None else rows
+    if not rows.update(
+        status=status, last_error=error, finished_time=timezone.now()
+    ):
+        _lock_lost(job)
+
+
+def _schedule_retry(job, error, rows=None):
+    """
+    Replanifie une tâche échouée ou l’abandonne après max_attempts.
+
+    `rows` restreint la transition (par défaut : verrou détenu par le
+    worker de `job`).
+    """
+    rows = _owned(job) if rows is None else rows
+    if job.attempts >= job.max_attempts:
+        logger.error("job_failed", extra={"job": job.pk, "job_name": job.name})
+        _finish(job, Job.FAILED, error, rows=rows)
+        return
+
+    try:
+        with transaction.atomic():
+            updated = rows.update(
+                status=Job.PENDING,
+                last_error=error,
+                locked_by="",
+                locked_at=None,
+                run_at=timezone.now()
+                + timedelta(seconds=retry_delay(job.attempts)),
+            )
+    except IntegrityError:
+        # Une tâche identique a été publiée entre-temps : elle suffit
+        _finish(
+            job,
+            Job.DONE,
+            f"Remplacée par une tâche identique. {error}",
+            rows=rows,
+        )
+        return
+    if not updated:
+        _lock_lost(job)
+
+
+def run_job(job):
+    """
+    Exécute une tâche réservée.
+
+    Returns:
+        bool: True si la tâche a réussi.
+    """
+    handler = get_handler(job.name)
+    if handler is None:
+        _finish(job, Job.FAILED, f"Tâche inconnue : {job.name}")
+        return False
+
+    token = _current_job.set(job)
+    try:
+        handler(**job.payload)
+    except JobLockLost:
+        # Tâche reprise par un autre worker : elle ne lui appartient plus
+        _lock_lost(job)
+        return False
+    except Exception as exc:
+        logger.warning(
+            "job_error",
+            exc_info=True,
+            extra={"job": job.pk, "job_name": job.name},
+        )
+        _schedule_retry(job, f"{type(exc).__name__}: {exc}")
+        return False
+    finally:
+        _current_job.reset(token)
+
+    _finish(job, Job.DONE)
+    return True
+
+
+def report_progress(**progress):
+    """
+    Publie l’avancement de la tâche en cours (visible dans l’admin) et
+    rafraîchit son verrou : une tâche longue qui progresse n’est jamais
+    considérée abandonnée par `release_stale_jobs`.
+
+    Sans effet hors du worker (mode eager).
+
+    Raises:
+        JobLockLost: si le verrou a été repris (la tâche doit s’arrêter).
+    """
+    job = _current_job.get()
+    if job is None:
+        return
+    if not _owned(job).update(progress=progress, locked_at=timezone.now()):
+        raise JobLockLost(f"Verrou perdu pour la tâche {job.pk}.")
+    logger.info(
+        "job_progress",
+        extra={"job": job.pk, "job_name": job.name, **progress},
+    )
+
+
+class ProgressCounter:
+    """Cumule les lignes traitées et publie l’avancement à chaque lot."""
+
+    def __init__(self, total):
+        """Initialise le compteur pour un volume total connu."""
+        self.total = total
+        self.done = 0
+
+    def __call__(self, count):
+        """Ajoute `count` lignes traitées et publie l’avancement."""
+        self.done += count
+        report_progress(done=self.done, total=self.total)
+
+
+def delete_in_batches(queryset, progress=None, batch_size=None, on_batch=None):
+    """
+    Supprime les lignes d’un queryset par lots bornés.
+
+    Chaque lot est supprimé dans sa propre transaction : la mémoire et
+    la durée des verrous restent proportionnelles à la taille du lot.
+    Reprendre après une interruption supprime simplement le reste.
+
+    Args:
+        queryset: lignes à supprimer.
+        progress (callable): appelé avec le nombre de lignes de chaque lot.
+        batch_size (int): taille des lots (JOBS_DELETE_BATCH_SIZE).
+        on_batch (callable): appelé avec les ids de chaque lot supprimé.
+
+    Returns:
+        int: nombre de lignes supprimées (hors cascades).
+    """
+    batch_size = batch_size or settings.JOBS_DELETE_BATCH_SIZE
+    model = queryset.model
+    deleted = 0
+    while True:
+        ids = list(
+            queryset.order_by("pk").values_list("pk", flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        with transaction.atomic():
+            model.objects.filter(pk__in=ids).delete()
+        deleted += len(ids)
+        if on_batch is not None:
+            on_batch(ids)
+        if progress is not None:
+            progress(len(ids))
+
+
+def release_stale_jobs():
+    """
+    Remet en attente les tâches réservées par un worker disparu.
+
+    Returns:
+        int: nombre de tâches libérées.
+    """
+    limit = timezone.now() - timedelta(seconds=settings.JOBS_LOCK_TIMEOUT)
+    released = 0
+    for job in Job.objects.filter(status=Job.RUNNING, locked_at__lt=limit):
+        # Verrou toujours expiré au moment de la transition : un
+        # avancement publié entre-temps garde la tâche à son worker
+        stale = _owned(job).filter(locked_at__lt=limit)
+        _schedule_retry(job, "Verrou expiré (worker interrompu).", stale)
+        released += 1
+    return released
@@ -0,0 +1,158 @@
+"""
+Tests de la file de tâches en base de données.
+Couvre la publication, l’idempotence, la réservation, les nouvelles
+tentatives avec délai exponentiel et la commande du worker.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from jobs import queue
+from jobs.models import Job
+from jobs.queue import (
+    JobLockLost,
+    claim_next,
+    enqueue,
+    register,
+    release_stale_jobs,
+    report_progress,
+    run_job,
+)
+
+pytestmark = pytest.mark.django_db
+
+CALLS = []
+
+
+@register("tests.record")
+def record(value):
+    """Tâche de test : mémorise sa valeur."""
+    CALLS.append(value)
+
+
+@register("tests.fail")
+def fail():
+    """Tâche de test : échoue systématiquement."""
+    raise RuntimeError("boom")
+
+
+# ---------------------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def deferred_jobs(settings):
+    """Désactive l’exécution immédiate et réinitialise les appels."""
+    settings.JOBS_EAGER = False
+    settings.JOBS_RETRY_BACKOFF = 10
+    CALLS.clear()
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+def test_eager_mode_runs_inline(settings):
+    """En mode eager, la tâche s’exécute sans ligne en base."""
+    settings.JOBS_EAGER = True
+    assert enqueue("tests.record", {"value": 1}) is None
+    assert CALLS == [1]
+    assert not Job.objects.exists()
+
+
+def test_idempotency_key_deduplicates_pending_jobs():
+    """Deux publications de même clé produisent une seule tâche."""
+    first = enqueue("tests.record", {"value": 1}, key="k")
+    second = enqueue("tests.record", {"value": 2}, key="k")
+    assert first.pk == second.pk
+    assert Job.objects.count() == 1
+
+
+def test_claim_and_run_marks_job_done():
+    """Une tâche réservée n’est plus disponible puis passe à DONE."""
+    enqueue("tests.record", {"value": 3})
+    job = claim_next("w1")
+    assert claim_next("w2") is None
+
+    assert run_job(job)
+    job.refresh_from_db()
+    assert job.status == Job.DONE and job.attempts == 1
+    assert CALLS == [3]
+
+
+def test_failure_is_retried_with_backoff_then_failed():
+    """Un échec replanifie la tâche, puis l’abandonne au dernier essai."""
+    job = enqueue("tests.fail", max_attempts=2)
+
+    before = timezone.now()
+    assert not run_job(claim_next("w1"))
+    job.refresh_from_db()
+    assert job.status == Job.PENDING
+    assert (job.run_at - before).total_seconds() >= 10
+    assert "boom" in job.last_error
+
+    Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+    assert not run_job(claim_next("w1"))
+    job.refresh_from_db()
+    assert job.status == Job.FAILED and job.attempts == 2
+
+
+def test_worker_command_drains_queue():
+    """`run_softdesk_worker --once` exécute les tâches dues."""
+    enqueue("tests.record", {"value": 4})
+    enqueue("tests.record", {"value": 5}, delay=3600)
+
+    call_command("run_softdesk_worker", "--once")
+
+    assert CALLS == [4]
+    assert Job.objects.filter(status=Job.PENDING).count() == 1
+
+
+def _expire_lock(job):
+    """Vieillit le verrou d’une tâche au-delà de JOBS_LOCK_TIMEOUT."""
+    Job.objects.filter(pk=job.pk).update(
+        locked_at=timezone.now() - timedelta(hours=1)
+    )
+
+
+@register("tests.progress")
+def progress():
+    """Tâche de test : publie son avancement après un verrou expiré."""
+    _expire_lock(Job.objects.get(status=Job.RUNNING))
+    report_progress(done=1, total=2)
+    CALLS.append(release_stale_jobs())
+
+
+def test_progress_refreshes_lock():
+    """Une tâche longue qui progresse garde son verrou."""
+    job = enqueue("tests.progress")
+    assert run_job(claim_next("w1"))
+
+    job.refresh_from_db()
+    assert CALLS == [0]
+    assert job.status == Job.DONE and job.attempts == 1
+
+
+def test_stale_worker_cannot_overwrite_new_run():
+    """Verrou repris par un autre worker : l’ancien ne change plus rien."""
+    enqueue("tests.record", {"value": 6})
+    first = claim_next("w1")
+    _expire_lock(first)
+    assert release_stale_jobs() == 1
+    Job.objects.filter(pk=first.pk).update(run_at=timezone.now())
+    second = claim_next("w2")
+
+    assert run_job(first)
+    second.refresh_from_db()
+    assert second.status == Job.RUNNING and second.locked_by == "w2"
+
+    token = queue._current_job.set(first)
+    try:
+        with pytest.raises(JobLockLost):
+            report_progress(done=1, total=1)
+    finally:
+        queue._current_job.reset(token)
+
+    assert run_job(second)
+    second.refresh_from_db()
+    assert second.status == Job.DONE
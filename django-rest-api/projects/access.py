@@ -0,0 +1,99 @@
+"""
+Table d’accès matérialisée utilisateur → projets.
+Associe à chaque utilisateur les projets qu’il peut consulter et son rôle
+(`{project_id: permission}`), conservée en cache et invalidée à chaque
+modification d’un Contributor. Les vues et permissions s’y réfèrent au
+lieu de joindre la table des contributeurs à chaque lecture.
+"""
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from projects.models import Contributor
+
+ACCESS_CACHE_TIMEOUT = 3600
+
+# Attribut de requête mémorisant la table pendant une même requête
+_REQUEST_ATTR = "_project_access"
+
+
+def access_cache_key(user_id) -> str:
+    """Clé de cache de la table d’accès d’un utilisateur."""
+    return f"user_access_{user_id}"
+
+
+def _access_rows(user_id):
+    """
+    Couples (projet, permission) des projets visibles, non supprimés.
+
+    Lus sur la base principale : la table reste en cache une heure, elle
+    ne doit pas être reconstruite depuis un réplica en retard.
+    """
+    return (
+        Contributor.objects.using(DEFAULT_DB_ALIAS)
+        .filter(user_id=user_id, project__deletion_pending=False)
+        .values_list("project_id", "permission")
+    )
+
+
+def get_project_access(user, request=None) -> dict:
+    """
+    Renvoie `{project_id: permission}` pour un utilisateur.
+
+    Lecture par ordre de priorité : mémoire de la requête, cache, puis
+    une seule requête servie par l’index unique (user, project).
+
+    Args:
+        user: utilisateur authentifié.
+        request: requête courante, utilisée comme mémoire locale.
+    """
+    if request is not None and hasattr(request, _REQUEST_ATTR):
+        return getattr(request, _REQUEST_ATTR)
+
+    key = access_cache_key(user.id)
+    access = cache.get(key)
+    if access is None:
+        access = dict(_access_rows(user.id))
+        cache.set(key, access, timeout=ACCESS_CACHE_TIMEOUT)
+
+    if request is not None:
+        setattr(request, _REQUEST_ATTR, access)
+    return access
+
+
+async def aget_project_access(user, request=None) -> dict:
+    """Variante asynchrone de `get_project_access` (vues ASGI)."""
+    if request is not None and hasattr(request, _REQUEST_ATTR):
+        return getattr(request, _REQUEST_ATTR)
+
+    key = access_cache_key(user.id)
+    access = await cache.aget(key)
+    if access is None:
+        access = {pid: perm async for pid, perm in _access_rows(user.id)}
+        await cache.aset(key, access, timeout=ACCESS_CACHE_TIMEOUT)
+
+    if request is not None:
+        setattr(request, _REQUEST_ATTR, access)
+    return access
+
+
+def accessible_project_ids(user, request=None) -> list:
+    """Renvoie la liste triée des projets visibles par l’utilisateur."""
+    return sorted(get_project_access(user, request))
+
+
+def has_project_access(request, project_id) -> bool:
+    """Indique si l’utilisateur de la requête contribue au projet."""
+    return project_id in get_project_access(request.user, request)
+
+
+def invalidate_project_access(user_id) -> None:
+    """
+    Invalide la table d’accès d’un utilisateur.
+
+    La clé est supprimée immédiatement, puis de nouveau après le commit :
+    une lecture concurrente ayant recalculé la table avant la fin de la
+    transaction ne peut ainsi pas laisser en cache un état périmé.
+    """
+    key = access_cache_key(user_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
@@ -0,0 +1,43 @@
+"""
+Indicateurs d’activité des issues calculés en base.
+Sous-requêtes corrélées servies par l’index `comment_issue_created_idx` :
+aucune requête par ligne, quel que soit le nombre d’issues listées.
+"""
+
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from projects.models import Comment
+
+ACTIVITY_FIELDS = ("comments_count", "last_comment_time")
+
+
+def _issue_comments():
+    """Commentaires de l’issue de la ligne courante, sans tri implicite."""
+    return Comment.objects.filter(issue=OuterRef("pk")).order_by()
+
+
+def comments_count():
+    """Nombre de commentaires de l’issue (0 si aucun)."""
+    counts = (
+        _issue_comments()
+        .values("issue")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def latest_comment_time():
+    """Date du dernier commentaire de l’issue, ou None."""
+    return Subquery(
+        _issue_comments().order_by("-created_time").values("created_time")[:1]
+    )
+
+
+def annotate_activity(queryset, fields=ACTIVITY_FIELDS):
+    """Ajoute à un queryset d’issues les indicateurs demandés."""
+    expressions = {
+        "comments_count": comments_count,
+        "last_comment_time": latest_comment_time,
+    }
+    return queryset.annotate(**{name: expressions[name]() for name in fields})
@@ -1,12 +1,13 @@
 """
 Configuration de l’interface d’administration Django pour le module projects.
 Définit l’affichage, les filtres et les champs en lecture seule
-pour les modèles Project, Contributor, Issue et Comment.
+pour les modèles Project, Contributor, Issue, Comment et Tombstone.
 """
 
 from django.contrib import admin
 
-from .models import Comment, Contributor, Issue, Project
+from .models import Comment, Contributor, Issue, Project, Tombstone
+from .search import filter_matching
 
 
 @admin.register(Project)
@@ -48,6 +49,12 @@ class IssueAdmin(admin.ModelAdmin):
     ordering = ("-created_time",)
     readonly_fields = ("created_time",)
 
+    def get_search_results(self, request, queryset, search_term):
+        """Recherche via l’index plein texte plutôt que par LIKE."""
+        if not search_term:
+            return queryset, False
+        return filter_matching(queryset, search_term, "issue"), False
+
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
@@ -57,3 +64,19 @@ class CommentAdmin(admin.ModelAdmin):
     search_fields = ("description",)
     ordering = ("-created_time",)
     readonly_fields = ("created_time",)
+
+    def get_search_results(self, request, queryset, search_term):
+        """Recherche via l’index plein texte plutôt que par LIKE."""
+        if not search_term:
+            return queryset, False
+        return filter_matching(queryset, search_term, "comment"), False
+
+
+@admin.register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):
+    """Configuration d’affichage des traces de suppression."""
+
+    list_display = ("id", "kind", "object_id", "project_id", "deleted_time")
+    list_filter = ("kind",)
+    ordering = ("-deleted_time",)
+    readonly_fields = ("deleted_time",)
@@ -0,0 +1,283 @@
+"""
+Vues asynchrones (ASGI) en lecture seule pour les projets, issues et
+commentaires.
+Servies par `config.asgi`, elles utilisent l’ORM et le cache asynchrones
+de Django : un même worker traite de nombreuses connexions lentes sans
+mobiliser un thread par requête. Les réponses reprennent les serializers
+et la pagination des vues synchrones.
+"""
+
+import hashlib
+from functools import wraps
+from math import ceil
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, JsonResponse
+from oauth2_provider.models import AccessToken
+from projects.access import accessible_project_ids, aget_project_access
+from projects.filters import IssueFilter
+from projects.models import Comment, Issue, Project
+from projects.serializers import (
+    CommentDetailSerializer,
+    CommentListSerializer,
+    IssueDetailSerializer,
+    IssueListSerializer,
+    ProjectDetailSerializer,
+    ProjectListSerializer,
+)
+from projects.throttles import AsyncUserRateThrottle
+from rest_framework.exceptions import Throttled, ValidationError
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+# ---------------------------------------------------------------------
+# OUTILS
+# ---------------------------------------------------------------------
+def _json(data, status=200):
+    """Réponse JSON (UTF-8 non échappé, comme le JSONRenderer de DRF)."""
+    return JsonResponse(
+        data,
+        status=status,
+        safe=False,
+        encoder=DjangoJSONEncoder,
+        json_dumps_params={"ensure_ascii": False},
+    )
+
+
+async def aauthenticate(request):
+    """
+    Authentifie la requête sans thread par jeton OAuth2 `Bearer`, seul
+    mode accepté par l’API DRF (aucune session).
+
+    Returns:
+        User | None: utilisateur actif authentifié.
+    """
+    header = request.headers.get("Authorization", "")
+    if not header.startswith("Bearer "):
+        return None
+    checksum = hashlib.sha256(header[7:].strip().encode()).hexdigest()
+    token = (
+        await AccessToken.objects.select_related("user")
+        .filter(token_checksum=checksum)
+        .afirst()
+    )
+    if token is None or not token.is_valid():
+        return None
+    user = token.user
+    if not user.is_active:
+        return None
+    return user
+
+
+def async_api_view(view):
+    """
+    Décorateur des vues asynchrones : authentification, quota
+    utilisateur, table d’accès et conversion des erreurs en réponses
+    JSON (400 / 401 / 404 / 429).
+    """
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method != "GET":
+            return _json({"detail": "Méthode non autorisée."}, status=405)
+
+        user = await aauthenticate(request)
+        if user is None:
+            return _json(
+                {"detail": ("Informations d'authentification non fournies.")},
+                status=401,
+            )
+        request.user = user
+        throttle = AsyncUserRateThrottle()
+        if not await throttle.aallow_request(request):
+            wait = throttle.wait()
+            response = _json({"detail": Throttled(wait).detail}, status=429)
+            if wait is not None:
+                response["Retry-After"] = str(ceil(wait))
+            return response
+        # Table d’accès préchargée : les serializers la relisent en mémoire
+        await aget_project_access(user, request)
+
+        try:
+            return await view(request, *args, **kwargs)
+        except ValidationError as exc:
+            return _json(exc.detail, status=400)
+        except Http404:
+            return _json({"detail": "Pas trouvé."}, status=404)
+
+    return wrapper
+
+
+def _visible(queryset, request, project_path):
+    """Restreint un queryset aux projets accessibles et non supprimés."""
+    if request.user.is_superuser:
+        return queryset.filter(**{f"{project_path}deletion_pending": False})
+    return queryset.filter(
+        **{
+            f"{project_path}id__in": accessible_project_ids(
+                request.user, request
+            )
+        }
+    )
+
+
+async def _paginate(request, queryset, serializer_class):
+    """Pagination par numéro de page, au format de PageNumberPagination."""
+    try:
+        page = int(request.GET.get("page", 1))
+    except ValueError:
+        page = 0
+    if page < 1:
+        raise Http404
+
+    size = settings.REST_FRAMEWORK["PAGE_SIZE"]
+    count = await queryset.acount()
+    if page > 1 and (page - 1) * size >= count:
+        raise Http404
+
+    start = (page - 1) * size
+    objects = []
+    if count:  # résultat vide : le comptage suffit
+        objects = [
+            obj
+            async for obj in queryset[start : start + size].aiterator(
+                chunk_size=size
+            )
+        ]
+    url = request.build_absolute_uri()
+    next_url = (
+        replace_query_param(url, "page", page + 1)
+        if start + size < count
+        else None
+    )
+    previous_url = None
+    if page == 2:
+        previous_url = remove_query_param(url, "page")
+    elif page > 2:
+        previous_url = replace_query_param(url, "page", page - 1)
+
+    context = {"request": request}
+    return {
+        "count": count,
+        "next": next_url,
+        "previous": previous_url,
+        "results": serializer_class(objects, many=True, context=context).data,
+    }
+
+
+async def _retrieve(request, queryset, pk, serializer_class):
+    """Charge un objet visible (404 sinon) et le sérialise."""
+    try:
+        obj = await queryset.aget(pk=pk)
+    except queryset.model.DoesNotExist:
+        raise Http404
+    return serializer_class(obj, context={"request": request}).data
+
+
+# ---------------------------------------------------------------------
+# PROJETS
+# ---------------------------------------------------------------------
+@async_api_view
+async def project_list(request):
+    """Liste paginée des projets accessibles."""
+    if not accessible_project_ids(request.user, request):
+        return _json(
+            {
+                "detail": (
+                    "Vous n'avez encore aucun projet, "
+                    "mais vous pouvez en créer un ci-dessous."
+                )
+            }
+        )
+    queryset = _visible(
+        Project.objects.select_related("author_user"), request, ""
+    ).order_by("-created_time", "-id")
+    return _json(await _paginate(request, queryset, ProjectListSerializer))
+
+
+@async_api_view
+async def project_detail(request, pk):
+    """Détail d’un projet accessible, avec ses contributeurs."""
+    queryset = _visible(
+        Project.objects.select_related("author_user").prefetch_related(
+            "contributors__user"
+        ),
+        request,
+        "",
+    )
+    return _json(
+        await _retrieve(request, queryset, pk, ProjectDetailSerializer)
+    )
+
+
+# ---------------------------------------------------------------------
+# ISSUES
+# ---------------------------------------------------------------------
+def _issue_queryset(request):
+    """Issues visibles avec les relations lues par les serializers."""
+    return _visible(
+        Issue.objects.select_related(
+            "project", "author_user", "assignee_contributor__user"
+        ),
+        request,
+        "project__",
+    )
+
+
+@async_api_view
+async def issue_list(request):
+    """Liste paginée des issues, avec les filtres de la vue synchrone."""
+    if not accessible_project_ids(request.user, request):
+        return _json(
+            {"detail": "Accès refusé : aucun projet associé."}, status=403
+        )
+    issue_filter = IssueFilter(request.GET)
+    queryset = issue_filter.filter_queryset(_issue_queryset(request))
+    return _json(await _paginate(request, queryset, IssueListSerializer))
+
+
+@async_api_view
+async def issue_detail(request, pk):
+    """Détail d’une issue accessible."""
+    return _json(
+        await _retrieve(
+            request, _issue_queryset(request), pk, IssueDetailSerializer
+        )
+    )
+
+
+# ---------------------------------------------------------------------
+# COMMENTAIRES
+# ---------------------------------------------------------------------
+def _comment_queryset(request):
+    """Commentaires visibles avec l’issue et l’auteur préchargés."""
+    return _visible(
+        Comment.objects.select_related("issue", "author_user"),
+        request,
+        "issue__project__",
+    )
+
+
+@async_api_view
+async def comment_list(request):
+    """Liste paginée des commentaires accessibles."""
+    if not accessible_project_ids(request.user, request):
+        return _json(
+            {"detail": "Accès refusé : aucun projet associé."}, status=403
+        )
+    queryset = _comment_queryset(request).order_by("-created_time", "-id")
+    data = await _paginate(request, queryset, CommentListSerializer)
+    if data["count"] == 0:  # enveloppe conservée, message en plus
+        data["detail"] = "Aucun commentaire trouvé."
+    return _json(data)
+
+
+@async_api_view
+async def comment_detail(request, pk):
+    """Détail d’un commentaire accessible."""
+    return _json(
+        await _retrieve(
+            request, _comment_queryset(request), pk, CommentDetailSerializer
+        )
+    )
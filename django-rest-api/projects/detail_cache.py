@@ -0,0 +1,202 @@
+"""
+Cache des réponses de détail (projets, issues, commentaires).
+Chaque objet possède un numéro de version en cache, incrémenté à chaque
+écriture (signaux) : la réponse sérialisée est rangée sous
+`detail_<type>_<id>_v<version>`, et les anciennes versions deviennent
+inaccessibles sans balayage. Une entrée mémorise aussi la version des
+objets parents dont elle recopie des champs (titre du projet, de l’issue).
+"""
+
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from projects.access import get_project_access
+from rest_framework.response import Response
+from utils.cache_tools import build_cache_key
+from utils.db_routers import primary_reads
+from utils.urls import absolute_prefix
+
+DETAIL_CACHE_TIMEOUT = 600
+
+# Parent dont chaque type recopie des champs : (type, attribut d’id)
+DETAIL_DEPENDENCIES = {
+    "project": None,
+    "issue": ("project", "project_id"),
+    "comment": ("issue", "issue_id"),
+}
+
+
+# ---------------------------------------------------------------------
+# VERSIONS
+# ---------------------------------------------------------------------
+def version_key(kind, object_id):
+    """Clé du numéro de version d’un objet."""
+    return f"detail_version_{kind}_{object_id}"
+
+
+def _new_version():
+    """
+    Version initiale dérivée de l’horloge : une clé de version évincée
+    puis recréée ne retombe jamais sur une ancienne entrée.
+    """
+    return time.time_ns() // 1000
+
+
+def get_version(kind, object_id):
+    """Renvoie la version courante d’un objet (créée au besoin)."""
+    key = version_key(kind, object_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def _incr_version(kind, object_id):
+    """Incrémente la version d’un objet (créée au besoin)."""
+    try:
+        cache.incr(version_key(kind, object_id))
+    except ValueError:
+        cache.set(version_key(kind, object_id), _new_version(), timeout=None)
+
+
+def bump_version(kind, object_id):
+    """
+    Invalide toutes les réponses en cache d’un objet.
+
+    La version est incrémentée immédiatement, puis de nouveau après le
+    commit : une lecture concurrente ayant rangé l’état d’avant le commit
+    sous la version intermédiaire ne peut ainsi pas être servie.
+    """
+    _incr_version(kind, object_id)
+    transaction.on_commit(lambda: _incr_version(kind, object_id))
+
+
+def evict(kind, object_id):
+    """
+    Oublie la version d’un objet supprimé.
+
+    Ses réponses deviennent inaccessibles (leur clé contient la version)
+    et expirent d’elles-mêmes : aucun balayage par motif.
+    """
+    cache.delete(version_key(kind, object_id))
+
+
+def evict_many(kind, object_ids):
+    """Oublie en une requête les versions d’un lot d’objets supprimés."""
+    cache.delete_many([version_key(kind, pk) for pk in object_ids])
+
+
+# ---------------------------------------------------------------------
+# ENTRÉES
+# ---------------------------------------------------------------------
+def _project_id(kind, instance):
+    """Projet de rattachement d’un objet (contrôle d’accès)."""
+    if kind == "project":
+        return instance.pk
+    if kind == "issue":
+        return instance.project_id
+    return instance.issue.project_id
+
+
+class DetailCacheMixin:
+    """
+    Sert `retrieve` depuis le cache et y écrit après chaque écriture.
+
+    - `retrieve` : réponse en cache si l’utilisateur a accès au projet
+      (table d’accès en cache), sinon chemin standard (404 / 403) ;
+    - `cache_detail(serializer)` : à appeler après `serializer.save()`
+      dans `perform_create` / `perform_update` (écriture immédiate) ;
+    - les signaux de `projects.signals` incrémentent les versions et
+      évincent les objets supprimés.
+
+    `detail_cache_kind` : "project", "issue" ou "comment".
+    """
+
+    detail_cache_kind = None
+
+    def _detail_cache_key(self, object_id, version):
+        """Clé d’une réponse : version, sélection de champs et hôte."""
+        return build_cache_key(
+            f"detail_{self.detail_cache_kind}_{object_id}_v{version}",
+            {
+                **self.get_sparse_cache_params(),
+                "host": absolute_prefix(self.request),
+            },
+        )
+
+    def _dependency(self, instance):
+        """Clé de version du parent et sa valeur courante, ou None."""
+        dependency = DETAIL_DEPENDENCIES[self.detail_cache_kind]
+        if dependency is None:
+            return None
+        parent_kind, attribute = dependency
+        parent_id = getattr(instance, attribute)
+        return (
+            version_key(parent_kind, parent_id),
+            get_version(parent_kind, parent_id),
+        )
+
+    def cache_detail(self, serializer, version=None):
+        """
+        Range la réponse sérialisée d’un objet sous sa version.
+
+        `version` : version lue avant le chargement de l’objet (lecture),
+        sinon version courante (après une écriture). L’entrée n’est
+        qu’ajoutée, puis retirée si la version a changé entre-temps : un
+        état lu avant un commit concurrent n’est jamais servi.
+        """
+        instance = serializer.instance
+        kind = self.detail_cache_kind
+        if version is None:
+            version = get_version(kind, instance.pk)
+        key = self._detail_cache_key(instance.pk, version)
+        entry = {
+            "project_id": _project_id(kind, instance),
+            "dependency": self._dependency(instance),
+            "data": serializer.data,
+        }
+        if (
+            cache.add(key, entry, timeout=DETAIL_CACHE_TIMEOUT)
+            and cache.get(version_key(kind, instance.pk)) != version
+        ):
+            cache.delete(key)
+
+    def _cached_detail(self, object_id, version):
+        """Renvoie l’entrée en cache encore valide d’un objet, ou None."""
+        entry = cache.get(self._detail_cache_key(object_id, version))
+        if entry is None:
+            return None
+        dependency = entry["dependency"]
+        if (
+            dependency is not None
+            and cache.get(dependency[0]) != dependency[1]
+        ):
+            return None
+        return entry
+
+    def retrieve(self, request, *args, **kwargs):
+        """Détail servi par le cache, ou calculé puis mis en cache."""
+        object_id = self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        version = None
+        if str(object_id).isdigit():
+            # Version lue avant le chargement de l’objet (cf. cache_detail)
+            version = get_version(self.detail_cache_kind, int(object_id))
+            entry = self._cached_detail(int(object_id), version)
+            if entry is not None and entry["project_id"] in (
+                get_project_access(request.user, request)
+            ):
+                return Response(entry["data"])
+
+        # Entrée partagée par tous les lecteurs : lue sur la base principale
+        with primary_reads():
+            instance = self.get_object()
+            serializer = self.get_serializer(instance)
+            self.cache_detail(serializer, version)
+        return Response(serializer.data)
+
+    def perform_update(self, serializer):
+        """Enregistre puis met à jour la réponse en cache."""
+        serializer.save()
+        self.cache_detail(serializer)
@@ -0,0 +1,213 @@
+"""
+Filtres déclaratifs et tri des listes d’issues.
+Traduisent les paramètres de requête (`?status=`, `?priority=`…) en
+filtres ORM validés, servis par les index composites du modèle Issue.
+"""
+
+from datetime import datetime
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from drf_spectacular.utils import OpenApiParameter
+from projects.models import Issue
+from rest_framework.exceptions import ValidationError
+
+
+def _split(raw):
+    """Découpe une valeur multiple (`a,b`) en liste sans doublons."""
+    return sorted({v.strip() for v in raw.split(",") if v.strip()})
+
+
+def _parse_moment(raw, end_of_day=False):
+    """Convertit une date ou une date-heure ISO 8601 en datetime aware."""
+    moment = parse_datetime(raw)
+    if moment is None:
+        day = parse_date(raw)
+        if day is None:
+            return None
+        moment = datetime.combine(
+            day, datetime.max.time() if end_of_day else datetime.min.time()
+        )
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+class IssueFilter:
+    """
+    Filtres et tris autorisés sur la liste des issues.
+
+    - `choice_filters` : champs à valeurs fixes, valeurs multiples
+      séparées par des virgules (`?status=TODO,IN_PROGRESS`) ;
+    - `id_filters` : clés étrangères filtrées par identifiant ;
+    - `range_filters` : bornes de dates (`?created_after=2025-01-01`) ;
+    - `ordering_fields` : tris autorisés (`?ordering=-created_time`).
+
+    Chaque combinaison courante (projet + statut / priorité / tag,
+    assigné + statut, auteur + date) dispose d’un index dans Issue.Meta.
+    """
+
+    choice_filters = {
+        "status": Issue.STATUS_CHOICES,
+        "priority": Issue.PRIORITY_CHOICES,
+        "tag": Issue.TAG_CHOICES,
+    }
+    id_filters = {
+        "project": "project_id",
+        "assignee_contributor": "assignee_contributor_id",
+        "author_user": "author_user_id",
+    }
+    range_filters = {
+        "created_after": "created_time__gte",
+        "created_before": "created_time__lte",
+    }
+    ordering_fields = ("created_time", "updated_time", "title", "id")
+    default_ordering = ("-created_time", "-id")
+
+    def __init__(self, query_params):
+        """Valide les paramètres et prépare les filtres normalisés."""
+        self.params = {}
+        errors = {}
+        for parse in (
+            self._parse_choices,
+            self._parse_ids,
+            self._parse_ranges,
+            self._parse_ordering,
+        ):
+            errors.update(parse(query_params))
+        if errors:
+            raise ValidationError(errors)
+
+    def _parse_choices(self, query_params):
+        """Valide les filtres à valeurs fixes."""
+        errors = {}
+        for name, choices in self.choice_filters.items():
+            if name not in query_params:
+                continue
+            values = _split(query_params[name])
+            allowed = {value for value, _ in choices}
+            if not values or set(values) - allowed:
+                errors[name] = (
+                    f"Valeurs autorisées : {', '.join(sorted(allowed))}."
+                )
+            else:
+                self.params[name] = values
+        return errors
+
+    def _parse_ids(self, query_params):
+        """Valide les filtres par identifiant de clé étrangère."""
+        errors = {}
+        for name in self.id_filters:
+            if name not in query_params:
+                continue
+            values = _split(query_params[name])
+            if not values or not all(v.isdigit() for v in values):
+                errors[name] = "Identifiant(s) numérique(s) attendu(s)."
+            else:
+                self.params[name] = sorted(int(v) for v in values)
+        return errors
+
+    def _parse_ranges(self, query_params):
+        """Valide les bornes de dates."""
+        errors = {}
+        for name in self.range_filters:
+            raw = query_params.get(name)
+            if not raw:
+                continue
+            moment = _parse_moment(raw, end_of_day=name == "created_before")
+            if moment is None:
+                errors[name] = "Date ISO 8601 attendue."
+            else:
+                self.params[name] = moment.isoformat()
+        return errors
+
+    def _parse_ordering(self, query_params):
+        """Valide le tri demandé par rapport à la liste blanche."""
+        raw = query_params.get("ordering")
+        if not raw:
+            return {}
+        terms = [t.strip() for t in raw.split(",") if t.strip()]
+        if any(t.lstrip("-") not in self.ordering_fields for t in terms):
+            return {
+                "ordering": (
+                    "Tris autorisés : "
+                    f"{', '.join(self.ordering_fields)} (préfixe - possible)."
+                )
+            }
+        self.params["ordering"] = terms
+        return {}
+
+    @property
+    def project_id(self):
+        """Projet unique filtré, s’il y en a un (clé de cache lisible)."""
+        projects = self.params.get("project", [])
+        return projects[0] if len(projects) == 1 else None
+
+    def cache_params(self):
+        """
+        Paramètres normalisés, indépendants de l’ordre de saisie.
+
+        Le projet unique figure déjà dans le préfixe de la clé ; seul
+        l’ordre des critères de tri reste significatif.
+        """
+        params = dict(self.params)
+        if self.project_id is not None:
+            del params["project"]
+        if "ordering" in params:
+            params["ordering"] = "|".join(params["ordering"])
+        return params
+
+    def filter_queryset(self, queryset):
+        """Applique les filtres et le tri au queryset."""
+        filters = {}
+        for name in self.choice_filters:
+            if name in self.params:
+                filters[f"{name}__in"] = self.params[name]
+        for name, column in self.id_filters.items():
+            if name in self.params:
+                filters[f"{column}__in"] = self.params[name]
+        for name, lookup in self.range_filters.items():
+            if name in self.params:
+                filters[lookup] = self.params[name]
+
+        ordering = list(self.params.get("ordering", self.default_ordering))
+        # Départage stable pour la pagination
+        if not any(t.lstrip("-") == "id" for t in ordering):
+            ordering.append("-id")
+        return queryset.filter(**filters).order_by(*ordering)
+
+    @classmethod
+    def schema_parameters(cls):
+        """Paramètres exposés dans la documentation OpenAPI."""
+        parameters = [
+            OpenApiParameter(
+                name,
+                str,
+                description=(
+                    "Une ou plusieurs valeurs séparées par des virgules : "
+                    f"{', '.join(value for value, _ in choices)}."
+                ),
+            )
+            for name, choices in cls.choice_filters.items()
+        ]
+        parameters += [
+            OpenApiParameter(
+                name, str, description="Identifiant(s), séparés par virgule."
+            )
+            for name in cls.id_filters
+        ]
+        parameters += [
+            OpenApiParameter(name, str, description="Date ISO 8601.")
+            for name in cls.range_filters
+        ]
+        parameters.append(
+            OpenApiParameter(
+                "ordering",
+                str,
+                description=(
+                    f"Tri parmi {', '.join(cls.ordering_fields)} "
+                    "(préfixe - pour décroissant)."
+                ),
+            )
+        )
+        return parameters
@@ -0,0 +1,108 @@
+"""
+Commande `bench_db_pool` : mesure du coût d’obtention des connexions.
+Des threads simulent des requêtes HTTP courtes (une lecture, puis fin de
+requête) afin de comparer une configuration sans pool (`DB_POOL=False`)
+et avec pool psycopg (`DB_POOL=True`) sur un PostgreSQL local.
+"""
+
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection, connections
+from projects.models import Issue
+from utils.db_pool import pool_stats
+
+
+class Command(BaseCommand):
+    """Compare le débit de requêtes avec et sans pool de connexions."""
+
+    help = (
+        "Simule des requêtes concurrentes courtes et affiche débit, "
+        "latences et attente du pool (lancer avec DB_POOL=0 puis 1)."
+    )
+
+    def add_arguments(self, parser):
+        """Déclare les options de la commande."""
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=20,
+            help="Nombre de requêtes simultanées.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=200,
+            help="Requêtes simulées par thread.",
+        )
+
+    def _worker(self, iterations, latencies, errors):
+        """Enchaîne lecture puis fin de requête, comme un worker WSGI."""
+        try:
+            for _ in range(iterations):
+                start = time.perf_counter()
+                try:
+                    list(
+                        Issue.objects.order_by("-id").values_list(
+                            "id", flat=True
+                        )[:10]
+                    )
+                except Exception as exc:
+                    errors.append(f"{type(exc).__name__}: {exc}")
+                finally:
+                    # Fin de requête : rend (ou ferme) la connexion
+                    close_old_connections()
+                latencies.append(time.perf_counter() - start)
+        finally:
+            connections.close_all()
+
+    def handle(self, *args, **options):
+        """Lance les threads puis affiche les mesures."""
+        if options["threads"] < 1 or options["iterations"] < 1:
+            raise CommandError("--threads et --iterations doivent être ≥ 1.")
+
+        pooled = bool(connection.settings_dict["OPTIONS"].get("pool"))
+        self.stdout.write(
+            f"Base {connection.vendor}, pool "
+            f"{'activé' if pooled else 'désactivé'}, "
+            f"CONN_MAX_AGE={connection.settings_dict['CONN_MAX_AGE']}."
+        )
+        pool_stats(reset=True)
+
+        latencies, errors = [], []
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(options["iterations"], latencies, errors),
+            )
+            for _ in range(options["threads"])
+        ]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        latencies.sort()
+        self.stdout.write(
+            f"{len(latencies)} requête(s) en {elapsed:.2f}s "
+            f"({len(latencies) / elapsed:.1f} req/s) ; latence (ms) : "
+            f"moyenne {statistics.mean(latencies) * 1000:.2f}, "
+            f"max {latencies[-1] * 1000:.2f}."
+        )
+        for alias, values in pool_stats().items():
+            self.stdout.write(
+                f"Pool {alias} : {values['requests_num']} connexion(s) "
+                f"prêtée(s), {values['connections_num']} ouverte(s), "
+                f"attente moyenne {values['avg_wait_ms']:.2f} ms, "
+                f"{values['requests_errors']} erreur(s) d’attente."
+            )
+        if errors:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{len(errors)} erreur(s), ex. : {errors[0]}"
+                )
+            )
@@ -0,0 +1,180 @@
+"""
+Commande `bench_http` : générateur de charge HTTP minimal (asyncio).
+Ouvre `--concurrency` connexions persistantes vers une URL et mesure le
+débit et les latences, afin de comparer un même endpoint servi en WSGI
+(gunicorn) et en ASGI (uvicorn) à forte concurrence.
+"""
+
+import asyncio
+import statistics
+import time
+from collections import Counter
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+async def _read_response(reader):
+    """Lit une réponse HTTP/1.1 ; renvoie (statut, connexion réutilisable)."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+
+    if "content-length" in headers:
+        await reader.readexactly(int(headers["content-length"]))
+        keep_alive = headers.get("connection", "").lower() != "close"
+    else:
+        # Corps délimité par la fermeture de la connexion
+        await reader.read()
+        keep_alive = False
+    return status, keep_alive
+
+
+class _Bench:
+    """État partagé d’un tir : requêtes restantes et mesures."""
+
+    def __init__(self, url, total, token, timeout):
+        """Prépare la requête brute envoyée sur chaque connexion."""
+        parts = urlsplit(url)
+        if parts.scheme != "http" or not parts.hostname:
+            raise CommandError(
+                "Seules les URL http://hôte[:port]/… sont prises en charge."
+            )
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        request = [
+            f"GET {path} HTTP/1.1",
+            f"Host: {parts.netloc}",
+            "Accept: application/json",
+            "Connection: keep-alive",
+        ]
+        if token:
+            request.append(f"Authorization: Bearer {token}")
+        self.request = ("\r\n".join(request) + "\r\n\r\n").encode()
+        self.remaining = total
+        self.timeout = timeout
+        self.latencies = []
+        self.statuses = Counter()
+        self.errors = Counter()
+
+    async def connection(self):
+        """Enchaîne les requêtes sur une connexion persistante."""
+        reader = writer = None
+        while self.remaining > 0:
+            self.remaining -= 1
+            start = time.perf_counter()
+            try:
+                if writer is None:
+                    reader, writer = await asyncio.open_connection(
+                        self.host, self.port
+                    )
+                writer.write(self.request)
+                status, keep_alive = await asyncio.wait_for(
+                    _read_response(reader), self.timeout
+                )
+            except (OSError, asyncio.TimeoutError, ValueError) as exc:
+                self.errors[type(exc).__name__] += 1
+                keep_alive = False
+            else:
+                self.latencies.append(time.perf_counter() - start)
+                self.statuses[status] += 1
+            if not keep_alive and writer is not None:
+                writer.close()
+                reader = writer = None
+        if writer is not None:
+            writer.close()
+
+    async def run(self, concurrency):
+        """Lance les connexions concurrentes ; renvoie la durée totale."""
+        start = time.perf_counter()
+        await asyncio.gather(*(self.connection() for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+
+def _percentile(values, ratio):
+    """Percentile (méthode du rang le plus proche) d’une liste triée."""
+    index = max(int(round(ratio * len(values))) - 1, 0)
+    return values[min(index, len(values) - 1)]
+
+
+class Command(BaseCommand):
+    """Mesure le débit d’un endpoint HTTP sous forte concurrence."""
+
+    help = (
+        "Génère une charge HTTP concurrente (ex. comparer gunicorn WSGI "
+        "et uvicorn ASGI sur /api/async/issues/)."
+    )
+
+    def add_arguments(self, parser):
+        """Déclare les options de la commande."""
+        parser.add_argument("--url", required=True, help="URL ciblée.")
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=100,
+            help="Nombre de connexions simultanées.",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=2000,
+            help="Nombre total de requêtes.",
+        )
+        parser.add_argument(
+            "--token", default="", help="Jeton OAuth2 (en-tête Bearer)."
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30.0,
+            help="Délai maximal (s) d’une réponse.",
+        )
+
+    def handle(self, *args, **options):
+        """Exécute le tir puis affiche débit et latences."""
+        if options["concurrency"] < 1 or options["requests"] < 1:
+            raise CommandError("--concurrency et --requests doivent être ≥ 1.")
+
+        bench = _Bench(
+            options["url"],
+            options["requests"],
+            options["token"],
+            options["timeout"],
+        )
+        elapsed = asyncio.run(bench.run(options["concurrency"]))
+
+        done = len(bench.latencies)
+        self.stdout.write(
+            f"{done} réponse(s) en {elapsed:.2f}s "
+            f"({done / elapsed:.1f} req/s, "
+            f"concurrence {options['concurrency']})."
+        )
+        if done:
+            latencies = sorted(bench.latencies)
+            self.stdout.write(
+                "Latence (ms) : "
+                f"moyenne {statistics.mean(latencies) * 1000:.1f}, "
+                f"p50 {_percentile(latencies, 0.50) * 1000:.1f}, "
+                f"p95 {_percentile(latencies, 0.95) * 1000:.1f}, "
+                f"p99 {_percentile(latencies, 0.99) * 1000:.1f}."
+            )
+        statuses = ", ".join(
+            f"{code}: {count}"
+            for code, count in sorted(bench.statuses.items())
+        )
+        self.stdout.write(f"Statuts : {statuses or 'aucun'}.")
+        if bench.errors:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Erreurs : "
+                    + ", ".join(f"{k}: {v}" for k, v in bench.errors.items())
+                )
+            )
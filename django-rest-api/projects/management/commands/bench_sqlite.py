@@ -0,0 +1,138 @@
+"""
+Commande `bench_sqlite` : lectures et écritures concurrentes sur SQLite.
+Des processus lecteurs et écrivains (comme des workers gunicorn)
+sollicitent un fichier temporaire, d’abord avec la configuration par
+défaut, puis avec le profil `SQLITE_PRAGMAS` (WAL, mmap…).
+"""
+
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+_ROWS = 10000
+
+
+def _prepare(path):
+    """Crée la table de test et ses lignes initiales."""
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE item (id INTEGER PRIMARY KEY, project INTEGER, "
+            "title TEXT)"
+        )
+        conn.execute("CREATE INDEX item_project ON item (project)")
+        conn.executemany(
+            "INSERT INTO item (project, title) VALUES (?, ?)",
+            ((i % 100, f"item {i}") for i in range(_ROWS)),
+        )
+    conn.close()
+
+
+def _run(path, pragmas, role, duration):
+    """
+    Boucle d’un processus lecteur ou écrivain.
+
+    Returns:
+        tuple: (opérations réussies, erreurs « database is locked »).
+    """
+    conn = sqlite3.connect(path, timeout=5, isolation_level=None)
+    for pragma in pragmas:
+        conn.execute(pragma)
+    begin = "BEGIN IMMEDIATE" if pragmas else "BEGIN"
+    ops = errors = 0
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        try:
+            if role == "read":
+                conn.execute(
+                    "SELECT id, title FROM item WHERE project = ?",
+                    (random.randrange(100),),
+                ).fetchall()
+            else:
+                conn.execute(begin)
+                conn.execute(
+                    "INSERT INTO item (project, title) VALUES (?, ?)",
+                    (random.randrange(100), "écriture"),
+                )
+                conn.execute("COMMIT")
+            ops += 1
+        except sqlite3.OperationalError:
+            errors += 1
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+    conn.close()
+    return ops, errors
+
+
+class Command(BaseCommand):
+    """Compare le profil SQLite par défaut et le profil optimisé."""
+
+    help = (
+        "Mesure le débit de lectures / écritures concurrentes sur SQLite, "
+        "sans puis avec SQLITE_PRAGMAS."
+    )
+
+    def add_arguments(self, parser):
+        """Déclare les options de la commande."""
+        parser.add_argument(
+            "--readers", type=int, default=4, help="Processus lecteurs."
+        )
+        parser.add_argument(
+            "--writers", type=int, default=2, help="Processus écrivains."
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=5.0,
+            help="Durée (s) de chaque mesure.",
+        )
+
+    def _measure(self, pragmas, options):
+        """Exécute une mesure sur une base neuve ; renvoie les totaux."""
+        roles = ["read"] * options["readers"]
+        roles += ["write"] * options["writers"]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bench.sqlite3")
+            _prepare(path)
+            with ProcessPoolExecutor(max_workers=len(roles)) as pool:
+                futures = [
+                    (
+                        role,
+                        pool.submit(
+                            _run, path, pragmas, role, options["duration"]
+                        ),
+                    )
+                    for role in roles
+                ]
+                totals = {"read": [0, 0], "write": [0, 0]}
+                for role, future in futures:
+                    ops, errors = future.result()
+                    totals[role][0] += ops
+                    totals[role][1] += errors
+        return totals
+
+    def handle(self, *args, **options):
+        """Lance les deux mesures puis affiche le comparatif."""
+        if options["readers"] < 0 or options["writers"] < 0:
+            raise CommandError("--readers et --writers doivent être ≥ 0.")
+        if not options["readers"] + options["writers"]:
+            raise CommandError("Au moins un lecteur ou un écrivain requis.")
+
+        for label, pragmas in (
+            ("par défaut", []),
+            ("optimisé", settings.SQLITE_PRAGMAS),
+        ):
+            totals = self._measure(pragmas, options)
+            duration = options["duration"]
+            self.stdout.write(
+                f"Profil {label} : "
+                f"{totals['read'][0] / duration:.0f} lectures/s, "
+                f"{totals['write'][0] / duration:.0f} écritures/s, "
+                f"{totals['read'][1] + totals['write'][1]} erreur(s) "
+                "« database is locked »."
+            )
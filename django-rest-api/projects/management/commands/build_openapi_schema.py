@@ -0,0 +1,59 @@
+"""
+Commande `build_openapi_schema` : précompilation du schéma OpenAPI.
+À lancer à chaque build ou déploiement : écrit `schema.yaml` et
+`schema.json`, servis ensuite tels quels par /api/schema/ lorsque
+`OPENAPI_SCHEMA_DIR` désigne le même dossier.
+"""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from utils.openapi_cache import CachedSpectacularAPIView, schema_file
+
+# Formats précompilés (les autres types de média sont générés à la volée)
+SCHEMA_RENDERERS = (OpenApiYamlRenderer, OpenApiJsonRenderer)
+
+
+class Command(BaseCommand):
+    """Génère les fichiers du schéma OpenAPI."""
+
+    help = (
+        "Précompile le schéma OpenAPI (YAML et JSON) servi par "
+        "/api/schema/ sans introspection à l’exécution."
+    )
+
+    def add_arguments(self, parser):
+        """Déclare les options de la commande."""
+        parser.add_argument(
+            "--output",
+            default=settings.OPENAPI_SCHEMA_DIR,
+            help="Dossier de sortie (défaut : OPENAPI_SCHEMA_DIR).",
+        )
+
+    def handle(self, *args, **options):
+        """Rend le schéma par la vue elle-même puis l’écrit sur disque."""
+        if not options["output"]:
+            raise CommandError(
+                "Indiquez --output ou définissez OPENAPI_SCHEMA_DIR."
+            )
+        directory = Path(options["output"])
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # Même vue que /api/schema/ : octets identiques à ceux servis
+        view = CachedSpectacularAPIView.as_view(cache_schema=False)
+        for renderer in SCHEMA_RENDERERS:
+            request = RequestFactory().get(
+                "/api/schema/", HTTP_ACCEPT=renderer.media_type
+            )
+            response = view(request)
+            if response.status_code != 200:
+                raise CommandError(
+                    f"Génération {renderer.format} : "
+                    f"HTTP {response.status_code}."
+                )
+            path = schema_file(directory, renderer)
+            path.write_bytes(response.content)
+            self.stdout.write(f"{path} ({len(response.content)} octets)")
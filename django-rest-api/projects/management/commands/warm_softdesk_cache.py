@@ -0,0 +1,65 @@
+"""
+Commande `warm_softdesk_cache` : préchauffage du cache après déploiement.
+Reconstruit les listes de projets et d’issues en cache des utilisateurs
+les plus récemment connectés, en parallèle borné et à débit limité.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from projects.warmup import warm_recent_users
+
+
+class Command(BaseCommand):
+    """Préchauffe les caches des utilisateurs actifs."""
+
+    help = (
+        "Précalcule les listes en cache (projets, issues) des N "
+        "utilisateurs les plus récemment connectés."
+    )
+
+    def add_arguments(self, parser):
+        """Déclare les options de la commande."""
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=settings.CACHE_WARMUP_USERS,
+            help="Nombre d’utilisateurs (par dernière connexion).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.CACHE_WARMUP_WORKERS,
+            help="Utilisateurs traités en parallèle.",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=settings.CACHE_WARMUP_RATE,
+            help="Utilisateurs démarrés par seconde au plus (0 = illimité).",
+        )
+
+    def handle(self, *args, **options):
+        """Lance le préchauffage puis affiche le bilan."""
+        if options["users"] < 1 or options["workers"] < 1:
+            raise CommandError("--users et --workers doivent être ≥ 1.")
+        if options["rate"] < 0:
+            raise CommandError("--rate doit être positif.")
+
+        def report(user, projects, error):
+            if error is not None:
+                self.stderr.write(f"{user.username} : échec ({error}).")
+            elif options["verbosity"] > 1:
+                self.stdout.write(f"{user.username} : {projects} projet(s).")
+
+        stats = warm_recent_users(
+            limit=options["users"],
+            workers=options["workers"],
+            rate=options["rate"],
+            on_done=report,
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Cache préchauffé pour {stats['users']} utilisateur(s), "
+                f"{stats['errors']} échec(s)."
+            )
+        )
@@ -0,0 +1,96 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'kind',
+                    models.CharField(
+                        choices=[('issue', 'Issue'), ('comment', 'Comment')],
+                        max_length=10,
+                    ),
+                ),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('project_id', models.PositiveBigIntegerField()),
+                ('deleted_time', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Suppression',
+                'verbose_name_plural': 'Suppressions',
+                'ordering': ['deleted_time', 'id'],
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='issue',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='comment',
+            name='updated_time',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddField(
+            model_name='issue',
+            name='updated_time',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='issue',
+            name='assignee_contributor',
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='issues_assigned',
+                to='projects.contributor',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(
+                fields=['updated_time', 'id'], name='comment_sync_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project', 'updated_time', 'id'], name='issue_sync_idx'
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='issue',
+            constraint=models.UniqueConstraint(
+                fields=('title', 'project'),
+                name='unique_issue_title_per_project',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(
+                fields=['project_id', 'deleted_time', 'id'],
+                name='tombstone_sync_idx',
+            ),
+        ),
+    ]
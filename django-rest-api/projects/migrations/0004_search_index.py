@@ -0,0 +1,76 @@
+# Index de recherche plein texte : FTS5 (SQLite) ou GIN tsvector (PostgreSQL)
+#
+# SQL recopié ici : la migration ne dépend pas de projects.search, dont
+# le code peut évoluer (voir 0009 pour les index pondérés).
+
+from django.db import migrations
+
+SEARCH_TABLE = "projects_search_index"
+
+CREATE_FTS_SQL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING "
+    "fts5(kind UNINDEXED, object_id UNINDEXED, project_id UNINDEXED, "
+    "title, body, tokenize='unicode61 remove_diacritics 2')"
+)
+
+
+def backfill_sql(issue_table, comment_table):
+    return [
+        f"INSERT INTO {SEARCH_TABLE} "
+        "(rowid, kind, object_id, project_id, title, body) "
+        "SELECT id * 2, 'issue', id, project_id, title, description "
+        f"FROM {issue_table}",
+        f"INSERT INTO {SEARCH_TABLE} "
+        "(rowid, kind, object_id, project_id, title, body) "
+        "SELECT c.id * 2 + 1, 'comment', c.id, i.project_id, '', "
+        f"c.description FROM {comment_table} c "
+        f"JOIN {issue_table} i ON i.id = c.issue_id",
+    ]
+
+
+def gin_indexes_sql(issue_table, comment_table):
+    return [
+        f"CREATE INDEX issue_search_gin ON {issue_table} USING gin (("
+        "to_tsvector('french'::regconfig, "
+        "COALESCE(title, '') || ' ' || COALESCE(description, ''))))",
+        f"CREATE INDEX comment_search_gin ON {comment_table} USING gin (("
+        "to_tsvector('french'::regconfig, COALESCE(description, ''))))",
+    ]
+
+
+def _tables(apps):
+    return (
+        apps.get_model("projects", "Issue")._meta.db_table,
+        apps.get_model("projects", "Comment")._meta.db_table,
+    )
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        schema_editor.execute(CREATE_FTS_SQL)
+        for sql in backfill_sql(*_tables(apps)):
+            schema_editor.execute(sql)
+    elif vendor == "postgresql":
+        for sql in gin_indexes_sql(*_tables(apps)):
+            schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+    elif vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS issue_search_gin")
+        schema_editor.execute("DROP INDEX IF EXISTS comment_search_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_sync_updated_time_tombstones'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0004_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project', '-created_time', '-id'],
+                name='issue_project_created_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project', 'status', '-created_time'],
+                name='issue_project_status_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project', 'priority', '-created_time'],
+                name='issue_project_priority_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['project', 'tag', '-created_time'],
+                name='issue_project_tag_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['assignee_contributor', 'status'],
+                name='issue_assignee_status_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['author_user', '-created_time'],
+                name='issue_author_created_idx',
+            ),
+        ),
+    ]
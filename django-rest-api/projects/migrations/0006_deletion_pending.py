@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 05:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_issue_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='deletion_pending',
+            field=models.BooleanField(default=False),
+        ),
+    ]
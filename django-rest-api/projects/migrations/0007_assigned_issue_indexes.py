@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:01
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_deletion_pending'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(
+                fields=['issue', '-created_time'],
+                name='comment_issue_created_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='issue',
+            index=models.Index(
+                fields=['assignee_contributor', '-created_time', '-id'],
+                name='issue_assignee_created_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_assigned_issue_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='tombstone',
+            name='kind',
+            field=models.CharField(
+                choices=[
+                    ('issue', 'Issue'),
+                    ('comment', 'Comment'),
+                    ('project', 'Project'),
+                ],
+                max_length=10,
+            ),
+        ),
+    ]
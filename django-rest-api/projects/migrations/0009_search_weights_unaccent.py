@@ -0,0 +1,73 @@
+# Recherche PostgreSQL : titre pondéré (A) devant la description (B),
+# accents ignorés (configuration `french_unaccent`). Sans effet sous
+# SQLite, dont l’index FTS5 pondère et désaccentue déjà.
+#
+# SQL recopié ici : la migration ne dépend pas de projects.search.
+
+from django.db import migrations
+
+CONFIG_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS unaccent",
+    "DO $$ BEGIN "
+    "IF NOT EXISTS (SELECT 1 FROM pg_ts_config "
+    "WHERE cfgname = 'french_unaccent') THEN "
+    "CREATE TEXT SEARCH CONFIGURATION french_unaccent (COPY = french); "
+    "ALTER TEXT SEARCH CONFIGURATION french_unaccent "
+    "ALTER MAPPING FOR hword, hword_part, word "
+    "WITH unaccent, french_stem; "
+    "END IF; END $$",
+]
+
+# Expressions identiques à projects.search.search_vector()
+WEIGHTED_INDEXES_SQL = [
+    "CREATE INDEX issue_search_gin ON projects_issue USING gin (("
+    "setweight(to_tsvector('french_unaccent'::regconfig, "
+    "COALESCE(title, '')), 'A') || "
+    "setweight(to_tsvector('french_unaccent'::regconfig, "
+    "COALESCE(description, '')), 'B')))",
+    "CREATE INDEX comment_search_gin ON projects_comment USING gin (("
+    "setweight(to_tsvector('french_unaccent'::regconfig, "
+    "COALESCE(description, '')), 'B')))",
+]
+
+# Index de 0004 (sans poids, configuration `french`)
+PLAIN_INDEXES_SQL = [
+    "CREATE INDEX issue_search_gin ON projects_issue USING gin (("
+    "to_tsvector('french'::regconfig, "
+    "COALESCE(title, '') || ' ' || COALESCE(description, ''))))",
+    "CREATE INDEX comment_search_gin ON projects_comment USING gin (("
+    "to_tsvector('french'::regconfig, COALESCE(description, ''))))",
+]
+
+DROP_INDEXES_SQL = [
+    "DROP INDEX IF EXISTS issue_search_gin",
+    "DROP INDEX IF EXISTS comment_search_gin",
+]
+
+
+def weight_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for sql in CONFIG_SQL + DROP_INDEXES_SQL + WEIGHTED_INDEXES_SQL:
+        schema_editor.execute(sql)
+
+
+def unweight_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for sql in DROP_INDEXES_SQL + PLAIN_INDEXES_SQL:
+        schema_editor.execute(sql)
+    schema_editor.execute(
+        "DROP TEXT SEARCH CONFIGURATION IF EXISTS french_unaccent"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0008_tombstone_project_kind'),
+    ]
+
+    operations = [
+        migrations.RunPython(weight_search_index, unweight_search_index),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-19 06:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0009_search_weights_unaccent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tombstone',
+            name='user_id',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='tombstone',
+            index=models.Index(
+                fields=['user_id', 'deleted_time', 'id'],
+                name='tombstone_user_sync_idx',
+            ),
+        ),
+    ]
@@ -29,6 +29,8 @@ class Project(models.Model):
         related_name="projects_authored",
     )
     created_time = models.DateTimeField(auto_now_add=True)
+    # Masqué immédiatement, purgé par lots en arrière-plan
+    deletion_pending = models.BooleanField(default=False)
 
     class Meta:
         unique_together = ("title", "author_user")
@@ -128,6 +130,7 @@ class Issue(models.Model):
         related_name="issues",
     )
     created_time = models.DateTimeField(auto_now_add=True)
+    updated_time = models.DateTimeField(auto_now=True)
 
     class Meta:
         constraints = [
@@ -136,6 +139,45 @@ class Issue(models.Model):
                 name="unique_issue_title_per_project",
             )
         ]
+        indexes = [
+            # Synchronisation différentielle : projet puis curseur temporel
+            models.Index(
+                fields=["project", "updated_time", "id"],
+                name="issue_sync_idx",
+            ),
+            # Filtres de liste (projects.filters.IssueFilter) : colonne
+            # filtrée puis tri par défaut, sans tri en mémoire
+            models.Index(
+                fields=["project", "-created_time", "-id"],
+                name="issue_project_created_idx",
+            ),
+            models.Index(
+                fields=["project", "status", "-created_time"],
+                name="issue_project_status_idx",
+            ),
+            models.Index(
+                fields=["project", "priority", "-created_time"],
+                name="issue_project_priority_idx",
+            ),
+            models.Index(
+                fields=["project", "tag", "-created_time"],
+                name="issue_project_tag_idx",
+            ),
+            models.Index(
+                fields=["assignee_contributor", "status"],
+                name="issue_assignee_status_idx",
+            ),
+            models.Index(
+                fields=["author_user", "-created_time"],
+                name="issue_author_created_idx",
+            ),
+            # « Mon travail » (/api/users/me/assigned/) : assigné puis
+            # ordre du curseur
+            models.Index(
+                fields=["assignee_contributor", "-created_time", "-id"],
+                name="issue_assignee_created_idx",
+            ),
+        ]
         ordering = ["-created_time"]
         verbose_name = "Issue"
         verbose_name_plural = "Issues"
@@ -161,9 +203,21 @@ class Comment(models.Model):
         related_name="comments",
     )
     created_time = models.DateTimeField(auto_now_add=True)
+    updated_time = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ("description", "issue", "author_user")
+        indexes = [
+            models.Index(
+                fields=["updated_time", "id"],
+                name="comment_sync_idx",
+            ),
+            # Dernier commentaire d’une issue (sous-requête corrélée)
+            models.Index(
+                fields=["issue", "-created_time"],
+                name="comment_issue_created_idx",
+            ),
+        ]
         ordering = ["-created_time"]
         verbose_name = "Commentaire"
         verbose_name_plural = "Commentaires"
@@ -174,3 +228,49 @@ class Comment(models.Model):
             f"Comment {self.uuid} by {self.author_user.username} "
             f"on {self.issue.title}"
         )
+
+
+class Tombstone(models.Model):
+    """
+    Trace la suppression d’une issue, d’un commentaire ou d’un projet.
+    Permet aux clients hors ligne de propager les suppressions lors
+    d’une synchronisation différentielle (/api/sync/). La purge d’un
+    projet n’écrit qu’une trace `project` pour toutes ses lignes.
+
+    Une trace `project` adressée à un utilisateur (`user_id`) signale
+    qu’il a perdu l’accès au projet (retrait, suppression du projet) :
+    elle lui reste visible alors que le projet ne l’est plus.
+    """
+
+    KIND_CHOICES = [
+        ("issue", "Issue"),
+        ("comment", "Comment"),
+        ("project", "Project"),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    # Simple entier (pas de clé étrangère) : la trace survit à son projet
+    project_id = models.PositiveBigIntegerField()
+    # Destinataire d’une perte d’accès ; vide : membres du projet
+    user_id = models.PositiveBigIntegerField(null=True, blank=True)
+    deleted_time = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["project_id", "deleted_time", "id"],
+                name="tombstone_sync_idx",
+            ),
+            models.Index(
+                fields=["user_id", "deleted_time", "id"],
+                name="tombstone_user_sync_idx",
+            ),
+        ]
+        ordering = ["deleted_time", "id"]
+        verbose_name = "Suppression"
+        verbose_name_plural = "Suppressions"
+
+    def __str__(self):
+        """Retourne le type et l’identifiant de l’objet supprimé."""
+        return f"{self.kind} #{self.object_id} supprimé"
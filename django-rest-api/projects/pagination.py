@@ -1,4 +1,4 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 class ContributorProjectPagination(PageNumberPagination):
@@ -7,3 +7,21 @@ class ContributorProjectPagination(PageNumberPagination):
     page_size = 1
     page_size_query_param = "page_size"
     max_page_size = 10
+
+
+class AssignedIssueCursorPagination(CursorPagination):
+    """Pagination par curseur des issues assignées (sans COUNT)."""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_time", "-id")
+
+
+class IssueCommentCursorPagination(CursorPagination):
+    """Fil des commentaires d’une issue, du plus ancien au plus récent."""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("created_time", "id")
@@ -4,9 +4,21 @@ Ces classes contrôlent l'accès aux projets, issues et commentaires
 en fonction du rôle et du lien entre l'utilisateur et la ressource.
 """
 
+from projects.access import has_project_access
 from rest_framework import permissions
 
 
+def _project_id(obj):
+    """Renvoie l’identifiant du projet lié à un objet, ou None."""
+    if hasattr(obj, "contributors"):
+        return obj.pk
+    if hasattr(obj, "project_id"):
+        return obj.project_id
+    if hasattr(obj, "issue"):
+        return obj.issue.project_id
+    return None
+
+
 class IsContributor(permissions.BasePermission):
     """
     Vérifie que l'utilisateur est contributeur du projet associé.
@@ -19,26 +31,10 @@ class IsContributor(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         """Vérifie l’appartenance du user au projet lié à l’objet."""
-        user = request.user
-
-        if hasattr(obj, "contributors"):
-            return obj.contributors.filter(user=user).exists()
-
-        if hasattr(obj, "project"):
-            project = obj.project
-            return (
-                project.contributors.filter(user=user).exists()
-                or project.author_user == user
-            )
-
-        if hasattr(obj, "issue"):
-            project = obj.issue.project
-            return (
-                project.contributors.filter(user=user).exists()
-                or project.author_user == user
-            )
-
-        return False
+        project_id = _project_id(obj)
+        return project_id is not None and has_project_access(
+            request, project_id
+        )
 
 
 class IsAuthorAndContributor(permissions.BasePermission):
@@ -62,11 +58,10 @@ class IsAuthorAndContributor(permissions.BasePermission):
 
         # Lecture seule : doit être contributeur
         if request.method in permissions.SAFE_METHODS:
-            if hasattr(obj, "contributors"):
-                return obj.contributors.filter(user=user).exists()
-            if hasattr(obj, "project"):
-                return obj.project.contributors.filter(user=user).exists()
-            return False
+            project_id = _project_id(obj)
+            return project_id is not None and has_project_access(
+                request, project_id
+            )
 
         # Écriture : réservée à l’auteur
         author_attr = getattr(obj, "author_user", None)
@@ -97,7 +92,7 @@ class IsAuthorOrProjectContributorReadOnly(permissions.BasePermission):
 
             # L’utilisateur peut lire s’il est contributeur, auteur ou assigné
             return (
-                project.contributors.filter(user=user).exists()
+                has_project_access(request, project.id)
                 or project.author_user == user
                 or (
                     hasattr(obj, "assignee_contributor")
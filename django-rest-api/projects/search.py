@@ -0,0 +1,425 @@
+"""
+Recherche plein texte sur les issues et les commentaires.
+Utilise un index FTS5 sous SQLite et un index GIN `tsvector` sous
+PostgreSQL ; l’index est tenu à jour à chaque sauvegarde / suppression
+et les résultats sont classés par pertinence. Sur les deux moteurs, le
+titre pèse plus que la description, les accents sont ignorés et chaque
+terme saisi vaut préfixe.
+"""
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db import connections
+from django.db.models import F, Q, Value
+from django.db.models.expressions import RawSQL
+from projects.models import Comment, Issue, Project
+
+SEARCH_TABLE = "projects_search_index"
+# Configuration PostgreSQL : dictionnaire français précédé d’unaccent
+SEARCH_CONFIG = "french_unaccent"
+SEARCH_MAX_RESULTS = 100
+
+# Décalage des rowid FTS5 : une issue et un commentaire de même id
+# occupent deux lignes distinctes, adressables sans balayage.
+KIND_OFFSETS = {"issue": 0, "comment": 1}
+
+
+def _rowid(kind, object_id):
+    """Calcule le rowid FTS5 d’un objet indexé."""
+    return object_id * 2 + KIND_OFFSETS[kind]
+
+
+def _document(instance):
+    """Renvoie (type, id, projet, titre, corps) pour un objet indexable."""
+    if isinstance(instance, Issue):
+        return (
+            "issue",
+            instance.pk,
+            instance.project_id,
+            instance.title,
+            instance.description,
+        )
+    return (
+        "comment",
+        instance.pk,
+        instance.issue.project_id,
+        "",
+        instance.description,
+    )
+
+
+def create_fts_table_sql():
+    """Instruction de création de la table virtuelle FTS5 (SQLite)."""
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING "
+        "fts5(kind UNINDEXED, object_id UNINDEXED, project_id UNINDEXED, "
+        "title, body, tokenize='unicode61 remove_diacritics 2')"
+    )
+
+
+def postgres_config_sql():
+    """Instructions créant `unaccent` et la configuration de recherche."""
+    return [
+        "CREATE EXTENSION IF NOT EXISTS unaccent",
+        "DO $$ BEGIN "
+        "IF NOT EXISTS (SELECT 1 FROM pg_ts_config "
+        f"WHERE cfgname = '{SEARCH_CONFIG}') THEN "
+        f"CREATE TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} (COPY = french); "
+        f"ALTER TEXT SEARCH CONFIGURATION {SEARCH_CONFIG} "
+        "ALTER MAPPING FOR hword, hword_part, word "
+        "WITH unaccent, french_stem; "
+        "END IF; END $$",
+    ]
+
+
+def search_vector(kind):
+    """Expression `tsvector` pondérée : titre en A, description en B."""
+    body = SearchVector("description", config=SEARCH_CONFIG, weight="B")
+    if kind == "issue":
+        return SearchVector("title", config=SEARCH_CONFIG, weight="A") + body
+    return body
+
+
+def prefix_query(query):
+    """Saisie utilisateur en `tsquery` brute : termes préfixes, ET."""
+    terms = [
+        term.replace("\\", "\\\\").replace("'", "''") for term in query.split()
+    ]
+    return " & ".join(f"'{term}':*" for term in terms)
+
+
+def postgres_search_indexes():
+    """Index GIN d’expression utilisés par la recherche PostgreSQL."""
+    return [
+        (Issue, GinIndex(search_vector("issue"), name="issue_search_gin")),
+        (
+            Comment,
+            GinIndex(search_vector("comment"), name="comment_search_gin"),
+        ),
+    ]
+
+
+# ---------------------------------------------------------------------
+# BACKENDS
+# ---------------------------------------------------------------------
+class FallbackSearchBackend:
+    """
+    Recherche dégradée par `icontains`, sans index dédié.
+    Utilisée pour les moteurs sans FTS5 ni `tsvector`.
+    """
+
+    def __init__(self, alias="default"):
+        """Mémorise l’alias de base de données utilisé."""
+        self.alias = alias
+
+    def ensure_schema(self):
+        """Aucune structure dédiée à créer."""
+
+    def index(self, instance):
+        """Aucun index à maintenir."""
+
+    def remove(self, instance):
+        """Aucun index à maintenir."""
+
+    def remove_project(self, project_id):
+        """Aucun index à maintenir."""
+
+    def _querysets(self, project_ids):
+        """Construit les querysets filtrés par projet, si demandé."""
+        issues = Issue.objects.using(self.alias)
+        comments = Comment.objects.using(self.alias)
+        if project_ids is not None:
+            issues = issues.filter(project_id__in=project_ids)
+            comments = comments.filter(issue__project_id__in=project_ids)
+        else:
+            # Tous les projets, hors ceux en cours de suppression
+            issues = issues.exclude(project__deletion_pending=True)
+            comments = comments.exclude(issue__project__deletion_pending=True)
+        return issues, comments
+
+    def filter_queryset(self, queryset, query, kind):
+        """Restreint un queryset aux objets correspondants, sans classement."""
+        if kind == "issue":
+            return queryset.filter(
+                Q(title__icontains=query) | Q(description__icontains=query)
+            )
+        return queryset.filter(description__icontains=query)
+
+    def search(self, query, project_ids=None, kinds=None, limit=50):
+        """Renvoie une liste de (type, id, score) triée par score."""
+        issues, comments = self._querysets(project_ids)
+        results = []
+        if not kinds or "issue" in kinds:
+            issues = issues.filter(
+                Q(title__icontains=query) | Q(description__icontains=query)
+            )
+            results += [
+                ("issue", pk, 0.0)
+                for pk in issues.values_list("pk", flat=True)[:limit]
+            ]
+        if not kinds or "comment" in kinds:
+            comments = comments.filter(description__icontains=query)
+            results += [
+                ("comment", pk, 0.0)
+                for pk in comments.values_list("pk", flat=True)[:limit]
+            ]
+        return results[:limit]
+
+
+class SQLiteFTSBackend(FallbackSearchBackend):
+    """Index FTS5 maintenu par signaux, classé via `bm25()`."""
+
+    # Poids bm25 par colonne : kind, object_id, project_id, title, body
+    BM25_WEIGHTS = "0.0, 0.0, 0.0, 10.0, 1.0"
+
+    def ensure_schema(self):
+        """Crée la table virtuelle FTS5 si elle n’existe pas."""
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute(create_fts_table_sql())
+
+    def index(self, instance):
+        """Insère ou remplace le document d’un objet dans l’index."""
+        kind, pk, project_id, title, body = _document(instance)
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s",
+                [_rowid(kind, pk)],
+            )
+            cursor.execute(
+                f"INSERT INTO {SEARCH_TABLE} "
+                "(rowid, kind, object_id, project_id, title, body) "
+                "VALUES (%s, %s, %s, %s, %s, %s)",
+                [_rowid(kind, pk), kind, pk, project_id, title, body],
+            )
+
+    def remove(self, instance):
+        """Retire un objet de l’index."""
+        kind = "issue" if isinstance(instance, Issue) else "comment"
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s",
+                [_rowid(kind, instance.pk)],
+            )
+
+    def remove_project(self, project_id):
+        """Retire tous les documents d’un projet en une seule requête."""
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute(
+                f"DELETE FROM {SEARCH_TABLE} WHERE project_id = %s",
+                [project_id],
+            )
+
+    @staticmethod
+    def match_expression(query):
+        """Échappe la saisie utilisateur en termes FTS5 (préfixes, ET)."""
+        terms = [t.replace('"', '""') for t in query.split()]
+        return " ".join(f'"{term}"*' for term in terms)
+
+    def filter_queryset(self, queryset, query, kind):
+        """Sous-requête sur l’index : aucune liste d’identifiants bornée."""
+        expression = self.match_expression(query)
+        if not expression:
+            return queryset.none()
+        return queryset.filter(
+            pk__in=RawSQL(
+                f"SELECT object_id FROM {SEARCH_TABLE} "
+                f"WHERE {SEARCH_TABLE} MATCH %s AND kind = %s",
+                [expression, kind],
+            )
+        )
+
+    def search(self, query, project_ids=None, kinds=None, limit=50):
+        """Renvoie une liste de (type, id, score) triée par pertinence."""
+        expression = self.match_expression(query)
+        if not expression:
+            return []
+
+        sql = (
+            f"SELECT kind, object_id, -bm25({SEARCH_TABLE}, "
+            f"{self.BM25_WEIGHTS}) AS score FROM {SEARCH_TABLE} "
+            f"WHERE {SEARCH_TABLE} MATCH %s"
+        )
+        params = [expression]
+        if project_ids is not None:
+            if not project_ids:
+                return []
+            placeholders = ", ".join(["%s"] * len(project_ids))
+            sql += f" AND project_id IN ({placeholders})"
+            params += list(project_ids)
+        else:
+            # Tous les projets, hors ceux en cours de suppression
+            sql += (
+                " AND project_id NOT IN (SELECT id FROM "
+                f"{Project._meta.db_table} WHERE deletion_pending)"
+            )
+        if kinds:
+            placeholders = ", ".join(["%s"] * len(kinds))
+            sql += f" AND kind IN ({placeholders})"
+            params += list(kinds)
+        sql += " ORDER BY score DESC LIMIT %s"
+        params.append(limit)
+
+        with connections[self.alias].cursor() as cursor:
+            cursor.execute(sql, params)
+            return [(k, int(pk), score) for k, pk, score in cursor.fetchall()]
+
+
+class PostgresSearchBackend(FallbackSearchBackend):
+    """
+    Recherche `tsvector` servie par des index GIN d’expression.
+    PostgreSQL maintient ces index lui-même à chaque écriture.
+    """
+
+    def ensure_schema(self):
+        """Crée configuration et index manquants (bases sans migrations)."""
+        connection = connections[self.alias]
+        with connection.cursor() as cursor:
+            for sql in postgres_config_sql():
+                cursor.execute(sql)
+            existing = {
+                name
+                for model, _ in postgres_search_indexes()
+                for name in connection.introspection.get_constraints(
+                    cursor, model._meta.db_table
+                )
+            }
+        with connection.schema_editor() as schema_editor:
+            for model, index in postgres_search_indexes():
+                if index.name not in existing:
+                    schema_editor.add_index(model, index)
+
+    @staticmethod
+    def _ts_query(query):
+        """Requête `tsquery` préfixe, ou None si la saisie est vide."""
+        expression = prefix_query(query)
+        if not expression:
+            return None
+        return SearchQuery(expression, search_type="raw", config=SEARCH_CONFIG)
+
+    def filter_queryset(self, queryset, query, kind):
+        """Filtre servi par l’index GIN, sans calcul de rang."""
+        ts_query = self._ts_query(query)
+        if ts_query is None:
+            return queryset.none()
+        return queryset.annotate(document=search_vector(kind)).filter(
+            document=ts_query
+        )
+
+    def search(self, query, project_ids=None, kinds=None, limit=50):
+        """Renvoie une liste de (type, id, score) triée par `ts_rank`."""
+        ts_query = self._ts_query(query)
+        if ts_query is None:
+            return []
+        issues, comments = self._querysets(project_ids)
+        results = []
+        if not kinds or "issue" in kinds:
+            results += self._ranked(
+                issues, search_vector("issue"), ts_query, "issue", limit
+            )
+        if not kinds or "comment" in kinds:
+            results += self._ranked(
+                comments, search_vector("comment"), ts_query, "comment", limit
+            )
+        results.sort(key=lambda row: row[2], reverse=True)
+        return results[:limit]
+
+    @staticmethod
+    def _ranked(queryset, vector, ts_query, kind, limit):
+        """Exécute une recherche classée sur un modèle."""
+        rows = (
+            queryset.annotate(document=vector)
+            .filter(document=ts_query)
+            .annotate(score=SearchRank(F("document"), ts_query))
+            .order_by("-score")
+            .values_list(Value(kind), "pk", "score")[:limit]
+        )
+        return [(k, pk, float(score)) for k, pk, score in rows]
+
+
+_BACKENDS = {}
+
+
+def get_search_backend(alias="default"):
+    """Renvoie (et mémorise) le backend adapté au moteur configuré."""
+    if alias not in _BACKENDS:
+        vendor = connections[alias].vendor
+        if vendor == "sqlite":
+            backend = SQLiteFTSBackend(alias)
+        elif vendor == "postgresql":
+            backend = PostgresSearchBackend(alias)
+        else:
+            backend = FallbackSearchBackend(alias)
+        _BACKENDS[alias] = backend
+    return _BACKENDS[alias]
+
+
+# ---------------------------------------------------------------------
+# RÉSULTATS
+# ---------------------------------------------------------------------
+def search(query, project_ids=None, kinds=None, limit=50):
+    """
+    Recherche puis charge les objets correspondants (2 requêtes max.).
+
+    Args:
+        query (str): texte saisi par l’utilisateur.
+        project_ids (list[int] | None): projets visibles (None = tous,
+            hors projets en cours de suppression).
+        kinds (list[str] | None): "issue" et/ou "comment".
+        limit (int): nombre maximal de résultats.
+
+    Returns:
+        list[dict]: résultats sérialisables, classés par pertinence.
+    """
+    hits = get_search_backend().search(query, project_ids, kinds, limit)
+    issue_ids = [pk for kind, pk, _ in hits if kind == "issue"]
+    comment_ids = [pk for kind, pk, _ in hits if kind == "comment"]
+
+    issues = Issue.objects.only("title", "project").in_bulk(issue_ids)
+    comments = (
+        Comment.objects.select_related("issue")
+        .only("description", "issue", "issue__title", "issue__project")
+        .in_bulk(comment_ids)
+    )
+
+    results = []
+    for kind, pk, score in hits:
+        if kind == "issue" and pk in issues:
+            issue = issues[pk]
+            results.append(
+                {
+                    "type": "issue",
+                    "id": pk,
+                    "project_id": issue.project_id,
+                    "title": issue.title,
+                    "rank": round(score, 4),
+                }
+            )
+        elif kind == "comment" and pk in comments:
+            comment = comments[pk]
+            results.append(
+                {
+                    "type": "comment",
+                    "id": pk,
+                    "project_id": comment.issue.project_id,
+                    "issue_id": comment.issue_id,
+                    "title": comment.issue.title,
+                    "excerpt": comment.description[:200],
+                    "rank": round(score, 4),
+                }
+            )
+    return results
+
+
+def filter_matching(queryset, query, kind):
+    """
+    Restreint un queryset aux objets correspondant à la saisie.
+
+    Sans classement ni limite (recherche de l’admin) : toutes les
+    correspondances sont conservées, la pagination reste à l’appelant.
+    """
+    backend = get_search_backend(queryset.db)
+    return backend.filter_queryset(queryset, query, kind)
@@ -5,19 +5,81 @@ pour la communication entre l’API et le client.
 """
 
 from django.contrib.auth import get_user_model
-from django.db import models
-from django.urls import reverse
-from projects.models import Comment, Contributor, Issue, Project
+from projects.access import accessible_project_ids, get_project_access
+from projects.activity import ACTIVITY_FIELDS
+from projects.models import Comment, Contributor, Issue, Project, Tombstone
 from rest_framework import serializers
+from utils.fieldsets import SparseFieldsetSerializerMixin
+from utils.urls import AbsoluteURLField
 
 User = get_user_model()
 
+
+# ---------------------------------------------------------------------
+# CLÉS ÉTRANGÈRES RESTREINTES À L’UTILISATEUR
+# ---------------------------------------------------------------------
+class ScopedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Clé étrangère dont les choix dépendent de l’utilisateur courant.
+
+    `scope(serializer, request)` n’est appelé qu’à la validation d’une
+    écriture (ou pour les formulaires de l’API navigable) : construire
+    ou rendre le serializer en lecture ne coûte aucune requête. Sans
+    requête dans le contexte, `queryset` sert de repli.
+    """
+
+    def __init__(self, scope=None, **kwargs):
+        """Mémorise la fonction de restriction des choix."""
+        self.scope = scope
+        super().__init__(**kwargs)
+
+    def get_queryset(self):
+        """Choix autorisés pour l’utilisateur de la requête."""
+        request = self.context.get("request")
+        if request is None or not request.user.is_authenticated:
+            return super().get_queryset()
+        return self.scope(self.parent, request)
+
+
+def _authored_projects(serializer, request):
+    """Projets dont l’utilisateur est l’auteur (table d’accès en cache)."""
+    if request.user.is_superuser:
+        return Project.objects.all()
+    access = get_project_access(request.user, request)
+    return Project.objects.filter(
+        pk__in=[pid for pid, perm in access.items() if perm == "AUTHOR"]
+    )
+
+
+def _assignable_contributors(serializer, request):
+    """Contributeurs du projet de l’issue modifiée ou en création."""
+    if serializer.instance is not None:
+        project_id = serializer.instance.project_id
+    else:
+        raw = str(getattr(serializer, "initial_data", {}).get("project", ""))
+        project_id = int(raw) if raw.isdigit() else None
+    if project_id is None:
+        return Contributor.objects.none()
+    return Contributor.objects.filter(project_id=project_id)
+
+
+def _accessible_issues(serializer, request):
+    """Issues des projets accessibles (table d’accès en cache)."""
+    if request.user.is_superuser:
+        return Issue.objects.all()
+    return Issue.objects.filter(
+        project_id__in=accessible_project_ids(request.user, request)
+    )
+
+
 # ---------------------------------------------------------------------
 # CONTRIBUTEURS
 # ---------------------------------------------------------------------
 
 
-class ContributorListSerializer(serializers.ModelSerializer):
+class ContributorListSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Serializer simplifié pour la liste des contributeurs."""
 
     username = serializers.ReadOnlyField(source="user.username")
@@ -27,13 +89,18 @@ class ContributorListSerializer(serializers.ModelSerializer):
         fields = ["id", "username", "role"]
 
 
-class ContributorDetailSerializer(serializers.ModelSerializer):
+class ContributorDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Serializer détaillé pour la gestion des contributeurs (ajout via UUID)."""
 
     user_uuid = serializers.UUIDField(write_only=True, required=True)
     username = serializers.ReadOnlyField(source="user.username")
-    project_url = serializers.HyperlinkedRelatedField(
-        source="project", view_name="project-detail", read_only=True
+    project_url = AbsoluteURLField(
+        view_name="project-detail", source="project_id"
+    )
+    project = ScopedPrimaryKeyRelatedField(
+        queryset=Project.objects.all(), scope=_authored_projects
     )
     is_author = serializers.SerializerMethodField()
     created_time = serializers.DateTimeField(read_only=True)
@@ -53,6 +120,7 @@ class ContributorDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["permission", "role"]
         validators = []
+        sparse_requires = {"is_author": ["permission"]}
 
     def validate_user_uuid(self, value):
         """Valide l’existence du user à partir de l’UUID fourni."""
@@ -78,23 +146,15 @@ class ContributorDetailSerializer(serializers.ModelSerializer):
         """Renvoie True si le contributeur est l’auteur du projet."""
         return obj.permission == "AUTHOR"
 
-    def __init__(self, *args, **kwargs):
-        """Filtre les choix projet selon le contexte de l’utilisateur."""
-        super().__init__(*args, **kwargs)
-        request = self.context.get("request")
-        if request and not request.user.is_superuser:
-            user = request.user
-            self.fields["project"].queryset = Project.objects.filter(
-                author_user=user
-            )
-
 
 # ---------------------------------------------------------------------
 # PROJETS
 # ---------------------------------------------------------------------
 
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Serializer simplifié pour la liste des projets."""
 
     author_username = serializers.ReadOnlyField(source="author_user.username")
@@ -104,12 +164,12 @@ class ProjectListSerializer(serializers.ModelSerializer):
         fields = ["id", "title", "type", "author_username"]
 
 
-class ProjectDetailSerializer(serializers.ModelSerializer):
+class ProjectDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Serializer détaillé pour les projets."""
 
-    url = serializers.HyperlinkedIdentityField(
-        view_name="project-detail", lookup_field="pk", read_only=True
-    )
+    url = AbsoluteURLField(view_name="project-detail", source="id")
     author_user_id = serializers.ReadOnlyField(source="author_user.id")
     author_username = serializers.ReadOnlyField(source="author_user.username")
     contributors = ContributorListSerializer(many=True, read_only=True)
@@ -135,7 +195,9 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
 # ---------------------------------------------------------------------
 
 
-class IssueListSerializer(serializers.ModelSerializer):
+class IssueListSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Serializer simplifié pour la liste des issues."""
 
     author_username = serializers.ReadOnlyField(source="author_user.username")
@@ -163,12 +225,54 @@ class IssueListSerializer(serializers.ModelSerializer):
         ]
 
 
-class IssueDetailSerializer(serializers.ModelSerializer):
+class IssueActivityListSerializer(IssueListSerializer):
+    """Liste des issues enrichie de l’activité (`?activity=1`)."""
+
+    comments_count = serializers.IntegerField(read_only=True)
+    last_comment_time = serializers.DateTimeField(
+        read_only=True, allow_null=True
+    )
+
+    class Meta(IssueListSerializer.Meta):
+        fields = IssueListSerializer.Meta.fields + list(ACTIVITY_FIELDS)
+        # Annotations (projects.activity) : aucune colonne à charger
+        sparse_requires = {name: [] for name in ACTIVITY_FIELDS}
+
+
+class AssignedIssueSerializer(serializers.ModelSerializer):
+    """Issue assignée à l’utilisateur courant (/api/users/me/assigned/)."""
+
+    project_title = serializers.ReadOnlyField()
+    last_comment_time = serializers.DateTimeField(
+        read_only=True, allow_null=True
+    )
+
+    class Meta:
+        model = Issue
+        fields = [
+            "id",
+            "title",
+            "status",
+            "tag",
+            "priority",
+            "project",
+            "project_title",
+            "created_time",
+            "updated_time",
+            "last_comment_time",
+        ]
+        read_only_fields = fields
+
+
+class IssueDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Serializer détaillé pour afficher ou modifier une issue."""
 
     author_username = serializers.ReadOnlyField(source="author_user.username")
-    assignee_contributor = serializers.PrimaryKeyRelatedField(
+    assignee_contributor = ScopedPrimaryKeyRelatedField(
         queryset=Contributor.objects.all(),
+        scope=_assignable_contributors,
         required=False,
         allow_null=True,
     )
@@ -193,36 +297,9 @@ class IssueDetailSerializer(serializers.ModelSerializer):
             "project",
             "project_title",
             "created_time",
+            "updated_time",
         ]
-        read_only_fields = ["author_user", "created_time"]
-
-    def __init__(self, *args, **kwargs):
-        """Restreint les contributeurs assignables à ceux du projet concerné."""
-        super().__init__(*args, **kwargs)
-        request = self.context.get("request")
-        if request and request.user:
-            self.fields["assignee_contributor"].queryset = (
-                self.get_filtered_contributors(request)
-            )
-
-    def get_filtered_contributors(self, request):
-        """Retourne uniquement les contributeurs appartenant au projet."""
-        project = None
-
-        # Si on modifie une issue existante
-        if self.instance and getattr(self.instance, "project", None):
-            project = self.instance.project
-        else:
-            # Si on crée une nouvelle issue
-            data = getattr(self, "initial_data", {})
-            project_id = data.get("project")
-            if project_id:
-                project = Project.objects.filter(id=project_id).first()
-
-        # On restreint aux contributeurs du projet + auteur du projet
-        if project:
-            return Contributor.objects.filter(project=project)
-        return Contributor.objects.none()
+        read_only_fields = ["author_user", "created_time", "updated_time"]
 
 
 # ---------------------------------------------------------------------
@@ -230,26 +307,51 @@ class IssueDetailSerializer(serializers.ModelSerializer):
 # ---------------------------------------------------------------------
 
 
-class CommentListSerializer(serializers.ModelSerializer):
+class CommentListSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Serializer simplifié pour la liste des commentaires."""
 
     author_username = serializers.ReadOnlyField(source="author_user.username")
-    issue_url = serializers.HyperlinkedRelatedField(
-        source="issue", view_name="issue-detail", read_only=True
-    )
+    issue_url = AbsoluteURLField(view_name="issue-detail", source="issue_id")
 
     class Meta:
         model = Comment
         fields = ["id", "author_username", "description", "issue_url"]
 
 
-class CommentDetailSerializer(serializers.ModelSerializer):
+class IssueCommentSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
+    """Commentaire dans le fil d’une issue (/api/issues/{id}/comments/)."""
+
+    author_username = serializers.ReadOnlyField(source="author_user.username")
+
+    class Meta:
+        model = Comment
+        fields = [
+            "id",
+            "uuid",
+            "author_username",
+            "description",
+            "created_time",
+            "updated_time",
+        ]
+        read_only_fields = fields
+
+
+class CommentDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Serializer détaillé pour les commentaires."""
 
     author_username = serializers.ReadOnlyField(source="author_user.username")
+    issue = ScopedPrimaryKeyRelatedField(
+        queryset=Issue.objects.all(), scope=_accessible_issues
+    )
     issue_title = serializers.ReadOnlyField(source="issue.title")
     created_time = serializers.DateTimeField(read_only=True)
-    issue_url = serializers.SerializerMethodField()
+    issue_url = AbsoluteURLField(view_name="issue-detail", source="issue_id")
 
     class Meta:
         model = Comment
@@ -263,29 +365,27 @@ class CommentDetailSerializer(serializers.ModelSerializer):
             "issue_title",
             "issue_url",
             "created_time",
+            "updated_time",
+        ]
+        read_only_fields = [
+            "author_user",
+            "created_time",
+            "updated_time",
+            "uuid",
         ]
-        read_only_fields = ["author_user", "created_time", "uuid"]
 
-    def __init__(self, *args, **kwargs):
-        """Filtre les issues accessibles à l’utilisateur courant."""
-        super().__init__(*args, **kwargs)
-        request = self.context.get("request")
-        if request and request.user and not request.user.is_superuser:
-            self.fields["issue"].queryset = self.get_filtered_issues(
-                request.user
-            )
-
-    def get_filtered_issues(self, user):
-        """Renvoie les issues accessibles à l’utilisateur."""
-        return Issue.objects.filter(
-            models.Q(project__contributors__user=user)
-            | models.Q(project__author_user=user)
-        ).distinct()
-
-    def get_issue_url(self, obj):
-        """Construit l’URL complète d’une issue associée."""
-        request = self.context.get("request")
-        if request and obj.issue:
-            url = reverse("issue-detail", args=[obj.issue.id])
-            return request.build_absolute_uri(url)
-        return None
+
+# ---------------------------------------------------------------------
+# SYNCHRONISATION
+# ---------------------------------------------------------------------
+
+
+class TombstoneSerializer(serializers.ModelSerializer):
+    """Serializer des suppressions transmises lors d’une synchronisation."""
+
+    type = serializers.ReadOnlyField(source="kind")
+    id = serializers.ReadOnlyField(source="object_id")
+
+    class Meta:
+        model = Tombstone
+        fields = ["type", "id", "project_id", "deleted_time"]
@@ -0,0 +1,207 @@
+"""
+Signaux du module projects.
+Enregistrent les suppressions d’issues et de commentaires et les pertes
+d’accès aux projets (tombstones) utilisées par la synchronisation
+différentielle, maintiennent l’index de recherche plein texte, la table
+d’accès utilisateur → projets, les versions du cache des détails et les
+statistiques de projet, et publient le préchauffage du cache après
+`migrate`.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db.models.signals import (
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+from jobs.queue import enqueue
+from projects.access import invalidate_project_access
+from projects.detail_cache import bump_version, evict
+from projects.models import Comment, Contributor, Issue, Project, Tombstone
+from projects.search import get_search_backend
+from projects.stats import invalidate_project_stats
+
+# Purge de projet en cours : les effets ligne à ligne sont faits en bloc
+_purging = ContextVar("purging", default=False)
+
+
+@contextmanager
+def bulk_purge():
+    """
+    Désactive les effets ligne à ligne des suppressions (traces, index,
+    cache des détails, statistiques, table d’accès).
+
+    Réservé à `projects.tasks.purge_project`, qui les remplace par une
+    trace de projet et une suppression groupée de l’index.
+    """
+    token = _purging.set(True)
+    try:
+        yield
+    finally:
+        _purging.reset(token)
+
+
+def _deleted_directly(instance, origin):
+    """
+    Indique si la suppression vise l’objet lui-même (ou un queryset de
+    son modèle) plutôt qu’un parent supprimé en cascade.
+
+    Une cascade n’a pas besoin de traces individuelles : la trace du
+    parent (ou la disparition du projet) suffit au client. Il en va de
+    même pendant une purge de projet (`bulk_purge`).
+    """
+    if _purging.get():
+        return False
+    origin_model = getattr(origin, "model", type(origin))
+    return origin is None or origin_model is type(instance)
+
+
+@receiver(post_delete, sender=Issue)
+def record_issue_tombstone(sender, instance, origin=None, **kwargs):
+    """Enregistre la suppression d’une issue."""
+    if _deleted_directly(instance, origin):
+        Tombstone.objects.create(
+            kind="issue",
+            object_id=instance.pk,
+            project_id=instance.project_id,
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def record_comment_tombstone(sender, instance, origin=None, **kwargs):
+    """Enregistre la suppression d’un commentaire."""
+    if _deleted_directly(instance, origin):
+        Tombstone.objects.create(
+            kind="comment",
+            object_id=instance.pk,
+            project_id=instance.issue.project_id,
+        )
+
+
+@receiver(post_delete, sender=Contributor)
+def record_access_loss(sender, instance, **kwargs):
+    """Signale au membre retiré la disparition du projet (synchro)."""
+    if _purging.get():
+        return
+    Tombstone.objects.create(
+        kind="project",
+        object_id=instance.project_id,
+        project_id=instance.project_id,
+        user_id=instance.user_id,
+    )
+
+
+@receiver(pre_delete, sender=Contributor)
+def touch_assigned_issues(sender, instance, **kwargs):
+    """
+    Le retrait d’un assigné vide `assignee_contributor` (SET_NULL) par un
+    UPDATE sans signal : les issues concernées sont horodatées ici pour
+    être resynchronisées, et leurs détails en cache invalidés.
+    """
+    if _purging.get():
+        return
+    issues = Issue.objects.filter(assignee_contributor=instance)
+    issue_ids = list(issues.values_list("pk", flat=True))
+    if not issue_ids:
+        return
+    Issue.objects.filter(pk__in=issue_ids).update(updated_time=timezone.now())
+    for issue_id in issue_ids:
+        bump_version("issue", issue_id)
+
+
+# ---------------------------------------------------------------------
+# RECHERCHE PLEIN TEXTE
+# ---------------------------------------------------------------------
+@receiver(post_save, sender=Issue)
+@receiver(post_save, sender=Comment)
+def index_search_document(sender, instance, using, **kwargs):
+    """Met à jour le document indexé d’une issue ou d’un commentaire."""
+    get_search_backend(using).index(instance)
+
+
+@receiver(post_delete, sender=Issue)
+@receiver(post_delete, sender=Comment)
+def remove_search_document(sender, instance, using, **kwargs):
+    """Retire une issue ou un commentaire de l’index de recherche."""
+    if _purging.get():
+        return
+    get_search_backend(using).remove(instance)
+
+
+@receiver(post_migrate)
+def ensure_search_schema(sender, using="default", **kwargs):
+    """Garantit la présence de l’index, y compris sans migrations."""
+    if sender.name == "projects":
+        get_search_backend(using).ensure_schema()
+
+
+@receiver(post_migrate)
+def schedule_cache_warmup(sender, **kwargs):
+    """Après un déploiement (`migrate`), publie le préchauffage du cache."""
+    if sender.name == "projects" and settings.CACHE_WARMUP_AFTER_MIGRATE:
+        enqueue("projects.warm_cache", key="warm_cache")
+
+
+# ---------------------------------------------------------------------
+# TABLE D’ACCÈS
+# ---------------------------------------------------------------------
+@receiver(post_save, sender=Contributor)
+@receiver(post_delete, sender=Contributor)
+def refresh_project_access(sender, instance, **kwargs):
+    """Invalide la table d’accès de l’utilisateur concerné."""
+    if _purging.get():
+        return
+    invalidate_project_access(instance.user_id)
+
+
+# ---------------------------------------------------------------------
+# CACHE DES DÉTAILS
+# ---------------------------------------------------------------------
+_DETAIL_KINDS = {Project: "project", Issue: "issue", Comment: "comment"}
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Issue)
+@receiver(post_save, sender=Comment)
+def bump_detail_version(sender, instance, **kwargs):
+    """Rend obsolètes les réponses de détail en cache de l’objet."""
+    bump_version(_DETAIL_KINDS[sender], instance.pk)
+
+
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Issue)
+@receiver(post_delete, sender=Comment)
+def evict_detail(sender, instance, **kwargs):
+    """Supprime les réponses de détail en cache d’un objet supprimé."""
+    if _purging.get():
+        return
+    evict(_DETAIL_KINDS[sender], instance.pk)
+
+
+@receiver(post_save, sender=Contributor)
+@receiver(post_delete, sender=Contributor)
+def bump_project_detail(sender, instance, **kwargs):
+    """La liste des contributeurs figure dans le détail du projet."""
+    if _purging.get():
+        return
+    bump_version("project", instance.project_id)
+
+
+# ---------------------------------------------------------------------
+# STATISTIQUES DE PROJET
+# ---------------------------------------------------------------------
+@receiver(post_save, sender=Issue)
+@receiver(post_delete, sender=Issue)
+@receiver(post_save, sender=Contributor)
+@receiver(post_delete, sender=Contributor)
+def refresh_project_stats(sender, instance, **kwargs):
+    """Issue modifiée ou assigné retiré (SET_NULL) : stats à recalculer."""
+    if _purging.get():
+        return
+    invalidate_project_stats(instance.project_id)
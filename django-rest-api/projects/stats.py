@@ -0,0 +1,102 @@
+"""
+Statistiques d’un projet pour le tableau de bord.
+Une seule requête groupée par assigné compte les issues par statut,
+priorité et étiquette (`Count(filter=...)`) ; les totaux du projet sont
+la somme de ces groupes. Le résultat est mis en cache et invalidé par
+les signaux à chaque écriture d’issue ou de contributeur.
+"""
+
+from django.core.cache import cache
+from django.db.models import Count, Q
+from projects.models import Issue
+from utils.db_routers import primary_reads
+
+PROJECT_STATS_TIMEOUT = 600
+
+# Dimensions ventilées : (clé de réponse, champ, choix du modèle)
+STATS_DIMENSIONS = (
+    ("by_status", "status", Issue.STATUS_CHOICES),
+    ("by_priority", "priority", Issue.PRIORITY_CHOICES),
+    ("by_tag", "tag", Issue.TAG_CHOICES),
+)
+
+
+def stats_cache_key(project_id):
+    """Clé de cache des statistiques d’un projet."""
+    return f"project_stats_{project_id}"
+
+
+def invalidate_project_stats(project_id):
+    """Supprime les statistiques en cache d’un projet."""
+    cache.delete(stats_cache_key(project_id))
+
+
+def _aggregates():
+    """Compteurs conditionnels nommés `<champ>__<valeur>`."""
+    return {
+        f"{field}__{value}": Count("id", filter=Q(**{field: value}))
+        for _, field, choices in STATS_DIMENSIONS
+        for value, _ in choices
+    }
+
+
+def _breakdown(row):
+    """Ventilation d’un groupe par dimension."""
+    return {
+        key: {value: row[f"{field}__{value}"] for value, _ in choices}
+        for key, field, choices in STATS_DIMENSIONS
+    }
+
+
+def compute_project_stats(project_id):
+    """
+    Calcule les statistiques d’un projet en une requête SQL.
+
+    Returns:
+        dict: `total`, `by_status`, `by_priority`, `by_tag` et
+        `by_assignee` (une entrée par assigné, None = non assignée).
+    """
+    rows = (
+        Issue.objects.filter(project_id=project_id)
+        .values(
+            "assignee_contributor_id",
+            "assignee_contributor__user__username",
+        )
+        .annotate(total=Count("id"), **_aggregates())
+        .order_by("assignee_contributor_id")
+    )
+
+    stats = {"project_id": project_id, "total": 0}
+    stats.update(
+        {
+            key: {value: 0 for value, _ in choices}
+            for key, _, choices in STATS_DIMENSIONS
+        }
+    )
+    stats["by_assignee"] = []
+    for row in rows:
+        breakdown = _breakdown(row)
+        stats["total"] += row["total"]
+        for key, counts in breakdown.items():
+            for value, count in counts.items():
+                stats[key][value] += count
+        stats["by_assignee"].append(
+            {
+                "assignee_contributor_id": row["assignee_contributor_id"],
+                "username": row["assignee_contributor__user__username"],
+                "total": row["total"],
+                "by_status": breakdown["by_status"],
+            }
+        )
+    return stats
+
+
+def get_project_stats(project_id):
+    """Statistiques d’un projet, servies par le cache si possible."""
+    key = stats_cache_key(project_id)
+    stats = cache.get(key)
+    if stats is None:
+        with primary_reads():
+            stats = compute_project_stats(project_id)
+        cache.set(key, stats, timeout=PROJECT_STATS_TIMEOUT)
+    return stats
@@ -0,0 +1,305 @@
+"""
+Synchronisation différentielle des issues et commentaires.
+Calcule, pour un utilisateur, les créations, modifications et suppressions
+survenues après un curseur, par pages bornées et via des index dédiés.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from projects.access import accessible_project_ids
+from projects.models import Comment, Issue, Tombstone
+from rest_framework.exceptions import ValidationError
+
+SYNC_PAGE_SIZE = 100
+SYNC_MAX_PAGE_SIZE = 500
+
+# Recouvrement relu après une page finale : une transaction validée après
+# une ligne plus récente (horodatage antérieur au commit) n’est pas perdue
+SYNC_OVERLAP_SECONDS = 5
+
+# Flux synchronisés : (nom, champ de date servant de curseur)
+STREAMS = (
+    ("issues", "updated_time"),
+    ("comments", "updated_time"),
+    ("deleted", "deleted_time"),
+)
+# Flux rattrapés depuis l’origine pour un projet nouvellement accessible
+# (ses suppressions antérieures ne concernent pas le client)
+BACKFILL_STREAMS = ("issues", "comments")
+
+
+# ---------------------------------------------------------------------
+# CURSEUR
+# ---------------------------------------------------------------------
+def _dump_position(position):
+    """Sérialise une position (date, id) en [date ISO, id]."""
+    moment, pk = position
+    return [moment.isoformat(), pk] if moment else None
+
+
+def encode_cursor(positions: dict, issued_at=None, membership=None) -> str:
+    """
+    Encode les positions (date, id) de chaque flux en curseur opaque.
+
+    `issued_at` (page finale uniquement) date l’émission du curseur : la
+    requête suivante relit la fenêtre de recouvrement qui la précède.
+    `membership` mémorise les projets déjà synchronisés (`projects`) et
+    ceux dont l’historique est en cours de rattrapage (`backfill`, avec
+    ses propres positions `fill`).
+    """
+    state = {
+        name: _dump_position(position) for name, position in positions.items()
+    }
+    if issued_at is not None:
+        state["at"] = issued_at.isoformat()
+    if membership is not None:
+        state["p"] = sorted(membership["projects"])
+        if membership["backfill"]:
+            state["b"] = sorted(membership["backfill"])
+            state["f"] = {
+                name: _dump_position(position)
+                for name, position in membership["fill"].items()
+            }
+    raw = json.dumps(state, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _parse_position(value):
+    """Convertit une position sérialisée [date ISO, id] en (datetime, id)."""
+    if value is None:
+        return None, 0
+    moment, pk = value
+    return datetime.fromisoformat(moment), int(pk)
+
+
+def _fresh_fill():
+    """Positions de rattrapage : tout l’historique des projets ajoutés."""
+    return {name: (None, 0) for name in BACKFILL_STREAMS}
+
+
+def _parse_membership(state):
+    """Lit les projets connus du client et le rattrapage en cours."""
+    if "p" not in state:
+        return None
+    fill = state.get("f") or {}
+    return {
+        "projects": {int(pk) for pk in state["p"]},
+        "backfill": {int(pk) for pk in state.get("b", ())},
+        "fill": {
+            name: _parse_position(fill.get(name)) for name in BACKFILL_STREAMS
+        },
+    }
+
+
+def decode_cursor(value: str | None) -> tuple:
+    """
+    Décode un curseur de synchronisation.
+
+    Accepte soit un curseur opaque renvoyé par l’API, soit une date ISO
+    8601 (`?since=2025-01-01T00:00:00Z`) appliquée à tous les flux.
+
+    Returns:
+        tuple: (positions par flux, date d’émission ou None, projets
+        connus et rattrapage en cours ou None)
+
+    Raises:
+        ValidationError: si la valeur n’est ni un curseur ni une date.
+    """
+    if not value:
+        return {name: (None, 0) for name, _ in STREAMS}, None, None
+
+    moment = parse_datetime(value)
+    if moment is not None:
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        return {name: (moment, 0) for name, _ in STREAMS}, None, None
+
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded))
+        issued_at = state.get("at")
+        return (
+            {name: _parse_position(state.get(name)) for name, _ in STREAMS},
+            datetime.fromisoformat(issued_at) if issued_at else None,
+            _parse_membership(state),
+        )
+    except (binascii.Error, ValueError, TypeError, AttributeError):
+        raise ValidationError(
+            {"since": "Curseur de synchronisation invalide."}
+        )
+
+
+def _rewind(position, issued_at):
+    """Recule une position au début de la fenêtre de recouvrement."""
+    moment, _ = position
+    horizon = issued_at - timedelta(seconds=SYNC_OVERLAP_SECONDS)
+    if moment is None or moment <= horizon:
+        return position
+    return horizon, 0
+
+
+def _after(queryset, field, position):
+    """Filtre les lignes strictement postérieures à (date, id)."""
+    moment, pk = position
+    if moment is None:
+        return queryset
+    return queryset.filter(
+        Q(**{f"{field}__gt": moment}) | Q(**{field: moment, "pk__gt": pk})
+    )
+
+
+# ---------------------------------------------------------------------
+# COLLECTE DES CHANGEMENTS
+# ---------------------------------------------------------------------
+def stream_querysets(project_ids, user_id=None):
+    """
+    Construit le queryset de chaque flux, restreint aux projets visibles.
+
+    Le flux des suppressions inclut aussi les pertes d’accès adressées à
+    l’utilisateur : projets retirés ou supprimés, devenus invisibles.
+    """
+    return {
+        "issues": Issue.objects.filter(
+            project_id__in=project_ids
+        ).select_related(
+            "project", "author_user", "assignee_contributor__user"
+        ),
+        "comments": Comment.objects.filter(
+            issue__project_id__in=project_ids
+        ).select_related("issue", "author_user"),
+        "deleted": Tombstone.objects.filter(
+            Q(project_id__in=project_ids, user_id=None) | Q(user_id=user_id)
+        ),
+    }
+
+
+def _membership(previous, current):
+    """
+    Projets synchronisés normalement et projets à rattraper.
+
+    Un projet accessible absent des projets connus du curseur (ajout
+    comme contributeur) est rattrapé depuis l’origine ; un nouvel ajout
+    pendant un rattrapage relance celui-ci pour tous ses projets.
+    """
+    if previous is None:
+        return {"projects": set(current), "backfill": set(), "fill": {}}
+    gained = current - previous["projects"] - previous["backfill"]
+    backfill = (previous["backfill"] | gained) & current
+    fill = previous["fill"] if not gained else _fresh_fill()
+    return {
+        "projects": current - backfill,
+        "backfill": backfill,
+        "fill": fill if backfill else {},
+    }
+
+
+def _page(queryset, field, position, limit):
+    """Lit au plus `limit` lignes après une position ; (lignes, suite)."""
+    rows = list(
+        _after(queryset, field, position).order_by(field, "pk")[: limit + 1]
+    )
+    if len(rows) > limit:
+        return rows[:limit], True
+    return rows, False
+
+
+def _backfill(membership, changes, field_of, limit):
+    """
+    Ajoute aux flux les lignes des projets en rattrapage.
+
+    Returns:
+        bool: True s’il reste des lignes à rattraper.
+    """
+    querysets = stream_querysets(membership["backfill"])
+    has_more = False
+    for name in BACKFILL_STREAMS:
+        room = limit - len(changes[name])
+        if room <= 0:
+            has_more = True
+            continue
+        rows, more = _page(
+            querysets[name], field_of[name], membership["fill"][name], room
+        )
+        has_more = has_more or more
+        if rows:
+            last = rows[-1]
+            membership["fill"][name] = (getattr(last, field_of[name]), last.pk)
+            changes[name] = changes[name] + rows
+    return has_more
+
+
+def _merge_backfill(membership, positions, caught_up):
+    """
+    Rattrapage terminé : les projets rejoignent les flux normaux.
+
+    Un flux normal lu jusqu’au bout (`caught_up`) avance jusqu’à la
+    dernière ligne rattrapée, pour ne pas la renvoyer une seconde fois.
+    """
+    for name in BACKFILL_STREAMS:
+        fill = membership["fill"][name]
+        current = positions[name]
+        if caught_up[name] and fill[0] is not None:
+            if current[0] is None or current < fill:
+                positions[name] = fill
+    membership["projects"] |= membership["backfill"]
+    membership["backfill"], membership["fill"] = set(), {}
+
+
+def collect_changes(user, cursor: str | None, limit: int):
+    """
+    Renvoie les changements postérieurs au curseur, flux par flux.
+
+    Chaque flux est parcouru dans l’ordre (date, id) et limité à `limit`
+    lignes : le coût dépend du nombre de changements, pas du volume total.
+
+    Le curseur d’une page finale relit les `SYNC_OVERLAP_SECONDS` qui
+    précèdent son émission : une ligne validée tardivement est renvoyée
+    au lieu d’être sautée (le client applique des mises à jour
+    idempotentes, un doublon est sans effet). Au sein d’une pagination
+    (`has_more`), les curseurs restent stricts et progressent toujours.
+
+    Le curseur mémorise aussi les projets accessibles : un projet gagné
+    depuis (ajout comme contributeur) voit ses issues et commentaires
+    antérieurs renvoyés, sur une pagination de rattrapage dédiée.
+
+    Returns:
+        tuple: (objets par flux, curseur suivant, has_more)
+    """
+    issued_at = timezone.now()
+    positions, previous_issue, previous = decode_cursor(cursor)
+    if previous_issue is not None:
+        positions = {
+            name: _rewind(position, previous_issue)
+            for name, position in positions.items()
+        }
+    membership = _membership(previous, set(accessible_project_ids(user)))
+    querysets = stream_querysets(membership["projects"], user.id)
+    field_of = dict(STREAMS)
+
+    changes, caught_up = {}, {}
+    for name, field in STREAMS:
+        rows, more = _page(querysets[name], field, positions[name], limit)
+        caught_up[name] = not more
+        if rows:
+            last = rows[-1]
+            positions[name] = (getattr(last, field), last.pk)
+        changes[name] = rows
+    has_more = not all(caught_up.values())
+    if membership["backfill"]:
+        if _backfill(membership, changes, field_of, limit):
+            has_more = True
+        else:
+            _merge_backfill(membership, positions, caught_up)
+
+    next_cursor = encode_cursor(
+        positions,
+        issued_at=None if has_more else issued_at,
+        membership=membership,
+    )
+    return changes, next_cursor, has_more
@@ -0,0 +1,156 @@
+"""
+Tâches en arrière-plan du module projects.
+Regroupent les effets de bord coûteux (invalidation de cache,
+suppressions en cascade) exécutés par le worker hors des requêtes.
+"""
+
+from functools import partial
+
+from django.conf import settings
+from jobs.queue import (
+    ProgressCounter,
+    delete_in_batches,
+    enqueue,
+    register,
+)
+from projects.access import invalidate_project_access
+from projects.detail_cache import evict_many
+from projects.models import Comment, Contributor, Issue, Project, Tombstone
+from projects.search import get_search_backend
+from projects.signals import bulk_purge
+from projects.stats import invalidate_project_stats
+from projects.warmup import warm_recent_users
+from utils.cache_tools import delete_cache_variants, safe_delete_pattern
+
+
+@register("projects.invalidate_user_caches")
+def invalidate_user_caches(user_ids):
+    """Supprime les listes de projets et d’issues en cache des utilisateurs."""
+    for user_id in user_ids:
+        delete_cache_variants(f"user_projects_{user_id}")
+        safe_delete_pattern(f"issues_user_{user_id}_project_*")
+
+
+# Versions de détail à oublier pour chaque lot purgé (`evict_detail`
+# est suspendu pendant `bulk_purge`)
+_PURGED_DETAIL_KINDS = {Comment: "comment", Issue: "issue"}
+
+
+def purge_querysets(project_id):
+    """Lignes dépendantes d’un projet, des feuilles vers la racine."""
+    return [
+        Comment.objects.filter(issue__project_id=project_id),
+        Issue.objects.filter(project_id=project_id),
+        Contributor.objects.filter(project_id=project_id),
+    ]
+
+
+@register("projects.purge_project")
+def purge_project(project_id, progress=None):
+    """
+    Supprime un projet marqué `deletion_pending` par lots bornés.
+
+    Commentaires, issues puis contributeurs sont supprimés lot par lot,
+    chacun dans sa transaction, avant le projet lui-même : aucune
+    cascade n’est chargée en mémoire d’un seul bloc. Les effets ligne à
+    ligne des signaux sont suspendus (`bulk_purge`) et remplacés par une
+    trace de projet unique et une suppression groupée de l’index : le
+    nombre de requêtes dépend du nombre de lots, pas du nombre de lignes.
+    Les versions de détail des lignes purgées sont oubliées lot par lot,
+    et chaque lot rafraîchit le verrou de la tâche (`ProgressCounter`).
+    """
+    user_ids = list(
+        Contributor.objects.filter(project_id=project_id).values_list(
+            "user_id", flat=True
+        )
+    )
+    querysets = purge_querysets(project_id)
+    if progress is None:
+        progress = ProgressCounter(sum(qs.count() for qs in querysets))
+
+    # Le comptage peut être long : signale la tâche vivante avant la purge
+    progress(0)
+    with bulk_purge():
+        for queryset in querysets:
+            kind = _PURGED_DETAIL_KINDS.get(queryset.model)
+            delete_in_batches(
+                queryset,
+                progress,
+                on_batch=kind and partial(evict_many, kind),
+            )
+    get_search_backend().remove_project(project_id)
+    Tombstone.objects.get_or_create(
+        kind="project",
+        object_id=project_id,
+        project_id=project_id,
+        user_id=None,
+    )
+    invalidate_project_stats(project_id)
+    for user_id in user_ids:
+        invalidate_project_access(user_id)
+    Project.objects.filter(pk=project_id).delete()
+    invalidate_user_caches(user_ids)
+
+
+def hide_projects(project_ids):
+    """
+    Marque des projets comme en cours de suppression et les masque.
+
+    Les tables d’accès et les listes en cache des membres sont
+    invalidées immédiatement, et chaque membre reçoit une trace de perte
+    d’accès : seule la purge passe par la file.
+    """
+    Project.objects.filter(pk__in=project_ids).update(deletion_pending=True)
+    members = list(
+        Contributor.objects.filter(project_id__in=project_ids).values_list(
+            "project_id", "user_id"
+        )
+    )
+    # Perte d’accès signalée à chaque membre (synchronisation), en un INSERT
+    Tombstone.objects.bulk_create(
+        Tombstone(
+            kind="project",
+            object_id=project_id,
+            project_id=project_id,
+            user_id=user_id,
+        )
+        for project_id, user_id in members
+    )
+    user_ids = sorted({user_id for _, user_id in members})
+    for user_id in user_ids:
+        invalidate_project_access(user_id)
+    invalidate_user_caches(user_ids)
+
+
+def schedule_cache_invalidation(user_id):
+    """Publie l’invalidation des caches d’un utilisateur (dédoublonnée)."""
+    enqueue(
+        "projects.invalidate_user_caches",
+        {"user_ids": [user_id]},
+        key=f"invalidate_user_caches_{user_id}",
+    )
+
+
+def schedule_project_deletion(project_id):
+    """
+    Masque un projet puis publie sa purge (une seule tâche par projet).
+
+    Returns:
+        Job | None: tâche publiée, None si exécutée immédiatement.
+    """
+    hide_projects([project_id])
+    return enqueue(
+        "projects.purge_project",
+        {"project_id": project_id},
+        key=f"purge_project_{project_id}",
+    )
+
+
+@register("projects.warm_cache")
+def warm_cache(limit=None):
+    """Préchauffe les caches des utilisateurs récemment actifs."""
+    warm_recent_users(
+        limit=limit or settings.CACHE_WARMUP_USERS,
+        workers=settings.CACHE_WARMUP_WORKERS,
+        rate=settings.CACHE_WARMUP_RATE,
+    )
@@ -0,0 +1,111 @@
+"""
+Tests de la table d’accès utilisateur → projets.
+Vérifie sa mise en cache, son invalidation lors des changements de
+contributeurs et l’absence de jointure sur les contributeurs en lecture.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from projects.access import access_cache_key, get_project_access
+from projects.models import Contributor, Issue, Project
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+# ---------------------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _user(username):
+    """Crée un utilisateur de test."""
+    return User.objects.create_user(
+        username=username,
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+
+
+@pytest.fixture
+def setup_data():
+    """Crée un auteur, un invité et un projet avec une issue."""
+    author, guest = _user("acl_author"), _user("acl_guest")
+    project = Project.objects.create(
+        title="Projet ACL",
+        description="desc",
+        type="BACK_END",
+        author_user=author,
+    )
+    Contributor.objects.create(
+        user=author, project=project, permission="AUTHOR", role="Auteur"
+    )
+    Issue.objects.create(
+        title="Issue ACL",
+        description="desc",
+        tag="BUG",
+        priority="LOW",
+        project=project,
+        author_user=author,
+    )
+    return {"author": author, "guest": guest, "project": project}
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+def test_access_map_is_cached(setup_data):
+    """La table est calculée une fois puis servie par le cache."""
+    author, project = setup_data["author"], setup_data["project"]
+    assert get_project_access(author) == {project.id: "AUTHOR"}
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert get_project_access(author) == {project.id: "AUTHOR"}
+    assert len(ctx.captured_queries) == 0
+
+
+def test_contributor_changes_invalidate_access(setup_data):
+    """Ajouter puis retirer un contributeur met à jour ses accès."""
+    guest, project = setup_data["guest"], setup_data["project"]
+    assert get_project_access(guest) == {}
+
+    contributor = Contributor.objects.create(
+        user=guest, project=project, permission="CONTRIBUTOR", role="C"
+    )
+    assert cache.get(access_cache_key(guest.id)) is None
+    assert get_project_access(guest) == {project.id: "CONTRIBUTOR"}
+
+    contributor.delete()
+    assert get_project_access(guest) == {}
+
+
+def test_issue_list_does_not_join_contributors(setup_data):
+    """La liste des issues filtre par projets sans joindre Contributor."""
+    client = APIClient()
+    client.force_authenticate(user=setup_data["author"])
+
+    with CaptureQueriesContext(connection) as ctx:
+        res = client.get(reverse("issue-list"))
+
+    assert res.status_code == 200
+    assert res.data["count"] == 1
+    issue_sql = [
+        q["sql"] for q in ctx.captured_queries if "projects_issue" in q["sql"]
+    ]
+    assert issue_sql
+    # Seule la jointure externe vers l’assigné subsiste
+    assert all(
+        'INNER JOIN "projects_contributor"' not in sql for sql in issue_sql
+    )
@@ -0,0 +1,134 @@
+"""
+Tests des indicateurs d’activité de la liste des issues (`?activity=1`).
+Vérifie les valeurs, l’absence de requête par ligne, la compatibilité
+avec `?fields=` et la fraîcheur après un nouveau commentaire.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from projects.access import get_project_access
+from projects.models import Comment, Contributor, Issue, Project
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+# ---------------------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def setup_data():
+    """Projet de deux issues, dont une commentée deux fois."""
+    user = User.objects.create_user(
+        username="activity_user",
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+    project = Project.objects.create(
+        title="Projet activité",
+        description="desc",
+        type="BACK_END",
+        author_user=user,
+    )
+    Contributor.objects.create(
+        user=user, project=project, permission="AUTHOR", role="Auteur"
+    )
+    busy, quiet = (
+        Issue.objects.create(
+            title=title,
+            description="desc",
+            tag="BUG",
+            priority="LOW",
+            project=project,
+            author_user=user,
+        )
+        for title in ("Active", "Calme")
+    )
+    for text in ("Premier", "Second"):
+        Comment.objects.create(description=text, issue=busy, author_user=user)
+
+    client = APIClient()
+    client.force_authenticate(user=user)
+    get_project_access(user)
+    return {
+        "client": client,
+        "user": user,
+        "project": project,
+        "busy": busy,
+        "quiet": quiet,
+    }
+
+
+def _list(client, **params):
+    """Liste des issues indexée par titre, et nombre de requêtes SQL."""
+    with CaptureQueriesContext(connection) as ctx:
+        res = client.get(reverse("issue-list"), params)
+    assert res.status_code == 200
+    items = {item["title"]: item for item in res.data["results"]}
+    return items, len(ctx.captured_queries)
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+def test_activity_fields_without_per_row_queries(setup_data):
+    """Valeurs exactes ; nombre de requêtes indépendant des lignes."""
+    client = setup_data["client"]
+    items, queries = _list(client, activity="1")
+
+    assert items["Active"]["comments_count"] == 2
+    assert items["Active"]["last_comment_time"] is not None
+    assert items["Calme"]["comments_count"] == 0
+    assert items["Calme"]["last_comment_time"] is None
+
+    for index in range(10):
+        Issue.objects.create(
+            title=f"Issue {index}",
+            description="desc",
+            tag="TASK",
+            priority="LOW",
+            project=setup_data["project"],
+            author_user=setup_data["user"],
+        )
+    assert _list(client, activity="1")[1] == queries
+
+
+def test_default_list_stays_lean_and_fields_apply(setup_data):
+    """Sans le drapeau, aucun champ d’activité ; `?fields=` reste valide."""
+    client = setup_data["client"]
+    items, _ = _list(client)
+    assert "comments_count" not in items["Active"]
+
+    res = client.get(
+        reverse("issue-list"), {"activity": "1", "fields": "id,comments_count"}
+    )
+    assert res.status_code == 200
+    assert set(res.data["results"][0]) == {"id", "comments_count"}
+
+
+def test_activity_is_fresh_after_new_comment(setup_data):
+    """Un nouveau commentaire est compté immédiatement."""
+    client = setup_data["client"]
+    _list(client, activity="1")
+    Comment.objects.create(
+        description="Troisième",
+        issue=setup_data["busy"],
+        author_user=setup_data["user"],
+    )
+
+    items, _ = _list(client, activity="1")
+    assert items["Active"]["comments_count"] == 3
@@ -0,0 +1,214 @@
+"""
+Tests des vues asynchrones en lecture (ASGI).
+Vérifie l’authentification (jeton Bearer seul), le quota utilisateur,
+le cloisonnement par projet, la pagination et les filtres partagés avec
+les vues DRF.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from oauth2_provider.models import AccessToken, Application
+from projects.models import Comment, Contributor, Issue, Project
+from projects.throttles import AsyncUserRateThrottle
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+# ---------------------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _user(username):
+    """Crée un utilisateur de test."""
+    return User.objects.create_user(
+        username=username,
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+
+
+@pytest.fixture
+def setup_data():
+    """Crée deux projets cloisonnés, avec issues et commentaire."""
+    author, other = _user("async_author"), _user("async_other")
+    project = Project.objects.create(
+        title="Projet async",
+        description="desc",
+        type="BACK_END",
+        author_user=author,
+    )
+    foreign = Project.objects.create(
+        title="Projet étranger",
+        description="desc",
+        type="FRONT_END",
+        author_user=other,
+    )
+    Contributor.objects.create(
+        user=author, project=project, permission="AUTHOR", role="Auteur"
+    )
+    Contributor.objects.create(
+        user=other, project=foreign, permission="AUTHOR", role="Auteur"
+    )
+    issues = [
+        Issue.objects.create(
+            title=f"Issue {i}",
+            description="desc",
+            tag="BUG",
+            priority="HIGH" if i % 2 else "LOW",
+            project=project,
+            author_user=author,
+        )
+        for i in range(12)
+    ]
+    foreign_issue = Issue.objects.create(
+        title="Issue étrangère",
+        description="desc",
+        tag="TASK",
+        priority="LOW",
+        project=foreign,
+        author_user=other,
+    )
+    comment = Comment.objects.create(
+        description="Commentaire", issue=issues[0], author_user=author
+    )
+    return {
+        "author": author,
+        "project": project,
+        "foreign": foreign,
+        "foreign_issue": foreign_issue,
+        "comment": comment,
+    }
+
+
+def _bearer(user, token):
+    """Crée un jeton OAuth2 valide et renvoie un client qui l’envoie."""
+    application = Application.objects.create(
+        name=f"async-{token}",
+        user=user,
+        client_type=Application.CLIENT_CONFIDENTIAL,
+        authorization_grant_type=Application.GRANT_PASSWORD,
+    )
+    AccessToken.objects.create(
+        user=user,
+        application=application,
+        token=token,
+        expires=timezone.now() + timedelta(hours=1),
+        scope="read write",
+    )
+    return Client(headers={"Authorization": f"Bearer {token}"})
+
+
+@pytest.fixture
+def client(setup_data):
+    """Client authentifié par jeton Bearer en tant qu’auteur."""
+    return _bearer(setup_data["author"], "author-token")
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+def test_requires_authentication():
+    """Sans jeton, la réponse est 401."""
+    res = Client().get(reverse("async-project-list"))
+    assert res.status_code == 401
+
+
+def test_bearer_token_authentication(setup_data):
+    """Un jeton OAuth2 valide authentifie la requête, pas la session."""
+    res = _bearer(setup_data["author"], "async-token").get(
+        reverse("async-project-list")
+    )
+    assert res.status_code == 200
+    assert [p["title"] for p in res.json()["results"]] == ["Projet async"]
+
+    session = Client()
+    session.force_login(setup_data["author"])
+    assert session.get(reverse("async-project-list")).status_code == 401
+
+    res = Client().get(
+        reverse("async-project-list"),
+        headers={"Authorization": "Bearer inconnu"},
+    )
+    assert res.status_code == 401
+
+
+def test_issue_list_is_paginated_and_filtered(client):
+    """Pagination au format DRF et filtres de IssueFilter."""
+    res = client.get(reverse("async-issue-list"))
+    data = res.json()
+    assert res.status_code == 200
+    assert data["count"] == 12
+    assert len(data["results"]) == 10
+    assert data["next"].endswith("?page=2")
+    assert data["previous"] is None
+
+    res = client.get(reverse("async-issue-list"), {"page": 2})
+    assert len(res.json()["results"]) == 2
+
+    res = client.get(reverse("async-issue-list"), {"priority": "HIGH"})
+    assert res.json()["count"] == 6
+
+    res = client.get(reverse("async-issue-list"), {"status": "INCONNU"})
+    assert res.status_code == 400
+    assert "status" in res.json()
+
+
+def test_detail_is_scoped_to_user_projects(client, setup_data):
+    """Les objets des autres projets répondent 404."""
+    res = client.get(
+        reverse("async-project-detail", args=[setup_data["project"].id])
+    )
+    assert res.status_code == 200
+    assert res.json()["contributors"][0]["username"] == "async_author"
+
+    for name, obj in (
+        ("async-project-detail", setup_data["foreign"]),
+        ("async-issue-detail", setup_data["foreign_issue"]),
+    ):
+        assert client.get(reverse(name, args=[obj.id])).status_code == 404
+
+    res = client.get(
+        reverse("async-comment-detail", args=[setup_data["comment"].id])
+    )
+    assert res.status_code == 200
+    assert res.json()["issue_title"] == "Issue 0"
+
+
+def test_empty_comment_list_keeps_envelope(client, setup_data):
+    """Aucun commentaire : pagination vide et message en clé supplémentaire."""
+    setup_data["comment"].delete()
+    data = client.get(reverse("async-comment-list")).json()
+    assert data["count"] == 0 and data["results"] == []
+    assert data["next"] is None and data["previous"] is None
+    assert data["detail"] == "Aucun commentaire trouvé."
+
+
+def test_user_rate_limit_is_shared_with_drf(client, setup_data, monkeypatch):
+    """Quota `user` de DRF : même historique, 429 une fois dépassé."""
+    monkeypatch.setattr(
+        AsyncUserRateThrottle, "THROTTLE_RATES", {"user": "2/day"}
+    )
+    url = reverse("async-project-list")
+    assert client.get(url).status_code == 200
+    assert client.get(url).status_code == 200
+
+    res = client.get(url)
+    assert res.status_code == 429
+    assert int(res["Retry-After"]) > 0
+    key = f"throttle_user_{setup_data['author'].pk}"
+    assert len(cache.get(key)) == 2
@@ -73,7 +73,7 @@ def clear_cache():
 # ---------------------------------------------------------------------
 # TESTS DU CACHE PROJETS
 # ---------------------------------------------------------------------
-def test_project_cache_created_and_used(api_client, user_setup):
+def test_project_cache_created_and_used(api_client, user_setup, capsys):
     """Vérifie la création et la réutilisation du cache projet."""
     client = api_client
     user = user_setup["user"]
@@ -90,6 +90,8 @@ def test_project_cache_created_and_used(api_client, user_setup):
     # Deuxième requête : doit réutiliser le cache
     client.get(url)
     assert cache.get(cache_key) is not None, "Le cache n’a pas été réutilisé."
+    # Aucune trace sur la sortie standard à chaque requête
+    assert capsys.readouterr().out == ""
 
 
 def test_project_cache_invalidation_on_create(api_client, user_setup):
@@ -113,6 +115,40 @@ def test_project_cache_invalidation_on_create(api_client, user_setup):
     assert cache.get(cache_key) is None, "Le cache projet n’a pas été vidé."
 
 
+def _no_delete_pattern(pattern):
+    """Simule un backend sans suppression par motif."""
+    raise AttributeError("delete_pattern")
+
+
+def test_project_variants_invalidated_without_clear(
+    api_client, user_setup, monkeypatch
+):
+    """Variantes (?fields=) invalidées sans motif ni vidage du cache."""
+    client = api_client
+    client.force_authenticate(user=user_setup["user"])
+    url = reverse("project-list") + "?fields=id,title"
+    assert len(client.get(url).data["results"]) == 1
+
+    cache.set("autre_entree", "conservée")
+    # Backend sans delete_pattern : aucun repli sur un vidage global
+    with monkeypatch.context() as patch:
+        patch.setattr(cache, "clear", lambda: pytest.fail("cache.clear"))
+        patch.setattr(cache, "delete_pattern", _no_delete_pattern)
+        client.post(
+            reverse("project-list"),
+            {
+                "title": "Projet Variante",
+                "description": "desc",
+                "type": "BACK_END",
+            },
+            format="json",
+        )
+
+    titles = [p["title"] for p in client.get(url).data["results"]]
+    assert "Projet Variante" in titles
+    assert cache.get("autre_entree") == "conservée"
+
+
 def test_project_cache_performance_gain(api_client, user_setup):
     """Compare les temps d’accès avec et sans cache."""
     client = api_client
@@ -0,0 +1,190 @@
+"""
+Tests de la suppression différée des projets et des comptes.
+Vérifie le masquage immédiat, la purge par lots via le worker, le
+suivi d’avancement de la tâche et le coût par lot (et non par ligne)
+de la purge.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from jobs.models import Job
+from jobs.queue import claim_next, run_job
+from projects.detail_cache import version_key
+from projects.models import Comment, Contributor, Issue, Project, Tombstone
+from projects.search import search
+from projects.tasks import purge_project
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+# ---------------------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def deferred_jobs(settings):
+    """Exécute les tâches via le worker, par petits lots."""
+    settings.JOBS_EAGER = False
+    settings.JOBS_DELETE_BATCH_SIZE = 2
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def setup_data():
+    """Crée un projet avec cinq issues commentées."""
+    user = User.objects.create_user(
+        username="purge_user",
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+    project = Project.objects.create(
+        title="Projet Purge",
+        description="desc",
+        type="BACK_END",
+        author_user=user,
+    )
+    Contributor.objects.create(
+        user=user, project=project, permission="AUTHOR", role="Auteur"
+    )
+    for index in range(5):
+        issue = Issue.objects.create(
+            title=f"Issue {index}",
+            description="desc",
+            tag="BUG",
+            priority="LOW",
+            project=project,
+            author_user=user,
+        )
+        Comment.objects.create(
+            description="Commentaire", issue=issue, author_user=user
+        )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return {"client": client, "user": user, "project": project}
+
+
+def _run_worker():
+    """Exécute toutes les tâches dues."""
+    while (job := claim_next("test")) is not None:
+        run_job(job)
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+def test_project_is_hidden_then_purged_in_batches(setup_data):
+    """Le projet disparaît des listes aussitôt, puis est purgé."""
+    client, project = setup_data["client"], setup_data["project"]
+    user_id = setup_data["user"].id
+    client.get(reverse("project-list"))
+    client.get(reverse("issue-list"))
+    assert cache.get(f"user_projects_{user_id}") is not None
+
+    res = client.delete(reverse("project-detail", args=[project.id]))
+    assert res.status_code == 202
+    # Listes invalidées dans la requête : seule la purge est en file
+    assert cache.get(f"user_projects_{user_id}") is None
+    assert cache.get(f"issues_user_{user_id}_project_all") is None
+    assert list(Job.objects.values_list("name", flat=True)) == [
+        "projects.purge_project"
+    ]
+    assert client.get(reverse("issue-list")).status_code == 403
+    assert Issue.objects.filter(project=project).count() == 5
+
+    _run_worker()
+
+    job = Job.objects.get(pk=res.data["job_id"])
+    assert job.status == Job.DONE
+    assert job.progress == {"done": 11, "total": 11}
+    assert not Project.objects.filter(pk=project.id).exists()
+    assert not Comment.objects.exists()
+
+
+def test_user_deletion_deactivates_then_purges(setup_data):
+    """Le compte est désactivé immédiatement puis supprimé avec ses données."""
+    client, user = setup_data["client"], setup_data["user"]
+
+    res = client.delete(f"/api/users/{user.id}/")
+    assert res.status_code == 202
+    user.refresh_from_db()
+    assert user.deletion_pending and not user.is_active
+
+    _run_worker()
+
+    assert not User.objects.filter(pk=user.id).exists()
+    assert not Project.objects.exists()
+    job = Job.objects.get(name="users.purge_user")
+    assert job.progress == {"done": 11, "total": 11}
+
+
+def _purge_queries(user, comments):
+    """Purge un projet d’une issue et `comments` commentaires."""
+    project = Project.objects.create(
+        title=f"Projet {comments}",
+        description="desc",
+        type="BACK_END",
+        author_user=user,
+    )
+    Contributor.objects.create(
+        user=user, project=project, permission="AUTHOR", role="Auteur"
+    )
+    issue = Issue.objects.create(
+        title="Recherchable",
+        description="desc",
+        tag="BUG",
+        priority="LOW",
+        project=project,
+        author_user=user,
+    )
+    for index in range(comments):
+        Comment.objects.create(
+            description=f"Recherchable {index}", issue=issue, author_user=user
+        )
+    with CaptureQueriesContext(connection) as ctx:
+        purge_project(project.id)
+    assert Tombstone.objects.filter(project_id=project.id).count() == 1
+    return len(ctx.captured_queries)
+
+
+def test_purge_cost_does_not_depend_on_rows(setup_data, settings):
+    """Une trace de projet, aucun effet ligne à ligne, index vidé."""
+    settings.JOBS_DELETE_BATCH_SIZE = 500
+    user = setup_data["user"]
+    Tombstone.objects.all().delete()
+
+    assert _purge_queries(user, 1) == _purge_queries(user, 20)
+    assert not Tombstone.objects.exclude(kind="project").exists()
+    assert search("Recherchable") == []
+
+
+def test_purge_forgets_detail_versions_and_heartbeats(setup_data, monkeypatch):
+    """Versions de détail oubliées par lot, verrou rafraîchi par lot."""
+    client, project = setup_data["client"], setup_data["project"]
+    issue = Issue.objects.filter(project=project).first()
+    comment = Comment.objects.filter(issue=issue).get()
+    client.get(reverse("issue-detail", args=[issue.id]))
+    client.get(reverse("comment-detail", args=[comment.id]))
+    assert cache.get(version_key("issue", issue.id)) is not None
+    assert cache.get(version_key("comment", comment.id)) is not None
+
+    heartbeats = []
+    monkeypatch.setattr(
+        "jobs.queue.report_progress",
+        lambda **progress: heartbeats.append(progress),
+    )
+    client.delete(reverse("project-detail", args=[project.id]))
+    _run_worker()
+
+    assert cache.get(version_key("issue", issue.id)) is None
+    assert cache.get(version_key("comment", comment.id)) is None
+    # Une pulsation avant la purge puis une par lot (3 + 3 + 1)
+    assert heartbeats[0] == {"done": 0, "total": 11}
+    assert len(heartbeats) == 8
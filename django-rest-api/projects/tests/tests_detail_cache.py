@@ -0,0 +1,163 @@
+"""
+Tests du cache des réponses de détail.
+Vérifie la lecture sans requête SQL, l’écriture immédiate après
+modification, l’invalidation par le parent, l’éviction à la suppression
+et le contrôle d’accès sur une entrée en cache.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from projects.access import get_project_access
+from projects.detail_cache import bump_version, get_version
+from projects.models import Contributor, Issue, Project
+from projects.views import IssueViewSet
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _user(username):
+    """Crée un utilisateur de test."""
+    return User.objects.create_user(
+        username=username,
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+
+
+@pytest.fixture
+def setup_data():
+    """Projet avec une issue, son auteur et un utilisateur étranger."""
+    author, outsider = _user("detail_author"), _user("detail_outsider")
+    project = Project.objects.create(
+        title="Projet détail",
+        description="desc",
+        type="BACK_END",
+        author_user=author,
+    )
+    Contributor.objects.create(
+        user=author, project=project, permission="AUTHOR", role="Auteur"
+    )
+    issue = Issue.objects.create(
+        title="Issue détail",
+        description="desc",
+        tag="BUG",
+        priority="LOW",
+        project=project,
+        author_user=author,
+    )
+    return {
+        "author": author,
+        "outsider": outsider,
+        "project": project,
+        "issue": issue,
+    }
+
+
+def _client(user):
+    """Client authentifié, table d’accès déjà en cache."""
+    client = APIClient()
+    client.force_authenticate(user=user)
+    get_project_access(user)
+    return client
+
+
+def test_cached_detail_and_write_through(setup_data):
+    """Deuxième lecture sans SQL ; la modification est servie aussitôt."""
+    client = _client(setup_data["author"])
+    url = reverse("issue-detail", args=[setup_data["issue"].id])
+
+    assert client.get(url).status_code == 200
+    with CaptureQueriesContext(connection) as ctx:
+        res = client.get(url)
+    assert res.status_code == 200
+    assert len(ctx.captured_queries) == 0
+
+    res = client.patch(url, {"title": "Nouveau titre"}, format="json")
+    assert res.status_code == 200
+    with CaptureQueriesContext(connection) as ctx:
+        res = client.get(url)
+    assert res.data["title"] == "Nouveau titre"
+    assert len(ctx.captured_queries) == 0
+
+
+def test_parent_change_and_delete_invalidate(setup_data, monkeypatch):
+    """Le titre du projet recopié suit ; une issue supprimée renvoie 404."""
+    patterns = []
+    delete_pattern = cache.delete_pattern
+    monkeypatch.setattr(
+        cache,
+        "delete_pattern",
+        lambda pattern: patterns.append(pattern) or delete_pattern(pattern),
+    )
+    client = _client(setup_data["author"])
+    project, issue = setup_data["project"], setup_data["issue"]
+    url = reverse("issue-detail", args=[issue.id])
+    client.get(url)
+
+    project.title = "Projet renommé"
+    project.save()
+    assert client.get(url).data["project_title"] == "Projet renommé"
+
+    assert client.delete(url).status_code == 200
+    assert client.get(url).status_code == 404
+    # Éviction par la seule clé de version, sans balayage par motif
+    assert not [p for p in patterns if p.startswith("detail_")]
+
+
+def test_cached_detail_requires_project_access(setup_data):
+    """Une entrée en cache n’est jamais servie à un non-contributeur."""
+    url = reverse("project-detail", args=[setup_data["project"].id])
+    assert _client(setup_data["author"]).get(url).status_code == 200
+
+    res = _client(setup_data["outsider"]).get(url)
+    assert res.status_code in (403, 404)
+
+
+def test_version_bumped_again_after_commit(
+    setup_data, django_capture_on_commit_callbacks
+):
+    """Une écriture incrémente la version, puis de nouveau au commit."""
+    issue = setup_data["issue"]
+    before = get_version("issue", issue.id)
+    with django_capture_on_commit_callbacks(execute=True):
+        issue.title = "Renommée"
+        issue.save()
+        assert get_version("issue", issue.id) == before + 1
+    assert get_version("issue", issue.id) == before + 2
+
+
+def test_concurrent_commit_during_load_is_not_cached(setup_data, monkeypatch):
+    """Un état lu avant un commit concurrent n’est pas rangé en cache."""
+    client = _client(setup_data["author"])
+    issue = setup_data["issue"]
+    url = reverse("issue-detail", args=[issue.id])
+    get_object = IssueViewSet.get_object
+
+    def get_object_then_commit(view):
+        """Charge l’issue, puis un autre processus la modifie."""
+        instance = get_object(view)
+        Issue.objects.filter(pk=issue.id).update(title="Concurrente")
+        bump_version("issue", issue.id)
+        return instance
+
+    with monkeypatch.context() as patch:
+        patch.setattr(IssueViewSet, "get_object", get_object_then_commit)
+        assert client.get(url).data["title"] == "Issue détail"
+
+    res = client.get(url)
+    assert res.data["title"] == "Concurrente"
@@ -0,0 +1,161 @@
+"""
+Tests des requêtes par action (liste / détail) des projets et issues.
+Vérifie que les actions de détail ne relisent jamais la liste en cache,
+et que leur nombre de requêtes ne dépend pas du nombre d’objets (même
+plafond pour deux tailles de projet).
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from projects.access import get_project_access
+from projects.models import Contributor, Issue, Project
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+# (liste, détail, action, plafond de requêtes SQL signaux compris).
+# Suppression d’un projet exclue : le traitement par lots des issues
+# relève de la tâche `schedule_project_deletion`.
+CASES = [
+    ("issue-list", "issue-detail", "retrieve", 1),
+    ("issue-list", "issue-detail", "partial_update", 6),
+    ("issue-list", "issue-detail", "destroy", 6),
+    ("project-list", "project-detail", "retrieve", 3),
+    ("project-list", "project-detail", "partial_update", 5),
+]
+# Tailles de projet (nombre d’issues) comparées
+DATASET_SIZES = [5, 50]
+
+
+# ---------------------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def setup_data(request):
+    """Projet d’issues assignées (50 par défaut), avec son auteur."""
+    size = getattr(request, "param", 50)
+    user = User.objects.create_user(
+        username="query_tester",
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+    project = Project.objects.create(
+        title="Projet requêtes",
+        description="desc",
+        type="BACK_END",
+        author_user=user,
+    )
+    contributor = Contributor.objects.create(
+        user=user, project=project, permission="AUTHOR", role="Auteur"
+    )
+    Issue.objects.bulk_create(
+        Issue(
+            title=f"Issue {i}",
+            description="desc",
+            tag="BUG",
+            priority="LOW",
+            project=project,
+            author_user=user,
+            assignee_contributor=contributor,
+        )
+        for i in range(size)
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return {"client": client, "user": user, "project": project}
+
+
+def _list_reads(monkeypatch):
+    """Enregistre les lectures de clés de listes dans le cache."""
+    reads = []
+    original_get = cache.get
+
+    def spy(key, *args, **kwargs):
+        if key.startswith(("user_projects_", "issues_user_")):
+            reads.append(key)
+        return original_get(key, *args, **kwargs)
+
+    monkeypatch.setattr(cache, "get", spy)
+    return reads
+
+
+def _run(client, action, url):
+    """Exécute une action de détail et renvoie (réponse, requêtes)."""
+    with CaptureQueriesContext(connection) as ctx:
+        if action == "retrieve":
+            res = client.get(url)
+        elif action == "partial_update":
+            res = client.patch(url, {"title": "Modifié"}, format="json")
+        else:
+            res = client.delete(url)
+    return res, len(ctx.captured_queries)
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+@pytest.mark.parametrize("setup_data", DATASET_SIZES, indirect=True)
+@pytest.mark.parametrize("list_name, detail_name, action, max_queries", CASES)
+def test_detail_actions_skip_list_cache(
+    setup_data, monkeypatch, list_name, detail_name, action, max_queries
+):
+    """Aucune lecture de liste ; plafond indépendant de la taille du projet."""
+    client = setup_data["client"]
+    assert client.get(reverse(list_name)).status_code == 200
+
+    if detail_name == "issue-detail":
+        target = Issue.objects.order_by("id").first().id
+    else:
+        target = setup_data["project"].id
+    reads = _list_reads(monkeypatch)
+
+    res, queries = _run(client, action, reverse(detail_name, args=[target]))
+
+    assert res.status_code == 200
+    assert reads == []
+    assert queries <= max_queries
+
+
+def test_list_action_still_uses_cache(setup_data):
+    """La liste reste servie par le cache, sans requête SQL."""
+    client = setup_data["client"]
+    url = reverse("issue-list")
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as ctx:
+        res = client.get(url)
+
+    assert res.data["count"] == 50
+    assert len(ctx.captured_queries) == 0
+
+
+@pytest.mark.parametrize(
+    "name, max_queries", [("comment-list", 2), ("contributor-list", 1)]
+)
+def test_list_actions_skip_existence_prechecks(setup_data, name, max_queries):
+    """Liste : une requête de données (et un comptage), sans `exists()`."""
+    client = setup_data["client"]
+    get_project_access(setup_data["user"])
+    with CaptureQueriesContext(connection) as ctx:
+        res = client.get(reverse(name))
+
+    assert res.status_code == 200
+    assert len(ctx.captured_queries) <= max_queries
+    assert not any("LIMIT 1" in q["sql"] for q in ctx.captured_queries)
+    if name == "comment-list":
+        assert res.data["count"] == 0 and res.data["results"] == []
+        assert res.data["detail"] == "Aucun commentaire trouvé."
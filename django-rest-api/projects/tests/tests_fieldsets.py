@@ -0,0 +1,115 @@
+"""
+Tests de la sélection partielle des champs (?fields= / ?exclude=).
+Vérifie la réduction des réponses et des requêtes SQL associées.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from projects.models import Contributor, Issue, Project
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+# ---------------------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def setup_data():
+    """Crée un auteur, un projet et une issue assignée."""
+    user = User.objects.create_user(
+        username="sparse_user",
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+    project = Project.objects.create(
+        title="Projet Sparse",
+        description="desc",
+        type="BACK_END",
+        author_user=user,
+    )
+    contributor = Contributor.objects.create(
+        user=user, project=project, permission="AUTHOR", role="Auteur"
+    )
+    Issue.objects.create(
+        title="Issue Sparse",
+        description="Une description très longue",
+        tag="BUG",
+        priority="LOW",
+        project=project,
+        author_user=user,
+        assignee_contributor=contributor,
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return {"client": client, "user": user, "project": project}
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+def test_issue_list_fields_trim_output_and_select(setup_data):
+    """Seuls les champs demandés sont rendus et lus en base."""
+    url = reverse("issue-list") + "?fields=id,title,status"
+
+    with CaptureQueriesContext(connection) as ctx:
+        res = setup_data["client"].get(url)
+
+    assert res.status_code == 200
+    assert set(res.data["results"][0]) == {"id", "title", "status"}
+
+    issue_sql = next(
+        q["sql"]
+        for q in ctx.captured_queries
+        if '"projects_issue"."title"' in q["sql"] and "COUNT" not in q["sql"]
+    )
+    assert '"projects_issue"."description"' not in issue_sql
+    assert "users_user" not in issue_sql
+
+
+def test_exclude_removes_fields(setup_data):
+    """?exclude= retire les champs listés."""
+    url = reverse("project-list") + "?exclude=author_username"
+    res = setup_data["client"].get(url)
+
+    assert res.status_code == 200
+    assert set(res.data["results"][0]) == {"id", "title", "type"}
+
+
+def test_nested_contributors_are_prefetched(setup_data):
+    """Les contributeurs imbriqués restent disponibles en mode partiel."""
+    project = setup_data["project"]
+    url = reverse("project-detail", args=[project.id])
+    res = setup_data["client"].get(url + "?fields=title,contributors")
+
+    assert res.status_code == 200
+    assert set(res.data) == {"title", "contributors"}
+    assert res.data["contributors"][0]["username"] == "sparse_user"
+
+
+def test_unknown_field_returns_400(setup_data):
+    """Un champ inconnu est refusé explicitement."""
+    res = setup_data["client"].get(reverse("issue-list") + "?fields=nope")
+    assert res.status_code == 400
+    assert "nope" in str(res.data["fields"])
+
+
+def test_user_list_supports_fields(setup_data):
+    """Les viewsets du module users acceptent aussi ?fields=."""
+    res = setup_data["client"].get("/api/users/?fields=username")
+    assert res.status_code == 200
+    assert res.data["results"] == [{"username": "sparse_user"}]
@@ -0,0 +1,144 @@
+"""
+Tests des filtres et tris de la liste des issues.
+Vérifie la validation des paramètres, le filtrage combiné et la
+normalisation des clés de cache.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from projects.filters import IssueFilter
+from projects.models import Contributor, Issue, Project
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+# ---------------------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def setup_data():
+    """Crée un projet avec trois issues de statuts et priorités variés."""
+    user = User.objects.create_user(
+        username="filter_user",
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+    project = Project.objects.create(
+        title="Projet Filtres",
+        description="desc",
+        type="BACK_END",
+        author_user=user,
+    )
+    contributor = Contributor.objects.create(
+        user=user, project=project, permission="AUTHOR", role="Auteur"
+    )
+    for title, status, priority, assignee in (
+        ("A", "TODO", "HIGH", contributor),
+        ("B", "IN_PROGRESS", "HIGH", None),
+        ("C", "FINISHED", "LOW", contributor),
+    ):
+        Issue.objects.create(
+            title=title,
+            description="desc",
+            tag="BUG",
+            status=status,
+            priority=priority,
+            project=project,
+            author_user=user,
+            assignee_contributor=assignee,
+        )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return {"client": client, "contributor": contributor}
+
+
+def _titles(client, **params):
+    """Renvoie les titres listés pour des paramètres donnés."""
+    res = client.get(reverse("issue-list"), params)
+    assert res.status_code == 200
+    return [issue["title"] for issue in res.data["results"]]
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+def test_combined_filters(setup_data):
+    """Les filtres se combinent et acceptent plusieurs valeurs."""
+    client = setup_data["client"]
+    contributor = setup_data["contributor"]
+
+    assert _titles(client, status="TODO,IN_PROGRESS", ordering="title") == [
+        "A",
+        "B",
+    ]
+    assert _titles(
+        client, priority="HIGH", assignee_contributor=contributor.id
+    ) == ["A"]
+    assert _titles(client, created_after="2000-01-01", ordering="-title") == [
+        "C",
+        "B",
+        "A",
+    ]
+    assert _titles(client, created_before="2000-01-01") == []
+
+
+def test_invalid_values_are_rejected(setup_data):
+    """Valeurs hors choix, identifiants et tris inconnus renvoient 400."""
+    res = setup_data["client"].get(
+        reverse("issue-list"),
+        {"status": "DONE", "project": "abc", "ordering": "description"},
+    )
+    assert res.status_code == 400
+    assert set(res.data) == {"status", "project", "ordering"}
+
+
+def test_equivalent_queries_share_cache_key():
+    """L’ordre des paramètres et des valeurs n’influe pas sur la clé."""
+    first = IssueFilter({"status": "TODO,FINISHED", "priority": "LOW"})
+    second = IssueFilter({"priority": "LOW", "status": "FINISHED,TODO"})
+    assert first.cache_params() == second.cache_params()
+    assert first.cache_params() != IssueFilter({}).cache_params()
+
+
+def test_filters_only_parsed_for_list(setup_data, monkeypatch):
+    """Hors liste, les paramètres de filtre ne sont ni lus ni validés."""
+    client, contributor = setup_data["client"], setup_data["contributor"]
+    built = []
+    monkeypatch.setattr(
+        "projects.views.IssueFilter",
+        lambda params: built.append(params) or IssueFilter(params),
+    )
+    url = reverse("issue-list") + "?status=INCONNU"
+
+    res = client.post(
+        url,
+        {
+            "title": "D",
+            "description": "desc",
+            "tag": "BUG",
+            "priority": "LOW",
+            "project": contributor.project_id,
+        },
+        format="json",
+    )
+    assert res.status_code == 201
+    assert client.options(url).status_code == 200
+    issue_url = reverse("issue-detail", args=[Issue.objects.first().id])
+    assert client.get(issue_url, {"status": "INCONNU"}).status_code == 200
+    assert built == []
+
+    assert client.get(url).status_code == 400
+    assert len(built) == 1
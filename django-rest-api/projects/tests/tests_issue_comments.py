@@ -0,0 +1,116 @@
+"""
+Tests du fil de commentaires d’une issue (/api/issues/{id}/comments/).
+Vérifie l’ordre chronologique, la pagination par curseur, le nombre de
+requêtes (contrôle d’appartenance + une requête) et le cloisonnement.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from projects.access import get_project_access
+from projects.models import Comment, Contributor, Issue, Project
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _user(username):
+    """Crée un utilisateur de test."""
+    return User.objects.create_user(
+        username=username,
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+
+
+def _client(user):
+    """Client authentifié, table d’accès déjà en cache."""
+    client = APIClient()
+    client.force_authenticate(user=user)
+    get_project_access(user)
+    return client
+
+
+@pytest.fixture
+def setup_data():
+    """Issue commentée cinq fois, plus une autre issue commentée."""
+    author, outsider = _user("thread_author"), _user("thread_outsider")
+    project = Project.objects.create(
+        title="Projet fil",
+        description="desc",
+        type="BACK_END",
+        author_user=author,
+    )
+    Contributor.objects.create(
+        user=author, project=project, permission="AUTHOR", role="Auteur"
+    )
+    issue, other = (
+        Issue.objects.create(
+            title=title,
+            description="desc",
+            tag="BUG",
+            priority="LOW",
+            project=project,
+            author_user=author,
+        )
+        for title in ("Fil", "Autre")
+    )
+    comments = [
+        Comment.objects.create(
+            description=f"Message {i}", issue=issue, author_user=author
+        )
+        for i in range(5)
+    ]
+    Comment.objects.create(
+        description="Ailleurs", issue=other, author_user=author
+    )
+    return {
+        "author": author,
+        "outsider": outsider,
+        "issue": issue,
+        "comments": comments,
+    }
+
+
+def test_thread_is_chronological_and_paginated(setup_data):
+    """Deux requêtes par page, ordre chronologique, curseur complet."""
+    client = _client(setup_data["author"])
+    url = reverse("issue-comments", args=[setup_data["issue"].id])
+
+    with CaptureQueriesContext(connection) as ctx:
+        res = client.get(url, {"page_size": 3})
+    assert res.status_code == 200
+    assert len(ctx.captured_queries) == 2
+    ids = [item["id"] for item in res.data["results"]]
+    assert res.data["results"][0]["author_username"] == "thread_author"
+
+    res = client.get(res.data["next"])
+    ids += [item["id"] for item in res.data["results"]]
+    assert ids == [comment.id for comment in setup_data["comments"]]
+    assert res.data["next"] is None
+
+    res = client.get(url, {"fields": "id,description"})
+    assert set(res.data["results"][0]) == {"id", "description"}
+
+
+def test_thread_hidden_from_non_contributors(setup_data):
+    """Non-contributeur ou issue inconnue : 404."""
+    client = _client(setup_data["outsider"])
+    url = reverse("issue-comments", args=[setup_data["issue"].id])
+    assert client.get(url).status_code == 404
+
+    client = _client(setup_data["author"])
+    assert client.get(reverse("issue-comments", args=[0])).status_code == 404
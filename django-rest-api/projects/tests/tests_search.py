@@ -0,0 +1,157 @@
+"""
+Tests de la recherche plein texte (/api/search/).
+Vérifie la tenue à jour de l’index, le classement et le filtrage
+par projets accessibles.
+"""
+
+import pytest
+from django.urls import reverse
+from projects.models import Comment, Contributor, Issue, Project
+from projects.search import (
+    SEARCH_MAX_RESULTS,
+    FallbackSearchBackend,
+    filter_matching,
+    search,
+)
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+# ---------------------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------------------
+def _user(username):
+    """Crée un utilisateur de test."""
+    return User.objects.create_user(
+        username=username,
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+
+
+@pytest.fixture
+def setup_data():
+    """Crée deux projets, chacun avec une issue et un commentaire."""
+    alice, bob = _user("alice_search"), _user("bob_search")
+    issues = []
+    for owner, title in ((alice, "Connexion"), (bob, "Paiement")):
+        project = Project.objects.create(
+            title=f"Projet {title}",
+            description="desc",
+            type="BACK_END",
+            author_user=owner,
+        )
+        Contributor.objects.create(
+            user=owner, project=project, permission="AUTHOR", role="Auteur"
+        )
+        issues.append(
+            Issue.objects.create(
+                title=f"Erreur de {title.lower()}",
+                description="Le formulaire renvoie une erreur 500.",
+                tag="BUG",
+                priority="HIGH",
+                project=project,
+                author_user=owner,
+            )
+        )
+    Comment.objects.create(
+        description="Réglé par la mise à jour du certificat.",
+        issue=issues[0],
+        author_user=alice,
+    )
+    client = APIClient()
+    client.force_authenticate(user=alice)
+    return {"client": client, "issues": issues}
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+def test_search_returns_only_accessible_projects(setup_data):
+    """Les résultats sont limités aux projets de l’utilisateur."""
+    res = setup_data["client"].get(reverse("search"), {"q": "erreur"})
+
+    assert res.status_code == 200
+    assert [r["id"] for r in res.data["results"]] == [
+        setup_data["issues"][0].id
+    ]
+
+
+def test_title_match_ranks_before_description(setup_data):
+    """Un terme présent dans le titre est mieux classé."""
+    issue = setup_data["issues"][0]
+    Issue.objects.create(
+        title="Autre sujet",
+        description="Problème de connexion intermittent.",
+        tag="BUG",
+        priority="LOW",
+        project=issue.project,
+        author_user=issue.author_user,
+    )
+    results = search("connexion")
+    assert results[0]["id"] == issue.id
+    assert len(results) == 2
+
+
+def test_index_follows_updates_and_deletes(setup_data):
+    """Modifications et suppressions sont répercutées dans l’index."""
+    comment = Comment.objects.get()
+    assert search("certificat", kinds=["comment"])[0]["id"] == comment.id
+
+    comment.description = "Corrigé côté serveur."
+    comment.save()
+    assert search("certificat") == []
+    assert search("serveur")[0]["type"] == "comment"
+
+    setup_data["issues"][0].delete()
+    assert search("serveur") == []
+
+
+def test_search_accent_insensitive_and_prefix(setup_data):
+    """Les accents et les préfixes sont gérés."""
+    assert search("regle")[0]["type"] == "comment"
+    assert search("paie")[0]["id"] == setup_data["issues"][1].id
+
+
+def test_superuser_search_skips_projects_being_deleted(setup_data):
+    """Un superutilisateur ne voit pas les projets en cours de purge."""
+    admin = _user("admin_search")
+    admin.is_superuser = True
+    admin.save()
+    client = APIClient()
+    client.force_authenticate(user=admin)
+    hidden, visible = setup_data["issues"]
+    Project.objects.filter(pk=hidden.project_id).update(deletion_pending=True)
+
+    res = client.get(reverse("search"), {"q": "erreur"})
+    assert [r["id"] for r in res.data["results"]] == [visible.id]
+    # Même filtre pour le moteur de repli (ORM)
+    hits = FallbackSearchBackend().search("erreur")
+    assert [pk for _, pk, _ in hits] == [visible.id]
+
+
+def test_search_requires_query(setup_data):
+    """Le paramètre q est obligatoire."""
+    res = setup_data["client"].get(reverse("search"))
+    assert res.status_code == 400
+
+
+def test_admin_filter_keeps_every_match(setup_data):
+    """Recherche de l’admin : aucune correspondance tronquée."""
+    issue = setup_data["issues"][0]
+    for index in range(SEARCH_MAX_RESULTS):
+        Issue.objects.create(
+            title=f"Erreur {index}",
+            description="desc",
+            tag="BUG",
+            priority="LOW",
+            project=issue.project,
+            author_user=issue.author_user,
+        )
+    matches = filter_matching(Issue.objects.all(), "erreur", "issue")
+    assert matches.count() == SEARCH_MAX_RESULTS + 2
+    assert not filter_matching(Comment.objects.all(), "erreur", "comment")
@@ -0,0 +1,156 @@
+"""
+Tests du coût des serializers de détail.
+Vérifie qu’une sérialisation en lecture ne déclenche aucune requête
+supplémentaire et que les choix des clés étrangères restent restreints
+à l’utilisateur lors d’une écriture.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from projects.access import get_project_access
+from projects.models import Comment, Contributor, Issue, Project
+from projects.serializers import (
+    CommentDetailSerializer,
+    ContributorDetailSerializer,
+    IssueDetailSerializer,
+)
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, force_authenticate
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _user(username):
+    """Crée un utilisateur de test."""
+    return User.objects.create_user(
+        username=username,
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+
+
+def _request(user, method="get", data=None):
+    """Requête DRF authentifiée, table d’accès déjà en cache."""
+    factory_request = getattr(APIRequestFactory(), method)(
+        "/", data, format="json"
+    )
+    force_authenticate(factory_request, user=user)
+    request = Request(factory_request)
+    request.user = user
+    get_project_access(user)
+    return request
+
+
+@pytest.fixture
+def setup_data():
+    """Deux projets cloisonnés avec issue, commentaire et contributeurs."""
+    author, stranger = _user("ser_author"), _user("ser_stranger")
+    project = Project.objects.create(
+        title="Projet serializer",
+        description="desc",
+        type="BACK_END",
+        author_user=author,
+    )
+    foreign = Project.objects.create(
+        title="Projet étranger",
+        description="desc",
+        type="BACK_END",
+        author_user=stranger,
+    )
+    contributor = Contributor.objects.create(
+        user=author, project=project, permission="AUTHOR", role="Auteur"
+    )
+    foreign_contributor = Contributor.objects.create(
+        user=stranger, project=foreign, permission="AUTHOR", role="Auteur"
+    )
+    issue = Issue.objects.create(
+        title="Issue",
+        description="desc",
+        tag="BUG",
+        priority="LOW",
+        project=project,
+        author_user=author,
+        assignee_contributor=contributor,
+    )
+    foreign_issue = Issue.objects.create(
+        title="Issue étrangère",
+        description="desc",
+        tag="BUG",
+        priority="LOW",
+        project=foreign,
+        author_user=stranger,
+    )
+    Comment.objects.create(description="Vu", issue=issue, author_user=author)
+    return {
+        "author": author,
+        "project": project,
+        "foreign_contributor": foreign_contributor,
+        "issue": issue,
+        "foreign_issue": foreign_issue,
+    }
+
+
+def test_read_serialization_runs_no_query(setup_data):
+    """Relations préchargées : aucune requête à la construction ni au rendu."""
+    context = {"request": _request(setup_data["author"])}
+    issue = Issue.objects.select_related(
+        "project", "author_user", "assignee_contributor__user"
+    ).get(pk=setup_data["issue"].pk)
+    comment = Comment.objects.select_related("issue", "author_user").get()
+    contributor = Contributor.objects.select_related("user").get(
+        project=setup_data["project"]
+    )
+
+    with CaptureQueriesContext(connection) as ctx:
+        IssueDetailSerializer(issue, context=context).data
+        CommentDetailSerializer(comment, context=context).data
+        ContributorDetailSerializer(contributor, context=context).data
+        IssueDetailSerializer([issue], many=True, context=context).data
+        # Construction pour une écriture : choix résolus à la validation
+        IssueDetailSerializer(
+            data={"project": setup_data["project"].id}, context=context
+        )
+    assert ctx.captured_queries == []
+
+
+def test_write_choices_stay_scoped(setup_data):
+    """Issue ou assigné hors périmètre : refusés à la validation."""
+    author = setup_data["author"]
+    serializer = CommentDetailSerializer(
+        data={"description": "x", "issue": setup_data["foreign_issue"].id},
+        context={"request": _request(author, "post")},
+    )
+    assert not serializer.is_valid()
+    assert "issue" in serializer.errors
+
+    serializer = IssueDetailSerializer(
+        setup_data["issue"],
+        data={"assignee_contributor": setup_data["foreign_contributor"].id},
+        partial=True,
+        context={"request": _request(author, "patch")},
+    )
+    assert not serializer.is_valid()
+    assert "assignee_contributor" in serializer.errors
+
+    serializer = ContributorDetailSerializer(
+        data={
+            "project": setup_data["foreign_issue"].project_id,
+            "user_uuid": str(author.uuid),
+        },
+        context={"request": _request(author, "post")},
+    )
+    assert not serializer.is_valid()
+    assert "project" in serializer.errors
@@ -0,0 +1,131 @@
+"""
+Tests des statistiques de projet (`/api/projects/{id}/stats/`).
+Vérifie la ventilation, le coût constant (une requête agrégée quelle que
+soit la taille du projet), le cache, son invalidation et le cloisonnement.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from projects.access import get_project_access
+from projects.models import Contributor, Issue, Project
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _user(username):
+    """Crée un utilisateur de test."""
+    return User.objects.create_user(
+        username=username,
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+
+
+def _project(author, title):
+    """Crée un projet et son auteur-contributeur."""
+    project = Project.objects.create(
+        title=title, description="desc", type="BACK_END", author_user=author
+    )
+    contributor = Contributor.objects.create(
+        user=author, project=project, permission="AUTHOR", role="Auteur"
+    )
+    return project, contributor
+
+
+def _issues(project, author, count, assignee=None, prefix="Issue", **fields):
+    """Crée `count` issues en une seule insertion."""
+    defaults = {"tag": "BUG", "priority": "LOW", "status": "TODO"}
+    defaults.update(fields)
+    Issue.objects.bulk_create(
+        Issue(
+            title=f"{prefix} {i}",
+            description="desc",
+            project=project,
+            author_user=author,
+            assignee_contributor=assignee,
+            **defaults,
+        )
+        for i in range(count)
+    )
+
+
+def _client(user):
+    """Client authentifié, table d’accès déjà en cache."""
+    client = APIClient()
+    client.force_authenticate(user=user)
+    get_project_access(user)
+    return client
+
+
+def test_stats_breakdown_in_one_query():
+    """Ventilation exacte, une seule requête quelle que soit la taille."""
+    author = _user("stats_author")
+    small, _ = _project(author, "Petit projet")
+    large, contributor = _project(author, "Grand projet")
+    _issues(small, author, 2)
+    _issues(large, author, 40, assignee=contributor, priority="HIGH")
+    _issues(
+        large, author, 10, prefix="Feature", tag="FEATURE", status="FINISHED"
+    )
+    client = _client(author)
+
+    queries = []
+    for project in (small, large):
+        with CaptureQueriesContext(connection) as ctx:
+            res = client.get(reverse("project-stats", args=[project.id]))
+        assert res.status_code == 200
+        queries.append(len(ctx.captured_queries))
+    assert queries == [1, 1]
+
+    data = res.data
+    assert data["total"] == 50
+    assert data["by_status"] == {"TODO": 40, "IN_PROGRESS": 0, "FINISHED": 10}
+    assert data["by_priority"] == {"LOW": 10, "MEDIUM": 0, "HIGH": 40}
+    assert data["by_tag"] == {"BUG": 40, "FEATURE": 10, "TASK": 0}
+    assert [(a["username"], a["total"]) for a in data["by_assignee"]] == [
+        (None, 10),
+        ("stats_author", 40),
+    ]
+
+
+def test_stats_cached_and_invalidated_on_write():
+    """Servies par le cache, recalculées après une écriture d’issue."""
+    author = _user("stats_cache")
+    project, _ = _project(author, "Projet cache")
+    _issues(project, author, 3)
+    client = _client(author)
+    url = reverse("project-stats", args=[project.id])
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert client.get(url).data["total"] == 3
+    assert len(ctx.captured_queries) == 0
+
+    issue = Issue.objects.filter(project=project).first()
+    issue.status = "IN_PROGRESS"
+    issue.save()
+    assert client.get(url).data["by_status"]["IN_PROGRESS"] == 1
+
+
+def test_stats_hidden_from_non_contributors():
+    """Un non-contributeur reçoit 404."""
+    author, outsider = _user("stats_owner"), _user("stats_outsider")
+    project, _ = _project(author, "Projet privé")
+
+    res = _client(outsider).get(reverse("project-stats", args=[project.id]))
+    assert res.status_code == 404
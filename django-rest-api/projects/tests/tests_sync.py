@@ -0,0 +1,257 @@
+"""
+Tests de la synchronisation différentielle (/api/sync/).
+Couvre la pagination par curseur, les modifications, les suppressions,
+la fenêtre de recouvrement, le filtrage par appartenance au projet, les
+pertes et gains d’accès et le retrait d’un assigné.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from projects import sync
+from projects.models import Comment, Contributor, Issue, Project
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _user(username):
+    """Crée un utilisateur de test."""
+    return User.objects.create_user(
+        username=username,
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+
+
+@pytest.fixture
+def setup_data():
+    """Crée un projet avec deux issues et un commentaire."""
+    author = _user("sync_author")
+    project = Project.objects.create(
+        title="Projet Sync",
+        description="desc",
+        type="BACK_END",
+        author_user=author,
+    )
+    Contributor.objects.create(
+        user=author, project=project, permission="AUTHOR", role="Auteur"
+    )
+    issues = [
+        Issue.objects.create(
+            title=f"Issue {i}",
+            description="desc",
+            tag="BUG",
+            priority="LOW",
+            project=project,
+            author_user=author,
+        )
+        for i in range(2)
+    ]
+    comment = Comment.objects.create(
+        description="Premier commentaire",
+        issue=issues[0],
+        author_user=author,
+    )
+    client = APIClient()
+    client.force_authenticate(user=author)
+    return {
+        "client": client,
+        "author": author,
+        "project": project,
+        "issues": issues,
+        "comment": comment,
+    }
+
+
+def _member(project, username):
+    """Ajoute un contributeur et renvoie (contributeur, client)."""
+    user = _user(username)
+    contributor = Contributor.objects.create(
+        user=user, project=project, permission="CONTRIBUTOR", role="Dev"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return contributor, client
+
+
+@pytest.fixture
+def no_overlap(monkeypatch):
+    """Curseurs stricts : aucun renvoi des lignes récentes."""
+    monkeypatch.setattr(sync, "SYNC_OVERLAP_SECONDS", 0)
+
+
+def test_full_sync_pages_with_cursor(setup_data, no_overlap):
+    """Sans curseur, tout est renvoyé page par page."""
+    client = setup_data["client"]
+    url = reverse("sync")
+
+    first = client.get(url, {"limit": 1}).data
+    assert len(first["issues"]) == 1 and first["has_more"] is True
+
+    second = client.get(url, {"limit": 1, "since": first["next_cursor"]})
+    assert second.data["issues"][0]["id"] != first["issues"][0]["id"]
+
+    third = client.get(url, {"since": second.data["next_cursor"]}).data
+    assert third["issues"] == [] and third["has_more"] is False
+
+
+def test_sync_returns_only_new_changes(setup_data, no_overlap):
+    """Après un curseur, seules les modifications et suppressions suivent."""
+    client = setup_data["client"]
+    url = reverse("sync")
+    cursor = client.get(url).data["next_cursor"]
+
+    issue = setup_data["issues"][1]
+    issue.status = "FINISHED"
+    issue.save()
+    comment_id = setup_data["comment"].id
+    setup_data["comment"].delete()
+
+    data = client.get(url, {"since": cursor}).data
+    assert [i["id"] for i in data["issues"]] == [issue.id]
+    assert data["comments"] == []
+    assert data["deleted"][0]["type"] == "comment"
+    assert data["deleted"][0]["id"] == comment_id
+
+
+def test_late_commit_is_not_skipped(setup_data):
+    """Ligne validée après un curseur mais horodatée avant : renvoyée."""
+    client = setup_data["client"]
+    url = reverse("sync")
+    issues = setup_data["issues"]
+    cursor = client.get(url).data["next_cursor"]
+
+    # Transaction lente : horodatée avant la dernière ligne déjà servie
+    late = Issue.objects.create(
+        title="Validée tard",
+        description="desc",
+        tag="BUG",
+        priority="LOW",
+        project=issues[0].project,
+        author_user=issues[0].author_user,
+    )
+    Issue.objects.filter(pk=late.pk).update(
+        updated_time=issues[1].updated_time - timedelta(milliseconds=1)
+    )
+
+    data = client.get(url, {"since": cursor}).data
+    assert late.id in [i["id"] for i in data["issues"]]
+
+
+def test_overlap_does_not_loop_pagination(setup_data):
+    """Fenêtre plus large qu’une page : la pagination progresse."""
+    client = setup_data["client"]
+    url = reverse("sync")
+    cursor = client.get(url).data["next_cursor"]
+
+    seen, pages, has_more = [], 0, True
+    while has_more:
+        data = client.get(url, {"since": cursor, "limit": 1}).data
+        seen += [i["id"] for i in data["issues"]]
+        cursor, has_more = data["next_cursor"], data["has_more"]
+        pages += 1
+        assert pages < 10
+    assert sorted(seen) == sorted(i.id for i in setup_data["issues"])
+
+
+def test_sync_hides_foreign_projects(setup_data):
+    """Un utilisateur externe ne reçoit aucun changement."""
+    client = APIClient()
+    client.force_authenticate(user=_user("sync_stranger"))
+    data = client.get(reverse("sync")).data
+    assert data["issues"] == [] and data["comments"] == []
+
+
+def test_invalid_cursor_returns_400(setup_data):
+    """Un curseur illisible est refusé."""
+    res = setup_data["client"].get(reverse("sync"), {"since": "%%%"})
+    assert res.status_code == 400
+
+
+def test_lost_access_is_synced(setup_data, no_overlap):
+    """Membre retiré ou projet supprimé : trace `project` adressée."""
+    project = setup_data["project"]
+    url = reverse("sync")
+    contributor, member = _member(project, "sync_member")
+    cursor = member.get(url).data["next_cursor"]
+
+    contributor.delete()
+    deleted = member.get(url, {"since": cursor}).data["deleted"]
+    assert [(d["type"], d["id"]) for d in deleted] == [("project", project.id)]
+    # Trace propre au membre retiré
+    assert setup_data["client"].get(url).data["deleted"] == []
+
+    client = setup_data["client"]
+    cursor = client.get(url).data["next_cursor"]
+    client.delete(reverse("project-detail", args=[project.id]))
+    deleted = client.get(url, {"since": cursor}).data["deleted"]
+    assert ("project", project.id) in [(d["type"], d["id"]) for d in deleted]
+
+
+def test_unassigned_issue_is_resynced(setup_data, no_overlap):
+    """Retrait de l’assigné (SET_NULL) : l’issue repart à la synchro."""
+    client, issue = setup_data["client"], setup_data["issues"][0]
+    contributor, _ = _member(setup_data["project"], "sync_assignee")
+    Issue.objects.filter(pk=issue.pk).update(assignee_contributor=contributor)
+    cursor = client.get(reverse("sync")).data["next_cursor"]
+
+    contributor.delete()
+    data = client.get(reverse("sync"), {"since": cursor}).data
+    assert [i["id"] for i in data["issues"]] == [issue.id]
+    assert data["issues"][0]["assignee_contributor"] is None
+
+
+def test_gained_access_resyncs_project_history(setup_data, no_overlap):
+    """Ajout à un projet existant : issues et commentaires antérieurs."""
+    outsider = _user("sync_newcomer")
+    own = Project.objects.create(
+        title="Projet perso",
+        description="desc",
+        type="BACK_END",
+        author_user=outsider,
+    )
+    Contributor.objects.create(
+        user=outsider, project=own, permission="AUTHOR", role="Auteur"
+    )
+    # Curseur postérieur à l’historique du projet rejoint ensuite
+    Issue.objects.create(
+        title="Issue perso",
+        description="desc",
+        tag="BUG",
+        priority="LOW",
+        project=own,
+        author_user=outsider,
+    )
+    Comment.objects.create(
+        description="Commentaire perso",
+        issue=own.issues.first(),
+        author_user=outsider,
+    )
+    client = APIClient()
+    client.force_authenticate(user=outsider)
+    url = reverse("sync")
+    cursor = client.get(url).data["next_cursor"]
+
+    Contributor.objects.create(
+        user=outsider,
+        project=setup_data["project"],
+        permission="CONTRIBUTOR",
+        role="Dev",
+    )
+    issue_ids, comment_ids, has_more = [], [], True
+    while has_more:
+        data = client.get(url, {"since": cursor, "limit": 1}).data
+        issue_ids += [i["id"] for i in data["issues"]]
+        comment_ids += [c["id"] for c in data["comments"]]
+        cursor, has_more = data["next_cursor"], data["has_more"]
+    assert sorted(issue_ids) == sorted(i.id for i in setup_data["issues"])
+    assert comment_ids == [setup_data["comment"].id]
+
+    # Rattrapage terminé : plus rien à renvoyer
+    data = client.get(url, {"since": cursor}).data
+    assert data["issues"] == [] and data["comments"] == []
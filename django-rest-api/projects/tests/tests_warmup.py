@@ -0,0 +1,88 @@
+"""
+Tests du préchauffage du cache (`warm_softdesk_cache`).
+Vérifie que les listes des utilisateurs récents sont servies sans
+requête SQL dès la première lecture, et que le débit est limité.
+"""
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from projects.models import Contributor, Issue, Project
+from projects.warmup import RateLimiter
+from rest_framework.test import APIClient
+from users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide le cache avant et après chaque test."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def active_user():
+    """Utilisateur récemment connecté, auteur d’un projet avec une issue."""
+    user = User.objects.create_user(
+        username="warm_user",
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+        last_login=timezone.now(),
+    )
+    project = Project.objects.create(
+        title="Projet chaud",
+        description="d",
+        type="BACK_END",
+        author_user=user,
+    )
+    Contributor.objects.create(
+        user=user, project=project, permission="AUTHOR", role="Auteur"
+    )
+    Issue.objects.create(
+        title="Issue chaude",
+        description="d",
+        tag="BUG",
+        priority="LOW",
+        project=project,
+        author_user=user,
+    )
+    return user
+
+
+def test_warmup_serves_first_requests_from_cache(active_user):
+    """Après préchauffage, les listes ne déclenchent aucune requête."""
+    call_command("warm_softdesk_cache", "--workers", "1", "--rate", "0")
+
+    assert cache.get(f"user_projects_{active_user.id}") is not None
+    assert cache.get(f"issues_user_{active_user.id}_project_all") is not None
+
+    client = APIClient()
+    client.force_authenticate(user=active_user)
+    for name in ("project-list", "issue-list"):
+        with CaptureQueriesContext(connection) as ctx:
+            res = client.get(reverse(name))
+        assert res.status_code == 200
+        assert res.data["count"] == 1
+        assert len(ctx.captured_queries) == 0, name
+
+
+def test_rate_limiter_spaces_starts(monkeypatch):
+    """Les départs sont espacés de 1 / rate secondes."""
+    clock = {"now": 100.0, "slept": []}
+    monkeypatch.setattr("projects.warmup.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("projects.warmup.time.sleep", clock["slept"].append)
+
+    limiter = RateLimiter(rate=4)
+    for _ in range(3):
+        limiter.wait()
+
+    assert clock["slept"] == [0, 0.25, 0.5]
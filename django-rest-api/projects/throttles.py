@@ -3,3 +3,26 @@ from rest_framework.throttling import UserRateThrottle
 
 class InviteThrottle(UserRateThrottle):
     scope = "invite"
+
+
+class AsyncUserRateThrottle(UserRateThrottle):
+    """
+    Quota `user` de DRF appliqué sans thread (vues ASGI) : même clé de
+    cache et même historique que `UserRateThrottle`, donc un budget
+    commun aux vues synchrones et asynchrones.
+    """
+
+    async def aallow_request(self, request):
+        """Variante asynchrone de `allow_request`."""
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, None)
+        self.history = await self.cache.aget(self.key, [])
+        self.now = self.timer()
+        while self.history and self.history[-1] <= self.now - self.duration:
+            self.history.pop()
+        if len(self.history) >= self.num_requests:
+            return self.throttle_failure()
+        self.history.insert(0, self.now)
+        await self.cache.aset(self.key, self.history, self.duration)
+        return True
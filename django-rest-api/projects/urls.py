@@ -1,14 +1,19 @@
 """
 Définition des routes du module projects.
 Expose les endpoints principaux pour les projets, contributeurs,
-issues et commentaires via un routeur DRF.
+issues et commentaires via un routeur DRF, ainsi que la
+synchronisation, la recherche plein texte et les lectures asynchrones.
 """
 
+from django.urls import path
+from projects import async_views
 from projects.views import (
     CommentViewSet,
     ContributorViewSet,
     IssueViewSet,
     ProjectViewSet,
+    SearchView,
+    SyncView,
 )
 from rest_framework.routers import DefaultRouter
 
@@ -18,4 +23,34 @@ router.register(r"contributors", ContributorViewSet, basename="contributor")
 router.register(r"issues", IssueViewSet, basename="issue")
 router.register(r"comments", CommentViewSet, basename="comment")
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("sync/", SyncView.as_view(), name="sync"),
+    path("search/", SearchView.as_view(), name="search"),
+    # Lectures asynchrones (servies nativement sous ASGI)
+    path(
+        "async/projects/",
+        async_views.project_list,
+        name="async-project-list",
+    ),
+    path(
+        "async/projects/<int:pk>/",
+        async_views.project_detail,
+        name="async-project-detail",
+    ),
+    path("async/issues/", async_views.issue_list, name="async-issue-list"),
+    path(
+        "async/issues/<int:pk>/",
+        async_views.issue_detail,
+        name="async-issue-detail",
+    ),
+    path(
+        "async/comments/",
+        async_views.comment_list,
+        name="async-comment-list",
+    ),
+    path(
+        "async/comments/<int:pk>/",
+        async_views.comment_detail,
+        name="async-comment-detail",
+    ),
+] + router.urls
@@ -11,30 +11,67 @@ from collections import defaultdict
 
 from django.core.cache import cache
 from django.db import IntegrityError, transaction
-from drf_spectacular.utils import OpenApiResponse, extend_schema
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    OpenApiResponse,
+    extend_schema,
+)
+from projects.access import (
+    accessible_project_ids,
+    get_project_access,
+    has_project_access,
+)
+from projects.activity import ACTIVITY_FIELDS, annotate_activity
+from projects.detail_cache import DetailCacheMixin
+from projects.filters import IssueFilter
 from projects.models import Comment, Contributor, Issue, Project
-from projects.pagination import ContributorProjectPagination
+from projects.pagination import (
+    ContributorProjectPagination,
+    IssueCommentCursorPagination,
+)
 from projects.permissions import (
     IsAuthorAndContributor,
     IsAuthorOrProjectContributorReadOnly,
 )
+from projects.search import KIND_OFFSETS, SEARCH_MAX_RESULTS, search
 from projects.serializers import (
     CommentDetailSerializer,
     CommentListSerializer,
     ContributorDetailSerializer,
     ContributorListSerializer,
+    IssueActivityListSerializer,
+    IssueCommentSerializer,
     IssueDetailSerializer,
     IssueListSerializer,
     ProjectDetailSerializer,
     ProjectListSerializer,
+    TombstoneSerializer,
+)
+from projects.stats import get_project_stats
+from projects.sync import SYNC_MAX_PAGE_SIZE, SYNC_PAGE_SIZE, collect_changes
+from projects.tasks import (
+    schedule_cache_invalidation,
+    schedule_project_deletion,
 )
 from projects.throttles import InviteThrottle
 from rest_framework import status, viewsets
-from rest_framework.exceptions import PermissionDenied, ValidationError
+from rest_framework.decorators import action
+from rest_framework.exceptions import (
+    NotFound,
+    PermissionDenied,
+    ValidationError,
+)
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from users.models import User
-from utils.cache_tools import safe_delete_pattern
+from utils.cache_tools import (
+    build_cache_key,
+    delete_cache_variants,
+    safe_delete_pattern,
+)
+from utils.db_routers import primary_reads
+from utils.fieldsets import SparseFieldsetMixin
 
 logger = logging.getLogger("projects.invites")
 
@@ -42,10 +79,13 @@ logger = logging.getLogger("projects.invites")
 # ---------------------------------------------------------------------
 # PROJETS
 # ---------------------------------------------------------------------
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(
+    DetailCacheMixin, SparseFieldsetMixin, viewsets.ModelViewSet
+):
     """Vue principale de gestion des projets."""
 
     permission_classes = [IsAuthenticated, IsAuthorAndContributor]
+    detail_cache_kind = "project"
 
     def get_serializer_class(self):
         """Sélectionne le serializer selon l’action."""
@@ -55,37 +95,55 @@ class ProjectViewSet(viewsets.ModelViewSet):
             else ProjectDetailSerializer
         )
 
+    def _visible_projects(self, qs):
+        """Restreint un queryset aux projets accessibles à l’utilisateur."""
+        user = self.request.user
+        if user.is_superuser:
+            return qs.filter(deletion_pending=False)
+        return qs.filter(pk__in=accessible_project_ids(user, self.request))
+
     def get_queryset(self):
-        """Récupère la liste des projets avec cache et préchargement."""
+        """Liste en cache, ou requête ciblée pour les actions de détail."""
+        if getattr(self, "detail", False):
+            return self.get_detail_queryset()
+
         user = self.request.user
-        cache_key = f"user_projects_{user.id}"
+        cache_key = build_cache_key(
+            f"user_projects_{user.id}",
+            self.get_sparse_cache_params(),
+            versioned=True,
+        )
 
         cached_projects = cache.get(cache_key)
         if cached_projects is not None:
-            print(f"Cache utilisé pour {cache_key}")
             return cached_projects
 
-        print(
-            f"Aucun cache trouvé pour {cache_key}, reconstruction en cours..."
+        qs = Project.objects.select_related("author_user").prefetch_related(
+            "contributors__user"
         )
+        qs = self.apply_sparse_fieldset(self._visible_projects(qs))
 
-        qs = (
-            Project.objects.select_related("author_user")
-            .prefetch_related("contributors__user")
-            .distinct()
-        )
-        if not user.is_superuser:
-            qs = qs.filter(contributors__user=user)
-
-        cache.set(cache_key, qs, timeout=600)
-        print(f"Cache créé pour {cache_key} (durée 600s)")
-
+        # Liste évaluée sur la base principale avant sa mise en cache
+        with primary_reads():
+            cache.set(cache_key, qs, timeout=600)
         return qs
 
+    def get_detail_queryset(self):
+        """
+        Queryset paresseux des actions de détail : `get_object()` y ajoute
+        `pk=`, sans charger la liste en cache. `stats` ne lit que l’accès,
+        `destroy` l’auteur (permission) ; les autres renvoient le détail.
+        """
+        if self.action == "stats":
+            return self._visible_projects(Project.objects.all())
+        qs = Project.objects.select_related("author_user")
+        if self.action != "destroy":
+            qs = qs.prefetch_related("contributors__user")
+        return self.apply_sparse_fieldset(self._visible_projects(qs))
+
     def list(self, request, *args, **kwargs):
         """Affiche les projets de l’utilisateur avec message personnalisé."""
-        user = request.user
-        if not Project.objects.filter(contributors__user=user).exists():
+        if not get_project_access(request.user, request):
             return Response(
                 {
                     "detail": (
@@ -97,6 +155,45 @@ class ProjectViewSet(viewsets.ModelViewSet):
             )
         return super().list(request, *args, **kwargs)
 
+    @extend_schema(
+        summary="Statistiques des issues du projet",
+        responses={
+            200: {
+                "type": "object",
+                "example": {
+                    "project_id": 1,
+                    "total": 3,
+                    "by_status": {"TODO": 2, "IN_PROGRESS": 1, "FINISHED": 0},
+                    "by_priority": {"LOW": 1, "MEDIUM": 0, "HIGH": 2},
+                    "by_tag": {"BUG": 2, "FEATURE": 1, "TASK": 0},
+                    "by_assignee": [
+                        {
+                            "assignee_contributor_id": 4,
+                            "username": "alice",
+                            "total": 3,
+                            "by_status": {
+                                "TODO": 2,
+                                "IN_PROGRESS": 1,
+                                "FINISHED": 0,
+                            },
+                        }
+                    ],
+                },
+            }
+        },
+    )
+    @action(detail=True, methods=["get"])
+    def stats(self, request, pk=None):
+        """Ventilation des issues par statut, priorité, tag et assigné."""
+        if str(pk).isdigit() and int(pk) in get_project_access(
+            request.user, request
+        ):
+            project_id = int(pk)
+        else:
+            # Administrateur ou projet inaccessible (404)
+            project_id = self.get_object().pk
+        return Response(get_project_stats(project_id))
+
     def perform_create(self, serializer):
         """Crée un projet et son auteur-contributeur associé."""
         title = serializer.validated_data.get("title")
@@ -117,11 +214,12 @@ class ProjectViewSet(viewsets.ModelViewSet):
                 permission="AUTHOR",
                 role="Auteur et Contributeur du projet",
             )
-            cache.delete(f"user_projects_{user.id}")
+            delete_cache_variants(f"user_projects_{user.id}")
         except IntegrityError:
             raise ValidationError(
                 {"detail": "Ce projet existe déjà dans la base."}
             )
+        self.cache_detail(serializer)
 
     def create(self, request, *args, **kwargs):
         """Crée un projet et renvoie un message clair."""
@@ -150,19 +248,34 @@ class ProjectViewSet(viewsets.ModelViewSet):
                     "message": "Le projet '{title}' et ses données associées ont été supprimés.",
                     "status": "success",
                 },
-            }
+            },
+            202: {
+                "type": "object",
+                "example": {
+                    "message": "Le projet '{title}' est en cours de suppression.",
+                    "status": "pending",
+                    "job_id": 42,
+                },
+            },
         }
     )
     def destroy(self, request, *args, **kwargs):
-        """Supprime un projet et nettoie le cache associé."""
+        """Masque un projet puis délègue sa suppression par lots."""
         instance = self.get_object()
-        user = request.user
         title = instance.title
 
-        self.perform_destroy(instance)
-
-        safe_delete_pattern(f"user_projects_{user.id}")
-        safe_delete_pattern(f"issues_user_{user.id}_project_*")
+        job = schedule_project_deletion(instance.id)
+        if job is not None:
+            return Response(
+                {
+                    "message": (
+                        f"Le projet '{title}' est en cours de suppression."
+                    ),
+                    "status": "pending",
+                    "job_id": job.id,
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
 
         return Response(
             {
@@ -179,12 +292,15 @@ class ProjectViewSet(viewsets.ModelViewSet):
 # ---------------------------------------------------------------------
 # CONTRIBUTEURS
 # ---------------------------------------------------------------------
-class ContributorViewSet(viewsets.ModelViewSet):
+class ContributorViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     """Vue de gestion des contributeurs (ajout via UUID sécurisé, suppression standard)."""
 
     permission_classes = [IsAuthenticated, IsAuthorAndContributor]
     pagination_class = ContributorProjectPagination
     throttle_classes = []  # définies dynamiquement par action
+    # Le regroupement par projet lit toujours le titre et le type
+    sparse_required_paths = ("project__title", "project__type")
+    sparse_object_paths = ("project__id",)
 
     def get_serializer_class(self):
         """Choisit un serializer selon l’action en cours."""
@@ -197,22 +313,27 @@ class ContributorViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Retourne la liste des contributeurs accessibles."""
         user = self.request.user
-        qs = Contributor.objects.select_related("project", "user")
+        qs = self.apply_sparse_fieldset(
+            Contributor.objects.select_related("project", "user")
+        )
         if user.is_superuser:
-            return qs
-        return qs.filter(project__contributors__user=user).distinct()
+            return qs.filter(project__deletion_pending=False)
+        return qs.filter(
+            project_id__in=accessible_project_ids(user, self.request)
+        )
 
     def list(self, request, *args, **kwargs):
         """Regroupe les contributeurs par projet."""
-        queryset = self.get_queryset()
-        if not queryset.exists():
+        # Une seule requête : l’état vide se déduit du résultat
+        contributors = list(self.get_queryset())
+        if not contributors:
             return Response(
                 {"detail": "Accès refusé : aucun projet associé."},
                 status=status.HTTP_403_FORBIDDEN,
             )
 
         grouped = defaultdict(list)
-        for contributor in queryset:
+        for contributor in contributors:
             grouped[contributor.project.id].append(contributor)
 
         projects = [
@@ -222,7 +343,7 @@ class ContributorViewSet(viewsets.ModelViewSet):
                 "project_type": c[0].project.type,
                 "contributors_count": len(c),
                 "contributors": ContributorListSerializer(
-                    c, many=True, context={"request": request}
+                    c, many=True, context=self.get_serializer_context()
                 ).data,
             }
             for pid, c in grouped.items()
@@ -349,8 +470,7 @@ class ContributorViewSet(viewsets.ModelViewSet):
                             else "Contributeur"
                         ),
                     )
-                    safe_delete_pattern(f"user_projects_{user.id}")
-                    safe_delete_pattern(f"issues_user_{user.id}_project_*")
+                    schedule_cache_invalidation(user.id)
         except IntegrityError:
             logger.exception(
                 "invite_db_error",
@@ -387,7 +507,6 @@ class ContributorViewSet(viewsets.ModelViewSet):
         """Supprime un contributeur par son ID (classique)."""
         instance = self.get_object()
         user = instance.user
-        project_id = instance.project.id
 
         # Empêche la suppression de l’auteur du projet
         if instance.permission == "AUTHOR":
@@ -397,10 +516,7 @@ class ContributorViewSet(viewsets.ModelViewSet):
             )
 
         self.perform_destroy(instance)
-
-        safe_delete_pattern(f"user_projects_{user.id}")
-        safe_delete_pattern(f"issues_user_{user.id}_project_*")
-        safe_delete_pattern(f"issues_project_{project_id}")
+        schedule_cache_invalidation(user.id)
 
         return Response(
             {
@@ -414,29 +530,69 @@ class ContributorViewSet(viewsets.ModelViewSet):
 # ---------------------------------------------------------------------
 # ISSUES
 # ---------------------------------------------------------------------
-class IssueViewSet(viewsets.ModelViewSet):
+class IssueViewSet(
+    DetailCacheMixin, SparseFieldsetMixin, viewsets.ModelViewSet
+):
     """Vue principale pour la gestion des issues."""
 
     permission_classes = [
         IsAuthenticated,
         IsAuthorOrProjectContributorReadOnly,
     ]
+    detail_cache_kind = "issue"
+    sparse_object_paths = (
+        "project__author_user",
+        "assignee_contributor__user",
+    )
 
     def get_serializer_class(self):
         """Retourne le serializer selon l’action."""
-        return (
-            IssueListSerializer
-            if self.action == "list"
-            else IssueDetailSerializer
+        if self.action == "comments":
+            return IssueCommentSerializer
+        if self.action != "list":
+            return IssueDetailSerializer
+        if self.wants_activity():
+            return IssueActivityListSerializer
+        return IssueListSerializer
+
+    def wants_activity(self):
+        """`?activity=1` : ajoute nombre et date des commentaires."""
+        return self.action == "list" and self.request.query_params.get(
+            "activity", ""
+        ).lower() in ("1", "true")
+
+    def _visible_issues(self, qs):
+        """Restreint un queryset aux issues des projets accessibles."""
+        user = self.request.user
+        if user.is_superuser:
+            return qs.filter(project__deletion_pending=False)
+        return qs.filter(
+            project_id__in=accessible_project_ids(user, self.request)
         )
 
     def get_queryset(self):
-        """Charge les issues avec cache et relations optimisées."""
+        """
+        Liste en cache pour l’action `list`, seule à lire les paramètres
+        de filtre ; requête ciblée pour toutes les autres actions.
+        """
+        if self.action != "list":
+            return self.get_detail_queryset()
+
         user = self.request.user
-        project_id = self.request.query_params.get("project")
-        cache_key = f"issues_user_{user.id}_project_{project_id or 'all'}"
+        issue_filter = IssueFilter(self.request.query_params)
+        project_id = issue_filter.project_id
+        cache_key = build_cache_key(
+            f"issues_user_{user.id}_project_{project_id or 'all'}",
+            {
+                **issue_filter.cache_params(),
+                **self.get_sparse_cache_params(),
+            },
+        )
 
-        cached_issues = cache.get(cache_key)
+        # Activité non mise en cache : les commentaires n’invalident pas
+        # les listes d’issues, la valeur doit rester fraîche
+        activity = self.wants_activity()
+        cached_issues = None if activity else cache.get(cache_key)
         if cached_issues is not None:
             return cached_issues
 
@@ -446,27 +602,95 @@ class IssueViewSet(viewsets.ModelViewSet):
             "author_user",
             "assignee_contributor",
             "assignee_contributor__user",
-        ).distinct()
-
-        if not user.is_superuser:
-            qs = qs.filter(project__contributors__user=user)
-
-        if project_id:
-            qs = qs.filter(project_id=project_id)
-
-        cache.set(cache_key, qs, timeout=600)
+        )
+        qs = issue_filter.filter_queryset(self._visible_issues(qs))
+        qs = self.apply_sparse_fieldset(qs)
+
+        if activity:
+            fields = self.get_sparse_fields()
+            return annotate_activity(
+                qs,
+                [f for f in ACTIVITY_FIELDS if fields is None or f in fields],
+            )
+        # Liste évaluée sur la base principale avant sa mise en cache
+        with primary_reads():
+            cache.set(cache_key, qs, timeout=600)
         return qs
 
+    def get_detail_queryset(self):
+        """
+        Queryset paresseux des actions hors liste : `get_object()` y ajoute
+        `pk=`, sans charger la liste en cache ni lire les filtres.
+        `destroy` ne lit que l’auteur et l’assigné (permission) ; les
+        autres actions renvoient aussi le titre du projet.
+        """
+        relations = ["author_user", "assignee_contributor__user"]
+        if self.action != "destroy":
+            relations.append("project")
+        qs = Issue.objects.select_related(*relations)
+        return self.apply_sparse_fieldset(self._visible_issues(qs))
+
+    @extend_schema(
+        parameters=IssueFilter.schema_parameters()
+        + [
+            OpenApiParameter(
+                "activity",
+                bool,
+                description=(
+                    "Ajoute `comments_count` et `last_comment_time` "
+                    "(calculés en base, non mis en cache)."
+                ),
+            )
+        ]
+    )
     def list(self, request, *args, **kwargs):
         """Liste les issues accessibles à l’utilisateur."""
-        user = request.user
-        if not Project.objects.filter(contributors__user=user).exists():
+        if not get_project_access(request.user, request):
             return Response(
                 {"detail": "Accès refusé : aucun projet associé."},
                 status=status.HTTP_403_FORBIDDEN,
             )
         return super().list(request, *args, **kwargs)
 
+    # ------------------------------------------------------------
+    # COMMENTAIRES D’UNE ISSUE
+    # ------------------------------------------------------------
+    def _check_issue_access(self, pk):
+        """Lit le projet de l’issue (clé primaire) ; 404 si inaccessible."""
+        user = self.request.user
+        if not str(pk).isdigit():
+            raise NotFound()
+        issues = Issue.objects.filter(pk=pk)
+        if user.is_superuser:
+            issues = issues.filter(project__deletion_pending=False)
+        project_id = issues.values_list("project_id", flat=True).first()
+        if project_id is None or not (
+            user.is_superuser or has_project_access(self.request, project_id)
+        ):
+            raise NotFound()
+
+    @extend_schema(
+        summary="Commentaires d’une issue (pagination par curseur)",
+        responses=IssueCommentSerializer(many=True),
+    )
+    @action(
+        detail=True,
+        methods=["get"],
+        pagination_class=IssueCommentCursorPagination,
+    )
+    def comments(self, request, pk=None):
+        """
+        Fil des commentaires d’une issue : un contrôle d’appartenance (table
+        d’accès en cache) puis une requête sur l’index (issue, date).
+        """
+        self._check_issue_access(pk)
+        queryset = self.apply_sparse_fieldset(
+            Comment.objects.filter(issue_id=pk).select_related("author_user")
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
     # ------------------------------------------------------------
     # CREATE
     # ------------------------------------------------------------
@@ -479,7 +703,7 @@ class IssueViewSet(viewsets.ModelViewSet):
         )
 
         # Vérifie que l’auteur est contributeur du projet
-        is_contrib = project.contributors.filter(user=user).exists()
+        is_contrib = project.id in get_project_access(user, self.request)
         if not (is_contrib or project.author_user == user):
             raise PermissionDenied(
                 "Accès refusé : vous devez être contributeur d’un projet pour créer une issue."
@@ -494,6 +718,7 @@ class IssueViewSet(viewsets.ModelViewSet):
             )
 
         issue = serializer.save(author_user=user)
+        self.cache_detail(serializer)
 
         # Invalidation des caches liés
         safe_delete_pattern(f"issues_user_{user.id}_project_*")
@@ -523,7 +748,8 @@ class IssueViewSet(viewsets.ModelViewSet):
     # ------------------------------------------------------------
     def perform_update(self, serializer):
         """Met à jour une issue en vérifiant que seul l’auteur ou l’assigné peut modifier."""
-        issue = self.get_object()
+        # Instance déjà chargée par `update()` : pas de seconde lecture
+        issue = serializer.instance
         user = self.request.user
 
         # Récupère le contributeur assigné (actualisé)
@@ -539,10 +765,11 @@ class IssueViewSet(viewsets.ModelViewSet):
             )
 
         serializer.save()
+        self.cache_detail(serializer)
 
         # Invalidation du cache après modification
         safe_delete_pattern(f"issues_user_{user.id}_project_*")
-        safe_delete_pattern(f"issues_project_{issue.project.id}")
+        safe_delete_pattern(f"issues_project_{issue.project_id}")
 
     # ------------------------------------------------------------
     # DELETE
@@ -583,13 +810,17 @@ class IssueViewSet(viewsets.ModelViewSet):
 # ---------------------------------------------------------------------
 # COMMENTAIRES
 # ---------------------------------------------------------------------
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(
+    DetailCacheMixin, SparseFieldsetMixin, viewsets.ModelViewSet
+):
     """Vue principale pour la gestion des commentaires."""
 
     permission_classes = [
         IsAuthenticated,
         IsAuthorOrProjectContributorReadOnly,
     ]
+    detail_cache_kind = "comment"
+    sparse_object_paths = ("issue__project__author_user",)
 
     def get_serializer_class(self):
         """Retourne le serializer selon l’action."""
@@ -602,33 +833,33 @@ class CommentViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Charge les commentaires liés aux issues accessibles."""
         user = self.request.user
-        qs = Comment.objects.select_related(
-            "issue",
-            "issue__project",
-            "issue__assignee_contributor",
-            "author_user",
-        ).distinct()
+        qs = self.apply_sparse_fieldset(
+            Comment.objects.select_related(
+                "issue",
+                "issue__project",
+                "issue__assignee_contributor",
+                "author_user",
+            )
+        )
         if user.is_superuser:
-            return qs
-        return qs.filter(issue__project__contributors__user=user)
+            return qs.filter(issue__project__deletion_pending=False)
+        return qs.filter(
+            issue__project_id__in=accessible_project_ids(user, self.request)
+        )
 
     def list(self, request, *args, **kwargs):
         """Liste les commentaires selon les droits de l’utilisateur."""
-        user = request.user
-        if not Project.objects.filter(contributors__user=user).exists():
+        # Table d’accès en cache : aucun pré-contrôle en base, l’état vide
+        # se déduit du résultat paginé (enveloppe conservée, message en plus)
+        if not accessible_project_ids(request.user, request):
             return Response(
                 {"detail": "Accès refusé : aucun projet associé."},
                 status=status.HTTP_403_FORBIDDEN,
             )
-        if (
-            not Issue.objects.filter(project__contributors__user=user).exists()
-            and not Issue.objects.filter(project__author_user=user).exists()
-        ):
-            return Response(
-                {"detail": "Aucune issue trouvée."},
-                status=status.HTTP_200_OK,
-            )
-        return super().list(request, *args, **kwargs)
+        response = super().list(request, *args, **kwargs)
+        if response.data.get("count") == 0:
+            response.data["detail"] = "Aucun commentaire trouvé."
+        return response
 
     def perform_create(self, serializer):
         """Crée un commentaire après vérification des droits."""
@@ -638,7 +869,7 @@ class CommentViewSet(viewsets.ModelViewSet):
         desc = serializer.validated_data.get("description")
 
         if not (
-            project.contributors.filter(user=user).exists()
+            has_project_access(self.request, project.id)
             or project.author_user == user
         ):
             raise PermissionDenied("Vous devez être contributeur du projet.")
@@ -656,6 +887,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             raise ValidationError(
                 {"detail": "Un commentaire identique existe déjà."}
             )
+        self.cache_detail(serializer)
 
     def create(self, request, *args, **kwargs):
         """Crée un commentaire et renvoie un message clair."""
@@ -666,8 +898,8 @@ class CommentViewSet(viewsets.ModelViewSet):
         comment = serializer.instance
         issue = comment.issue
         msg = f"Commentaire ajouté à l’issue '{issue.title}'."
-        issue_url = f"http://127.0.0.1:8000/api/issues/{issue.id}/"
-        data = {"message": msg, "issue_url": issue_url}
+        # `issue_url` (URL absolue, hôte de la requête) vient du serializer
+        data = {"message": msg}
         data.update(serializer.data)
         return Response(data, status=status.HTTP_201_CREATED, headers=headers)
 
@@ -679,6 +911,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             raise ValidationError(
                 {"detail": "Un commentaire identique existe déjà."}
             )
+        self.cache_detail(serializer)
 
     @extend_schema(
         responses={
@@ -705,3 +938,149 @@ class CommentViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK,
             content_type="application/json",
         )
+
+
+# ---------------------------------------------------------------------
+# SYNCHRONISATION DIFFÉRENTIELLE
+# ---------------------------------------------------------------------
+class SyncView(APIView):
+    """Renvoie les changements d’issues et de commentaires depuis un curseur."""
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Synchronisation différentielle (issues, commentaires)",
+        parameters=[
+            OpenApiParameter(
+                "since",
+                str,
+                description=(
+                    "Curseur `next_cursor` de la page précédente, "
+                    "ou date ISO 8601. Absent : synchronisation complète."
+                ),
+            ),
+            OpenApiParameter(
+                "limit",
+                int,
+                description=(
+                    f"Lignes max. par flux (défaut {SYNC_PAGE_SIZE}, "
+                    f"max. {SYNC_MAX_PAGE_SIZE})."
+                ),
+            ),
+        ],
+        responses={
+            200: {
+                "type": "object",
+                "example": {
+                    "issues": [],
+                    "comments": [],
+                    "deleted": [{"type": "comment", "id": 12}],
+                    "next_cursor": "eyJjb21tZW50cyI6...",
+                    "has_more": False,
+                },
+            }
+        },
+    )
+    def get(self, request):
+        """Liste les créations, modifications et suppressions récentes."""
+        try:
+            limit = int(request.query_params.get("limit", SYNC_PAGE_SIZE))
+        except ValueError:
+            raise ValidationError({"limit": "Entier attendu."})
+        limit = max(1, min(limit, SYNC_MAX_PAGE_SIZE))
+
+        changes, next_cursor, has_more = collect_changes(
+            request.user, request.query_params.get("since"), limit
+        )
+        context = {"request": request}
+        return Response(
+            {
+                "issues": IssueDetailSerializer(
+                    changes["issues"], many=True, context=context
+                ).data,
+                "comments": CommentDetailSerializer(
+                    changes["comments"], many=True, context=context
+                ).data,
+                "deleted": TombstoneSerializer(
+                    changes["deleted"], many=True
+                ).data,
+                "next_cursor": next_cursor,
+                "has_more": has_more,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+# ---------------------------------------------------------------------
+# RECHERCHE
+# ---------------------------------------------------------------------
+class SearchView(APIView):
+    """Recherche plein texte dans les issues et commentaires accessibles."""
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Recherche plein texte (issues, commentaires)",
+        parameters=[
+            OpenApiParameter("q", str, required=True, description="Texte."),
+            OpenApiParameter(
+                "type",
+                str,
+                enum=list(KIND_OFFSETS),
+                description="Restreint à un type d’objet.",
+            ),
+            OpenApiParameter(
+                "limit",
+                int,
+                description=f"Résultats max. (max. {SEARCH_MAX_RESULTS}).",
+            ),
+        ],
+        responses={
+            200: {
+                "type": "object",
+                "example": {
+                    "count": 1,
+                    "results": [
+                        {
+                            "type": "issue",
+                            "id": 3,
+                            "project_id": 1,
+                            "title": "Erreur de connexion",
+                            "rank": 4.2135,
+                        }
+                    ],
+                },
+            }
+        },
+    )
+    def get(self, request):
+        """Renvoie les résultats classés par pertinence."""
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": "Paramètre requis."})
+
+        kind = request.query_params.get("type")
+        if kind and kind not in KIND_OFFSETS:
+            raise ValidationError(
+                {"type": "Valeur attendue : issue, comment."}
+            )
+
+        try:
+            limit = int(request.query_params.get("limit", 20))
+        except ValueError:
+            raise ValidationError({"limit": "Entier attendu."})
+        limit = max(1, min(limit, SEARCH_MAX_RESULTS))
+
+        # Les superutilisateurs voient tous les projets (hors suppression)
+        project_ids = (
+            None
+            if request.user.is_superuser
+            else accessible_project_ids(request.user, request)
+        )
+        results = search(
+            query, project_ids, [kind] if kind else None, limit=limit
+        )
+        return Response(
+            {"count": len(results), "results": results},
+            status=status.HTTP_200_OK,
+        )
@@ -0,0 +1,121 @@
+"""
+Préchauffage des caches de listes après un déploiement.
+Reconstruit, pour les utilisateurs actifs les plus récents, la table
+d’accès et les listes `user_projects_{id}` / `issues_user_{id}_project_all`
+en passant par les viewsets eux-mêmes : les clés et le contenu en cache
+sont exactement ceux d’une première requête GET.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+from django.http import HttpRequest
+from projects.access import get_project_access
+from rest_framework.request import Request
+from users.models import User
+
+
+def recent_users(limit):
+    """Utilisateurs actifs classés par dernière connexion décroissante."""
+    return list(
+        User.objects.filter(
+            is_active=True,
+            deletion_pending=False,
+            last_login__isnull=False,
+        ).order_by("-last_login")[:limit]
+    )
+
+
+def _list_view(viewset_class, user):
+    """Instancie un viewset en action `list` pour une requête GET vide."""
+    http_request = HttpRequest()
+    http_request.method = "GET"
+    request = Request(http_request)
+    request.user = user
+    return viewset_class(
+        request=request, action="list", format_kwarg=None, args=(), kwargs={}
+    )
+
+
+def warm_user(user):
+    """
+    Reconstruit les caches de listes d’un utilisateur.
+
+    Returns:
+        int: nombre de projets accessibles.
+    """
+    # Import local : les vues importent ce module indirectement
+    from projects.views import IssueViewSet, ProjectViewSet
+
+    access = get_project_access(user)
+    # La mise en cache du queryset l’évalue (pickle) : une requête par liste
+    _list_view(ProjectViewSet, user).get_queryset()
+    if access:
+        _list_view(IssueViewSet, user).get_queryset()
+    return len(access)
+
+
+class RateLimiter:
+    """Espace les départs d’au plus `rate` opérations par seconde."""
+
+    def __init__(self, rate):
+        """Initialise l’intervalle minimal entre deux départs."""
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Bloque jusqu’au prochain créneau disponible."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        time.sleep(max(start - now, 0))
+
+
+def warm_recent_users(limit=100, workers=4, rate=20.0, on_done=None):
+    """
+    Préchauffe les caches des `limit` utilisateurs les plus récents.
+
+    Args:
+        limit (int): nombre d’utilisateurs.
+        workers (int): utilisateurs traités en parallèle (1 = séquentiel,
+            dans la connexion courante).
+        rate (float): utilisateurs démarrés par seconde au plus (0 = sans
+            limite), pour ménager la base.
+        on_done (callable): appelé avec `(user, projects, error)`.
+
+    Returns:
+        dict: `{"users": n, "errors": n}`.
+    """
+    limiter = RateLimiter(rate)
+    stats = {"users": 0, "errors": 0}
+    stats_lock = threading.Lock()
+
+    def run(user):
+        limiter.wait()
+        projects, error = 0, None
+        try:
+            projects = warm_user(user)
+        except Exception as exc:  # un utilisateur ne bloque pas les autres
+            error = exc
+        finally:
+            if workers > 1:
+                connections.close_all()
+        with stats_lock:
+            stats["errors" if error else "users"] += 1
+        if on_done is not None:
+            on_done(user, projects, error)
+
+    users = recent_users(limit)
+    if workers <= 1:
+        for user in users:
+            run(user)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(run, users))
+    return stats
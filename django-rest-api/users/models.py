@@ -69,6 +69,8 @@ class User(AbstractUser):
     can_be_contacted = models.BooleanField()
     can_data_be_shared = models.BooleanField()
     created_time = models.DateTimeField(auto_now_add=True)
+    # Compte désactivé et masqué, données purgées par lots (RGPD)
+    deletion_pending = models.BooleanField(default=False)
 
     objects = CustomUserManager()
 
@@ -8,6 +8,7 @@ from django.contrib.auth.password_validation import validate_password
 from django.core.validators import RegexValidator
 from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
+from utils.fieldsets import SparseFieldsetSerializerMixin
 
 from .models import User
 
@@ -15,7 +16,9 @@ from .models import User
 # ---------------------------------------------------------------------
 # UTILISATEURS – LISTE
 # ---------------------------------------------------------------------
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Serializer simplifié pour afficher les informations publiques."""
 
     class Meta:
@@ -27,7 +30,9 @@ class UserListSerializer(serializers.ModelSerializer):
 # ---------------------------------------------------------------------
 # UTILISATEURS – DÉTAIL / CRÉATION / ÉDITION
 # ---------------------------------------------------------------------
-class UserDetailSerializer(serializers.ModelSerializer):
+class UserDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Serializer détaillé pour la gestion complète du profil."""
 
     uuid = serializers.UUIDField(read_only=True)
@@ -0,0 +1,83 @@
+"""
+Tâches en arrière-plan du module users.
+Purge par lots des comptes supprimés (droit à l’effacement RGPD).
+"""
+
+from jobs.queue import (
+    ProgressCounter,
+    delete_in_batches,
+    enqueue,
+    register,
+)
+from projects.models import Comment, Contributor, Issue, Project
+from projects.tasks import hide_projects, purge_project, purge_querysets
+
+from .models import User
+
+
+def user_querysets(user_id):
+    """Lignes rattachées à un compte hors de ses propres projets."""
+    return [
+        Comment.objects.filter(author_user_id=user_id),
+        # Commentaires d’autres membres sur les issues du compte
+        Comment.objects.filter(issue__author_user_id=user_id).exclude(
+            author_user_id=user_id
+        ),
+        Issue.objects.filter(author_user_id=user_id),
+        Contributor.objects.filter(user_id=user_id),
+    ]
+
+
+@register("users.purge_user")
+def purge_user(user_id):
+    """
+    Supprime un compte marqué `deletion_pending` et ses données par lots.
+
+    Les projets dont il est l’auteur sont purgés en premier, puis ses
+    commentaires, issues et participations, et enfin le compte.
+    """
+    project_ids = list(
+        Project.objects.filter(author_user_id=user_id).values_list(
+            "pk", flat=True
+        )
+    )
+    progress = ProgressCounter(
+        sum(
+            qs.count()
+            for project_id in project_ids
+            for qs in purge_querysets(project_id)
+        )
+    )
+    for project_id in project_ids:
+        purge_project(project_id, progress)
+
+    # Comptées après la purge des projets pour ne rien compter deux fois
+    querysets = user_querysets(user_id)
+    progress.total += sum(qs.count() for qs in querysets)
+    for queryset in querysets:
+        delete_in_batches(queryset, progress)
+    User.objects.filter(pk=user_id).delete()
+
+
+def schedule_user_deletion(user_id):
+    """
+    Désactive et masque un compte puis publie sa purge.
+
+    Returns:
+        Job | None: tâche publiée, None si exécutée immédiatement.
+    """
+    User.objects.filter(pk=user_id).update(
+        deletion_pending=True, is_active=False
+    )
+    hide_projects(
+        list(
+            Project.objects.filter(author_user_id=user_id).values_list(
+                "pk", flat=True
+            )
+        )
+    )
+    return enqueue(
+        "users.purge_user",
+        {"user_id": user_id},
+        key=f"purge_user_{user_id}",
+    )
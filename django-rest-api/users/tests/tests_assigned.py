@@ -0,0 +1,97 @@
+"""
+Tests de l’écran « mon travail » (/api/users/me/assigned/).
+Vérifie le périmètre (issues assignées, tous projets), les annotations,
+la pagination par curseur et le nombre de requêtes par page.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from projects.models import Comment, Contributor, Issue, Project
+from rest_framework.test import APIClient
+from users.models import User
+
+URL = "/api/users/me/assigned/"
+
+
+def _user(username):
+    """Crée un utilisateur de test."""
+    return User.objects.create_user(
+        username=username,
+        password="pass1234",
+        can_be_contacted=True,
+        can_data_be_shared=False,
+        age=25,
+    )
+
+
+@pytest.mark.django_db
+class TestMyAssignedIssues:
+    """Issues assignées à l’utilisateur courant."""
+
+    def setup_method(self):
+        """Deux projets ; alice est assignée à 3 issues sur 4."""
+        self.client = APIClient()
+        self.alice, self.bob = _user("alice"), _user("bob")
+        self.assigned = []
+        for index in range(2):
+            project = Project.objects.create(
+                title=f"Projet {index}",
+                description="desc",
+                type="BACK_END",
+                author_user=self.bob,
+            )
+            Contributor.objects.create(
+                user=self.bob, project=project, permission="AUTHOR"
+            )
+            alice = Contributor.objects.create(
+                user=self.alice, project=project, permission="CONTRIBUTOR"
+            )
+            for number in range(2):
+                issue = Issue.objects.create(
+                    title=f"Issue {number}",
+                    description="desc",
+                    tag="BUG",
+                    priority="LOW",
+                    project=project,
+                    author_user=self.bob,
+                    assignee_contributor=(
+                        alice if (index, number) != (1, 1) else None
+                    ),
+                )
+                if issue.assignee_contributor:
+                    self.assigned.append(issue)
+        self.commented = self.assigned[0]
+        self.comment = Comment.objects.create(
+            description="Vu", issue=self.commented, author_user=self.bob
+        )
+
+    def test_lists_assigned_issues_across_projects(self):
+        """Issues assignées des deux projets, avec titre et commentaire."""
+        self.client.force_authenticate(user=self.alice)
+        with CaptureQueriesContext(connection) as ctx:
+            res = self.client.get(URL)
+
+        assert res.status_code == 200
+        assert len(ctx.captured_queries) == 1
+        results = {item["id"]: item for item in res.data["results"]}
+        assert set(results) == {issue.id for issue in self.assigned}
+        item = results[self.commented.id]
+        assert item["project_title"] == "Projet 0"
+        assert item["last_comment_time"] is not None
+        assert results[self.assigned[-1].id]["last_comment_time"] is None
+
+        self.client.force_authenticate(user=self.bob)
+        assert self.client.get(URL).data["results"] == []
+
+    def test_cursor_pagination(self):
+        """Le curseur parcourt toutes les issues sans doublon."""
+        self.client.force_authenticate(user=self.alice)
+        res = self.client.get(URL, {"page_size": 2})
+        first = [item["id"] for item in res.data["results"]]
+        assert len(first) == 2 and res.data["next"]
+
+        res = self.client.get(res.data["next"])
+        second = [item["id"] for item in res.data["results"]]
+        assert res.data["next"] is None
+        assert sorted(first + second) == sorted(i.id for i in self.assigned)
@@ -1,18 +1,19 @@
 """
 Définition des routes du module users.
 Expose les endpoints pour la gestion des utilisateurs et du profil
-personnel (/me/).
+personnel (/me/, /me/assigned/).
 """
 
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import MeView, UserViewSet
+from .views import MeView, MyAssignedIssuesView, UserViewSet
 
 router = DefaultRouter()
 router.register(r"", UserViewSet, basename="user")
 
 urlpatterns = [
     path("me/", MeView.as_view(), name="me"),
+    path("me/assigned/", MyAssignedIssuesView.as_view(), name="me-assigned"),
     path("", include(router.urls)),
 ]
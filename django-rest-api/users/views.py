@@ -1,22 +1,30 @@
 """
 Vues principales du module users.
 Gèrent la gestion des utilisateurs, leurs droits d’accès et
-la consultation du profil personnel (/me/).
+la consultation du profil personnel (/me/) et des issues assignées
+(/me/assigned/).
 """
 
+from django.db.models import F
 from drf_spectacular.utils import extend_schema
-from rest_framework import status, viewsets
+from projects.activity import latest_comment_time
+from projects.models import Contributor, Issue
+from projects.pagination import AssignedIssueCursorPagination
+from projects.serializers import AssignedIssueSerializer
+from rest_framework import generics, status, viewsets
 from rest_framework.exceptions import PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from utils.fieldsets import SparseFieldsetMixin
 
 from .models import User
 from .permissions import IsNotAuthenticated, IsSelfOrReadOnly
 from .serializers import UserDetailSerializer, UserListSerializer
+from .tasks import schedule_user_deletion
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(SparseFieldsetMixin, viewsets.ModelViewSet):
     """Vue de gestion CRUD pour le modèle utilisateur."""
 
     queryset = User.objects.all().order_by("id")
@@ -38,9 +46,10 @@ class UserViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Filtre la liste selon les droits de l’utilisateur."""
         user = self.request.user
-        if user.is_superuser:
-            return User.objects.all().order_by("id")
-        return User.objects.filter(id=user.id).order_by("id")
+        qs = User.objects.filter(deletion_pending=False).order_by("id")
+        if not user.is_superuser:
+            qs = qs.filter(id=user.id)
+        return self.apply_sparse_fieldset(qs)
 
     def list(self, request, *args, **kwargs):
         """Liste restreinte aux utilisateurs authentifiés."""
@@ -58,7 +67,7 @@ class UserViewSet(viewsets.ModelViewSet):
             and not self.request.user.is_superuser
         ):
             raise PermissionDenied("Action non autorisée.")
-        instance.delete()
+        return schedule_user_deletion(instance.id)
 
     @extend_schema(
         responses={
@@ -68,15 +77,35 @@ class UserViewSet(viewsets.ModelViewSet):
                     "message": "Le compte 'username' a bien été supprimé avec succès.",
                     "status": "success",
                 },
-            }
+            },
+            202: {
+                "type": "object",
+                "example": {
+                    "message": "Le compte 'username' est désactivé et en cours de suppression.",
+                    "status": "pending",
+                    "job_id": 42,
+                },
+            },
         }
     )
     def destroy(self, request, *args, **kwargs):
-        """Supprime un compte utilisateur et confirme la suppression."""
+        """Désactive un compte puis délègue la purge de ses données."""
         instance = self.get_object()
         username = instance.username
 
-        self.perform_destroy(instance)
+        job = self.perform_destroy(instance)
+        if job is not None:
+            return Response(
+                {
+                    "message": (
+                        f"Le compte '{username}' est désactivé "
+                        "et en cours de suppression."
+                    ),
+                    "status": "pending",
+                    "job_id": job.id,
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
 
         return Response(
             {
@@ -97,3 +126,40 @@ class MeView(APIView):
         """Renvoie les informations du profil utilisateur courant."""
         serializer = UserDetailSerializer(request.user)
         return Response(serializer.data)
+
+
+class MyAssignedIssuesView(generics.ListAPIView):
+    """
+    Issues assignées à l’utilisateur courant, tous projets confondus
+    (/me/assigned/) : une requête indexée par page, avec le titre du
+    projet et la date du dernier commentaire.
+    """
+
+    permission_classes = [IsAuthenticated]
+    serializer_class = AssignedIssueSerializer
+    pagination_class = AssignedIssueCursorPagination
+
+    def get_queryset(self):
+        """Issues dont l’assigné est l’un des contributeurs de l’utilisateur."""
+        return (
+            Issue.objects.filter(
+                assignee_contributor__in=Contributor.objects.filter(
+                    user=self.request.user
+                ).values("pk"),
+                project__deletion_pending=False,
+            )
+            .annotate(
+                project_title=F("project__title"),
+                last_comment_time=latest_comment_time(),
+            )
+            .only(
+                "id",
+                "title",
+                "status",
+                "tag",
+                "priority",
+                "project_id",
+                "created_time",
+                "updated_time",
+            )
+        )
@@ -1,9 +1,12 @@
 """
 Outils utilitaires liés à la gestion du cache.
 Permet la suppression sécurisée de clés ou de motifs
-dans tous les backends compatibles (FileBased, LocMem, Redis...).
+dans tous les backends compatibles (SQLiteCache, LocMem, Redis...).
 """
 
+import hashlib
+import time
+
 from django.core.cache import cache
 
 
@@ -11,7 +14,7 @@ def safe_delete_pattern(pattern: str) -> None:
     """
     Supprime en toute sécurité les entrées du cache correspondant à un motif.
 
-    - Compatible avec tous les backends (FileBased, LocMem, Redis…)
+    - Compatible avec tous les backends (SQLiteCache, LocMem, Redis…)
     - Si le backend ne supporte pas `delete_pattern`, un fallback
       interne est utilisé pour supprimer manuellement les clés.
     - Si aucune suppression ciblée n’est possible, un clear global
@@ -22,7 +25,7 @@ def safe_delete_pattern(pattern: str) -> None:
     """
     deleted_any = False
 
-    # 🔹 Cas 1 — Backend avec support natif de delete_pattern (ex: Redis)
+    # 🔹 Cas 1 — Backend avec delete_pattern natif (SQLiteCache, Redis)
     try:
         cache.delete_pattern(pattern)
         deleted_any = True
@@ -42,3 +45,68 @@ def safe_delete_pattern(pattern: str) -> None:
     # 🔹 Cas 3 — Aucun élément supprimé : fallback global
     if not deleted_any:
         cache.clear()
+
+
+def _variants_version(base: str) -> int:
+    """
+    Génération courante des variantes d’une clé (créée au besoin).
+
+    Valeur initiale dérivée de l’horloge : une génération évincée puis
+    recréée ne retombe jamais sur d’anciennes variantes.
+    """
+    key = f"variants_version_{base}"
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns() // 1000, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def build_cache_key(
+    base: str, params: dict | None = None, versioned: bool = False
+) -> str:
+    """
+    Construit une clé de cache stable à partir d’un préfixe et de variantes.
+
+    Les paramètres vides sont ignorés ; les autres sont triés (noms et
+    valeurs multiples) puis résumés par une empreinte courte, afin que
+    deux requêtes équivalentes partagent la même entrée.
+
+    Args:
+        base (str): préfixe de la clé (ex: "user_projects_3").
+        params (dict): variantes de la requête (ex: {"fields": [...]}).
+        versioned (bool): inclut la génération des variantes de `base`,
+            que `delete_cache_variants` invalide sans balayage.
+
+    Returns:
+        str: `base` seul, ou `base_q<empreinte>` si des variantes existent
+        (`base_v<génération>_q<empreinte>` si `versioned`).
+    """
+    canonical = []
+    for name in sorted(params or {}):
+        value = params[name]
+        if value in (None, "", [], ()):
+            continue
+        if isinstance(value, (list, tuple, set, frozenset)):
+            value = ",".join(sorted(str(v) for v in value))
+        canonical.append(f"{name}={value}")
+
+    if not canonical:
+        return base
+    digest = hashlib.sha1(
+        "&".join(canonical).encode(), usedforsecurity=False
+    ).hexdigest()[:12]
+    if versioned:
+        return f"{base}_v{_variants_version(base)}_q{digest}"
+    return f"{base}_q{digest}"
+
+
+def delete_cache_variants(base: str) -> None:
+    """
+    Supprime une clé et invalide toutes ses variantes.
+
+    Les variantes construites avec `versioned=True` deviennent
+    inaccessibles en oubliant leur génération, puis expirent : ni
+    balayage par motif, ni vidage global du cache.
+    """
+    cache.delete_many([base, f"variants_version_{base}"])
@@ -0,0 +1,167 @@
+"""
+Middleware de compression des réponses HTTP.
+Négocie brotli ou gzip selon l’en-tête Accept-Encoding et ignore les
+réponses sous un seuil de taille. La compression se fait à la volée ;
+seules les réponses elles-mêmes mises en cache (schéma OpenAPI…),
+marquées par `cache_compressed()`, conservent leurs octets compressés
+dans un cache dédié (`COMPRESSION_CACHE_ALIAS`).
+"""
+
+import gzip
+import hashlib
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+try:  # dépendance optionnelle : brotli n’est utilisé que s’il est installé
+    import brotli
+except ImportError:  # pragma: no cover - dépend de l’environnement
+    brotli = None
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/vnd.oai.openapi",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+# Attribut de réponse autorisant la mise en cache des octets compressés
+CACHE_COMPRESSED_ATTR = "cache_compressed"
+
+
+def available_encodings():
+    """Renvoie les encodages supportés, par ordre de préférence."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str):
+    """
+    Choisit le meilleur encodage accepté par le client.
+
+    Les valeurs `q` sont respectées (`q=0` exclut l’encodage) ; à qualité
+    égale, l’ordre de `available_encodings()` départage (brotli d’abord).
+
+    Args:
+        accept_encoding (str): valeur brute de l’en-tête Accept-Encoding.
+
+    Returns:
+        str | None: "br", "gzip" ou None si aucun encodage ne convient.
+    """
+    weights = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[token] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in available_encodings():
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress_bytes(content: bytes, encoding: str) -> bytes:
+    """Compresse un contenu avec l’encodage demandé."""
+    if encoding == "br":
+        return brotli.compress(
+            content, quality=settings.COMPRESSION_BROTLI_QUALITY
+        )
+    return gzip.compress(
+        content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0
+    )
+
+
+def cache_compressed(response):
+    """
+    Marque une réponse dont le corps est lui-même servi depuis un cache :
+    ses octets compressés seront réutilisés d’un appel à l’autre.
+    """
+    setattr(response, CACHE_COMPRESSED_ATTR, True)
+    return response
+
+
+def get_compressed_content(content: bytes, encoding: str) -> bytes:
+    """
+    Renvoie le contenu compressé, en le lisant depuis le cache si possible.
+
+    La clé dérive d’une empreinte du contenu brut : une même réponse
+    n’est compressée qu’une seule fois. Les entrées vont dans l’alias
+    dédié `COMPRESSION_CACHE_ALIAS`, borné à part, sans évincer les
+    entrées du cache par défaut.
+    """
+    timeout = settings.COMPRESSION_CACHE_TIMEOUT
+    alias = settings.COMPRESSION_CACHE_ALIAS
+    if not timeout or alias not in settings.CACHES:
+        return compress_bytes(content, encoding)
+
+    cache = caches[alias]
+    digest = hashlib.sha1(content, usedforsecurity=False).hexdigest()
+    cache_key = f"compressed_{encoding}_{digest}"
+    compressed = cache.get(cache_key)
+    if compressed is None:
+        compressed = compress_bytes(content, encoding)
+        cache.set(cache_key, compressed, timeout=timeout)
+    return compressed
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compresse les réponses textuelles volumineuses (brotli ou gzip).
+
+    À placer en tête de `MIDDLEWARE`, juste après `SecurityMiddleware`,
+    afin que la compression intervienne après toute autre modification
+    du corps de la réponse.
+    """
+
+    def process_response(self, request, response):
+        """Compresse la réponse si le client et le contenu s’y prêtent."""
+        if response.streaming or response.has_header("Content-Encoding"):
+            return response
+
+        content_type = response.get("Content-Type", "")
+        if not content_type.startswith(COMPRESSIBLE_CONTENT_TYPES):
+            return response
+
+        if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        encoding = negotiate_encoding(
+            request.META.get("HTTP_ACCEPT_ENCODING", "")
+        )
+        if encoding is None:
+            return response
+
+        # Cache réservé aux réponses marquées : les autres corps changent
+        # d’une requête à l’autre et ne seraient jamais relus
+        if getattr(response, CACHE_COMPRESSED_ATTR, False):
+            compressed = get_compressed_content(response.content, encoding)
+        else:
+            compressed = compress_bytes(response.content, encoding)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+
+        # Un ETag fort ne décrit plus les octets transmis après compression
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+
+        return response
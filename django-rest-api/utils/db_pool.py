@@ -0,0 +1,69 @@
+"""
+Métriques du pool de connexions PostgreSQL (psycopg 3).
+Expose, pour chaque base configurée avec `OPTIONS["pool"]`, la taille du
+pool, les connexions disponibles et le temps passé par les requêtes à
+attendre une connexion libre.
+"""
+
+import logging
+
+from django.db import connections
+
+logger = logging.getLogger("db.pool")
+
+# Compteurs psycopg_pool retenus (cf. ConnectionPool.get_stats())
+POOL_STAT_KEYS = (
+    "pool_min",
+    "pool_max",
+    "pool_size",
+    "pool_available",
+    "requests_waiting",
+    "requests_num",
+    "requests_queued",
+    "requests_wait_ms",
+    "requests_errors",
+    "connections_num",
+    "connections_errors",
+    "connections_lost",
+)
+
+
+def _pool(alias):
+    """Renvoie le pool d’une base, ou None (pas de pool, autre moteur)."""
+    connection = connections[alias]
+    if not connection.settings_dict.get("OPTIONS", {}).get("pool"):
+        return None
+    return getattr(connection, "pool", None)
+
+
+def pool_stats(reset=False):
+    """
+    Statistiques des pools de connexions du processus courant.
+
+    Args:
+        reset (bool): remet à zéro les compteurs cumulés après lecture.
+
+    Returns:
+        dict: `{alias: {compteur: valeur}}` ; les compteurs absents valent
+        0. `avg_wait_ms` donne l’attente moyenne par connexion obtenue.
+    """
+    stats = {}
+    for alias in connections:
+        pool = _pool(alias)
+        if pool is None:
+            continue
+        raw = pool.pop_stats() if reset else pool.get_stats()
+        values = {key: raw.get(key, 0) for key in POOL_STAT_KEYS}
+        values["avg_wait_ms"] = (
+            values["requests_wait_ms"] / values["requests_num"]
+            if values["requests_num"]
+            else 0.0
+        )
+        stats[alias] = values
+    return stats
+
+
+def log_pool_stats(reset=True):
+    """Journalise les statistiques des pools (ex. à l’arrêt d’un worker)."""
+    for alias, values in pool_stats(reset=reset).items():
+        logger.info("db_pool_stats", extra={"alias": alias, **values})
@@ -0,0 +1,167 @@
+"""
+Routage des lectures vers des réplicas en lecture seule.
+Les requêtes HTTP « sûres » (GET, HEAD, OPTIONS) lisent sur un réplica
+(`READ_REPLICAS`) ; toute écriture bascule le reste de la requête sur la
+base principale et y épingle l’utilisateur pendant `REPLICA_PIN_SECONDS`,
+afin qu’il relise immédiatement ses propres écritures, quel que soit le
+jeton ou l’appareil utilisé.
+"""
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.deprecation import MiddlewareMixin
+
+# Applications toujours lues sur la base principale : les jetons et les
+# sessions sont relus juste après leur création (retard de réplication).
+PRIMARY_ONLY_APPS = {"oauth2_provider", "sessions", "jobs"}
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# État de routage de la requête courante : "pending" (requête sûre dont
+# l’utilisateur n’est pas encore authentifié), "replica", "primary",
+# "written" (la requête a écrit) ou None (hors requête HTTP : commandes,
+# worker, tests → base principale)
+_routing = ContextVar("db_routing", default=None)
+# Requête en cours, pour lire son utilisateur une fois authentifié
+_request = ContextVar("db_routing_request", default=None)
+
+
+def pin_cache_key(user_id):
+    """Clé d’épinglage d’un utilisateur sur la base principale."""
+    return f"db_pin_user_{user_id}"
+
+
+def _user_id(request):
+    """Identifiant de l’utilisateur authentifié de la requête, ou None."""
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return None
+    return user.pk
+
+
+def _resolve_pending():
+    """
+    Choisit la base de lecture dès que l’utilisateur est connu.
+
+    L’authentification DRF (jeton OAuth2) n’a lieu que dans la vue : tant
+    que la requête reste anonyme, la décision est reportée. Les lectures
+    déclenchées par la résolution elle-même (session, utilisateur) vont
+    sur la base principale.
+    """
+    _routing.set("primary")
+    user_id = _user_id(_request.get())
+    if user_id is None:
+        _routing.set("pending")
+        return "replica"
+    pinned = cache.get(pin_cache_key(user_id)) is not None
+    _routing.set("primary" if pinned else "replica")
+    return _routing.get()
+
+
+@contextmanager
+def primary_reads():
+    """
+    Lit sur la base principale le temps du bloc.
+
+    Réservé au remplissage des caches partagés (table d’accès, listes,
+    détails, statistiques) : reconstruits depuis un réplica en retard
+    par un autre utilisateur que l’auteur de l’écriture, ils garderaient
+    un état périmé jusqu’à leur expiration.
+    """
+    token = (
+        _routing.set("primary")
+        if _routing.get() in ("replica", "pending")
+        else None
+    )
+    try:
+        yield
+    finally:
+        # Une écriture dans le bloc doit continuer d’épingler la requête
+        if token is not None and _routing.get() != "written":
+            _routing.reset(token)
+
+
+def mark_written():
+    """Bascule le reste de la requête courante sur la base principale."""
+    if _routing.get() is not None:
+        _routing.set("written")
+
+
+class PrimaryReplicaRouter:
+    """
+    Routeur Django : lectures sur un réplica quand la requête le permet,
+    écritures et migrations sur la base principale.
+    """
+
+    def db_for_read(self, model, **hints):
+        """Choisit un réplica, sauf épinglage ou transaction en cours."""
+        replicas = settings.READ_REPLICAS
+        if (
+            not replicas
+            or _routing.get() not in ("replica", "pending")
+            or model._meta.app_label in PRIMARY_ONLY_APPS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        if _routing.get() == "pending" and _resolve_pending() == "primary":
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        """Écrit sur la base principale et y épingle la requête."""
+        mark_written()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Autorise les relations entre la base principale et ses réplicas."""
+        databases = {DEFAULT_DB_ALIAS, *settings.READ_REPLICAS}
+        if {obj1._state.db, obj2._state.db} <= databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """Les réplicas reçoivent le schéma par réplication, pas migrate."""
+        if db in settings.READ_REPLICAS:
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    """
+    Active la lecture sur réplica pour les requêtes sûres.
+
+    L’utilisateur est épinglé sur la base principale lorsqu’il a écrit
+    récemment (clé `db_pin_user_<id>` en cache, partagée par tous ses
+    jetons et sessions) ; une requête qui écrit prolonge cet épinglage.
+    L’utilisateur n’étant connu qu’après l’authentification DRF, le
+    routeur consulte l’épinglage à la première lecture qui suit.
+    """
+
+    def process_request(self, request):
+        """Détermine la base de lecture de la requête."""
+        unsafe = (
+            not settings.READ_REPLICAS or request.method not in SAFE_METHODS
+        )
+        _routing.set("primary" if unsafe else "pending")
+        _request.set(request)
+
+    def process_response(self, request, response):
+        """Épingle l’utilisateur s’il a écrit, puis rétablit le routage."""
+        user_id = _user_id(request)
+        wrote = _routing.get() == "written"
+        if settings.READ_REPLICAS and wrote and user_id is not None:
+            cache.set(
+                pin_cache_key(user_id),
+                True,
+                timeout=settings.REPLICA_PIN_SECONDS,
+            )
+        # Pas de reset() : sous ASGI, process_request et process_response
+        # ne s’exécutent pas dans le même contexte.
+        _routing.set(None)
+        _request.set(None)
+        return response
@@ -0,0 +1,225 @@
+"""
+Outils de sélection partielle des champs (« sparse fieldsets »).
+Permet aux clients de restreindre la réponse via `?fields=` ou `?exclude=`
+et traduit cette sélection en `only()`, `select_related()` et
+`prefetch_related()` afin de ne charger que les colonnes utiles.
+"""
+
+from dataclasses import dataclass, field
+
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+
+
+def parse_field_list(raw: str | None) -> list[str]:
+    """Découpe une liste de champs séparés par des virgules."""
+    if not raw:
+        return []
+    return [name.strip() for name in raw.split(",") if name.strip()]
+
+
+@dataclass
+class QueryPlan:
+    """Colonnes et relations nécessaires pour un ensemble de champs."""
+
+    only: set = field(default_factory=set)
+    select_related: set = field(default_factory=set)
+    prefetch: dict = field(default_factory=dict)
+
+    def apply(self, queryset):
+        """Applique le plan à un queryset en remplaçant ses relations."""
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if self.select_related:
+            queryset = queryset.select_related(*sorted(self.select_related))
+        for path in sorted(self.prefetch):
+            queryset = queryset.prefetch_related(self.prefetch[path])
+        return queryset.only(*sorted(self.only))
+
+
+def _field_paths(serializer, name):
+    """Renvoie les chemins ORM (`a__b__c`) lus par un champ du serializer."""
+    requires = getattr(serializer.Meta, "sparse_requires", {})
+    if name in requires:
+        return list(requires[name])
+
+    serializer_field = serializer.fields[name]
+    if serializer_field.source == "*":
+        return []
+    return ["__".join(serializer_field.source_attrs)]
+
+
+def _add_path(plan, model, path):
+    """Ajoute au plan un chemin ORM en résolvant ses relations."""
+    parts = path.split("__")
+    current_model = model
+    for index, part in enumerate(parts):
+        model_field = current_model._meta.get_field(part)
+        lookup = "__".join(parts[: index + 1])
+        is_last = index == len(parts) - 1
+
+        if model_field.one_to_many or model_field.many_to_many:
+            # Relation inverse : chargée à part via prefetch_related
+            plan.prefetch.setdefault(lookup, Prefetch(lookup))
+            return
+
+        if not model_field.is_relation or is_last:
+            plan.only.add(lookup)
+            return
+
+        # Clé étrangère traversée : jointure + colonnes de la cible
+        plan.only.add(lookup)
+        plan.select_related.add(lookup)
+        current_model = model_field.related_model
+        plan.only.add(f"{lookup}__{current_model._meta.pk.name}")
+
+
+def _add_nested(plan, model, nested):
+    """Ajoute un serializer imbriqué (many=True) sous forme de Prefetch."""
+    child = nested.child
+    relation = model._meta.get_field(nested.source)
+    child_plan = build_query_plan(type(child), list(child.fields))
+    # La clé de jointure doit rester chargée pour rattacher les lignes
+    child_plan.only.add(relation.field.name)
+    queryset = child_plan.apply(child.Meta.model.objects.all())
+    plan.prefetch[nested.source] = Prefetch(nested.source, queryset=queryset)
+
+
+def build_query_plan(serializer_class, field_names, extra_paths=()):
+    """
+    Calcule le plan de requête minimal pour les champs demandés.
+
+    Args:
+        serializer_class: classe de serializer (ModelSerializer).
+        field_names (list[str]): champs effectivement rendus.
+        extra_paths (tuple[str]): chemins ORM toujours nécessaires à la vue.
+
+    Returns:
+        QueryPlan: colonnes (`only`) et relations à charger.
+    """
+    serializer = serializer_class()
+    model = serializer_class.Meta.model
+    plan = QueryPlan(only={"pk"})
+
+    for name in field_names:
+        serializer_field = serializer.fields[name]
+        if isinstance(serializer_field, serializers.ListSerializer):
+            _add_nested(plan, model, serializer_field)
+            continue
+        for path in _field_paths(serializer, name):
+            _add_path(plan, model, path)
+
+    for path in extra_paths:
+        _add_path(plan, model, path)
+    return plan
+
+
+# ---------------------------------------------------------------------
+# SERIALIZERS
+# ---------------------------------------------------------------------
+class SparseFieldsetSerializerMixin:
+    """
+    Retire du serializer les champs absents de `context["sparse_fields"]`.
+
+    Les serializers imbriqués ne sont pas concernés : seul le serializer
+    racine (ou l’enfant d’un `many=True`) reçoit le contexte à la création.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Restreint les champs rendus selon le contexte."""
+        super().__init__(*args, **kwargs)
+        selected = self.context.get("sparse_fields")
+        if selected is None:
+            return
+        for name in list(self.fields):
+            if name not in selected:
+                self.fields.pop(name)
+
+
+# ---------------------------------------------------------------------
+# VUES
+# ---------------------------------------------------------------------
+_FIELD_NAMES = {}
+
+
+def serializer_field_names(serializer_class):
+    """Renvoie (et mémorise) les noms de champs lisibles d’un serializer."""
+    if serializer_class not in _FIELD_NAMES:
+        fields = serializer_class().fields
+        _FIELD_NAMES[serializer_class] = tuple(
+            name for name, f in fields.items() if not f.write_only
+        )
+    return _FIELD_NAMES[serializer_class]
+
+
+class SparseFieldsetMixin:
+    """
+    Ajoute `?fields=` et `?exclude=` aux viewsets en lecture.
+
+    - `get_sparse_fields()` valide la sélection (400 si champ inconnu) ;
+    - `get_serializer_context()` la transmet au serializer ;
+    - `apply_sparse_fieldset(qs)` restreint colonnes et jointures.
+
+    `sparse_required_paths` liste les chemins ORM dont la vue elle-même
+    a besoin, quels que soient les champs demandés ; `sparse_object_paths`
+    ceux lus par les permissions objet sur les routes de détail.
+    """
+
+    sparse_required_paths = ()
+    sparse_object_paths = ()
+
+    def get_sparse_fields(self):
+        """Renvoie les champs à rendre, ou None si aucune sélection."""
+        if hasattr(self, "_sparse_fields"):
+            return self._sparse_fields
+
+        self._sparse_fields = None
+        params = self.request.query_params
+        requested = parse_field_list(params.get("fields"))
+        excluded = parse_field_list(params.get("exclude"))
+        if self.request.method not in SAFE_METHODS or not (
+            requested or excluded
+        ):
+            return None
+
+        available = serializer_field_names(self.get_serializer_class())
+        unknown = sorted(set(requested + excluded) - set(available))
+        if unknown:
+            raise ValidationError(
+                {"fields": f"Champs inconnus : {', '.join(unknown)}."}
+            )
+
+        selected = requested or list(available)
+        self._sparse_fields = frozenset(
+            name for name in selected if name not in excluded
+        )
+        return self._sparse_fields
+
+    def get_sparse_cache_params(self):
+        """Paramètres de sélection à intégrer aux clés de cache."""
+        fields = self.get_sparse_fields()
+        return {"fields": sorted(fields)} if fields is not None else {}
+
+    def get_serializer_context(self):
+        """Ajoute la sélection de champs au contexte du serializer."""
+        context = super().get_serializer_context()
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            context["sparse_fields"] = fields
+        return context
+
+    def apply_sparse_fieldset(self, queryset):
+        """Restreint le queryset aux colonnes et jointures nécessaires."""
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+        extra_paths = self.sparse_required_paths
+        # Permissions objet : seule `retrieve` lit l’objet de la route
+        # (les actions annexes comme `comments` listent un autre modèle)
+        if getattr(self, "action", None) == "retrieve":
+            extra_paths += self.sparse_object_paths
+        plan = build_query_plan(
+            self.get_serializer_class(), sorted(fields), extra_paths
+        )
+        return plan.apply(queryset)
@@ -0,0 +1,198 @@
+"""
+Handlers et formateurs de logs non bloquants.
+Les requêtes déposent leurs enregistrements dans une file bornée
+(`BoundedQueueHandler`) ; un thread `QueueListener` les écrit ensuite
+vers les handlers cibles (fichier, console) au format JSON. Les pertes
+sur file pleine sont exposées par `queue_stats()` / `log_queue_stats()`.
+"""
+
+import json
+import logging
+import threading
+import weakref
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger("logs.queue")
+
+# Taille de file utilisée sans configuration explicite
+DEFAULT_QUEUE_MAXSIZE = 10000
+
+# Attributs standards d’un LogRecord, exclus des champs « extra »
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+# Handlers de file actifs (pour les statistiques et le vidage)
+_QUEUE_HANDLERS = weakref.WeakSet()
+
+
+class JsonFormatter(logging.Formatter):
+    """Formate chaque enregistrement en une ligne JSON."""
+
+    def format(self, record):
+        """Sérialise le message, le contexte et les champs `extra`."""
+        payload = {
+            "time": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        payload.update(
+            {
+                key: value
+                for key, value in vars(record).items()
+                if key not in _RECORD_ATTRS
+            }
+        )
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class DrainingQueueListener(QueueListener):
+    """QueueListener dont l’arrêt attend une place dans une file pleine."""
+
+    def enqueue_sentinel(self):
+        """Dépose le marqueur de fin après les enregistrements en attente."""
+        self.queue.put(self._sentinel)
+
+
+def _get_handler(name):
+    """Renvoie un handler déjà configuré par son nom, ou None."""
+    getter = getattr(logging, "getHandlerByName", None)  # Python 3.12+
+    if getter is not None:
+        return getter(name)
+    return logging._handlers.get(name)
+
+
+def _build_queue(spec):
+    """Construit une file depuis `{"()": fabrique, **arguments}`."""
+    spec = dict(spec)
+    factory = spec.pop("()")
+    if isinstance(factory, str):
+        factory = import_string(factory)
+    return factory(**spec)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    QueueHandler à file bornée, compatible avec la configuration native.
+
+    - `emit()` ne bloque jamais : si la file est pleine, l’enregistrement
+      est abandonné et comptabilisé dans `dropped` ;
+    - le listener démarre au premier enregistrement ;
+    - `flush()` attend que la file soit vidée par le listener ;
+    - `close()` (appelé par `logging.shutdown()` à l’arrêt du processus)
+      vide la file puis arrête le listener.
+
+    Se déclare avec les clés natives de `dictConfig` (`queue`, `listener`,
+    `handlers`, `respect_handler_level`). Sous Python 3.12+, `dictConfig`
+    construit lui-même la file et le listener et résout les cibles ; sous
+    Python 3.11, ces clés arrivent brutes et sont résolues ici, les
+    cibles devant alors être classées avant ce handler (ordre
+    alphabétique des noms).
+    """
+
+    def __init__(
+        self,
+        queue=None,
+        handlers=(),
+        listener=None,
+        respect_handler_level=True,
+    ):
+        """Construit la file et le listener à partir de la configuration."""
+        if queue is None:
+            queue = Queue(maxsize=DEFAULT_QUEUE_MAXSIZE)
+        elif isinstance(queue, Mapping):
+            queue = _build_queue(queue)
+        super().__init__(queue)
+        self.dropped = 0
+        self._lock_state = threading.Lock()
+        self._closed = False
+
+        targets = []
+        for name in handlers:
+            target = _get_handler(name) if isinstance(name, str) else name
+            if target is None:
+                raise ValueError(
+                    f"Handler cible {name!r} introuvable : il doit être "
+                    "déclaré (et nommé) avant le handler de file."
+                )
+            targets.append(target)
+        if listener is None:
+            listener = DrainingQueueListener
+        elif isinstance(listener, str):
+            listener = import_string(listener)
+        # Remplacé par `dictConfig` sous Python 3.12+
+        self.listener = listener(
+            self.queue, *targets, respect_handler_level=respect_handler_level
+        )
+        _QUEUE_HANDLERS.add(self)
+
+    def _start_listener(self):
+        """Démarre le listener s’il ne tourne pas encore."""
+        with self._lock_state:
+            if not self._closed and self.listener._thread is None:
+                self.listener.start()
+
+    def enqueue(self, record):
+        """Dépose l’enregistrement sans attendre ; compte les pertes."""
+        if self.listener._thread is None:
+            self._start_listener()
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            with self._lock_state:
+                self.dropped += 1
+
+    def flush(self):
+        """Attend que le listener ait écrit tous les enregistrements."""
+        if self.listener._thread is not None:
+            self.queue.join()
+
+    def close(self):
+        """Vide la file, arrête le listener puis ferme le handler."""
+        with self._lock_state:
+            self._closed = True
+            if self.listener._thread is not None:
+                self.listener.stop()
+        super().close()
+
+
+def queue_stats():
+    """
+    Statistiques des files de logs actives.
+
+    Returns:
+        dict: `{nom: {"queued": n, "dropped": n, "maxsize": n}}`.
+    """
+    return {
+        handler.name
+        or hex(id(handler)): {
+            "queued": handler.queue.qsize(),
+            "dropped": handler.dropped,
+            "maxsize": handler.queue.maxsize,
+        }
+        for handler in list(_QUEUE_HANDLERS)
+    }
+
+
+def flush_log_queues():
+    """Vide toutes les files de logs (arrêt propre d’un worker)."""
+    for handler in list(_QUEUE_HANDLERS):
+        handler.flush()
+
+
+def log_queue_stats():
+    """Journalise l’état des files de logs (ex. à l’arrêt d’un worker)."""
+    for name, values in queue_stats().items():
+        logger.info("log_queue_stats", extra={"handler": name, **values})
@@ -0,0 +1,128 @@
+"""
+Schéma OpenAPI généré une seule fois par déploiement.
+`SpectacularAPIView` réintrospecte toutes les vues et tous les serializers
+(puis rejoue les hooks de post-traitement) à chaque appel. Ici, les octets
+rendus sont conservés en mémoire de processus (un redémarrage, donc un
+déploiement ou un rechargement du serveur de dev, les régénère) ou lus
+depuis les fichiers précompilés par `manage.py build_openapi_schema`.
+Les réponses portent un ETag : un client à jour reçoit un 304 vide. La
+compression reste confiée à `utils.compression.CompressionMiddleware`,
+qui conserve les octets compressés des schémas mémorisés.
+"""
+
+import hashlib
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from drf_spectacular.utils import extend_schema
+from drf_spectacular.views import SCHEMA_KWARGS, SpectacularAPIView
+from rest_framework.settings import api_settings
+from utils.compression import cache_compressed
+
+# Octets rendus et ETag, par (type de média, version, langue)
+_RENDERED = {}
+_LOCK = threading.Lock()
+
+
+def schema_etag(content):
+    """ETag fort dérivé du contenu rendu."""
+    return '"%s"' % hashlib.sha256(content).hexdigest()[:32]
+
+
+def schema_file(directory, renderer):
+    """Chemin du schéma précompilé pour un renderer (`schema.yaml`…)."""
+    return Path(directory) / f"schema.{renderer.format}"
+
+
+def clear_schema_cache():
+    """Oublie les schémas mémorisés (tests, rechargement à chaud)."""
+    _RENDERED.clear()
+
+
+class CachedSpectacularAPIView(SpectacularAPIView):
+    """
+    `SpectacularAPIView` servie depuis la mémoire du processus.
+
+    Le premier appel d’une combinaison (format, version, langue) génère
+    et rend le schéma ; les suivants ne coûtent qu’une comparaison d’ETag.
+    Les combinaisons hors des valeurs déclarées (`ALLOWED_VERSIONS`,
+    `LANGUAGES`) sont générées sans être mémorisées.
+    """
+
+    # False : génère à chaque appel (utilisé par build_openapi_schema)
+    cache_schema = True
+
+    @extend_schema(**SCHEMA_KWARGS)
+    def get(self, request, *args, **kwargs):
+        """Sert le schéma mémorisé, ou un 304 si le client l’a déjà."""
+        version = (
+            self.api_version
+            or request.version
+            or self._get_version_parameter(request)
+        )
+        key = self._memo_key(request, version) if self.cache_schema else None
+        if key is None:
+            entry = self._render(request, *args, **kwargs)
+        else:
+            entry = _RENDERED.get(key)
+            if entry is None:
+                with _LOCK:
+                    entry = _RENDERED.get(key) or self._load(
+                        request, key, *args, **kwargs
+                    )
+                    _RENDERED[key] = entry
+
+        content, etag = entry
+        not_modified = get_conditional_response(request, etag=etag)
+        response = not_modified or HttpResponse(
+            content, content_type=self._content_type(request)
+        )
+        response["ETag"] = etag
+        response["Content-Disposition"] = (
+            f'inline; filename="{self._get_filename(request, version)}"'
+        )
+        # Toujours revalider : l’ETag rend la revalidation quasi gratuite
+        patch_cache_control(response, no_cache=True, public=True)
+        if key is not None:
+            cache_compressed(response)
+        return response
+
+    def _memo_key(self, request, version):
+        """Clé de mémorisation, ou None si la combinaison est arbitraire."""
+        lang = request.GET.get("lang") if settings.USE_I18N else None
+        if lang and lang not in dict(settings.LANGUAGES):
+            return None
+        allowed = (self.api_version, *(api_settings.ALLOWED_VERSIONS or ()))
+        if version and version not in allowed:
+            return None
+        return (request.accepted_renderer.media_type, version, lang or None)
+
+    def _load(self, request, key, *args, **kwargs):
+        """Lit le schéma précompilé s’il existe, sinon le génère."""
+        directory = settings.OPENAPI_SCHEMA_DIR
+        _, version, lang = key
+        if directory and version is None and lang is None:
+            path = schema_file(directory, request.accepted_renderer)
+            if path.is_file():
+                content = path.read_bytes()
+                return content, schema_etag(content)
+        return self._render(request, *args, **kwargs)
+
+    def _render(self, request, *args, **kwargs):
+        """Génère puis rend le schéma (hooks de post-traitement compris)."""
+        data = super().get(request, *args, **kwargs).data
+        renderer = request.accepted_renderer
+        content = renderer.render(
+            data, renderer.media_type, self.get_renderer_context()
+        )
+        return content, schema_etag(content)
+
+    def _content_type(self, request):
+        """En-tête Content-Type identique à celui d’une Response DRF."""
+        renderer = request.accepted_renderer
+        if renderer.charset:
+            return f"{renderer.media_type}; charset={renderer.charset}"
+        return renderer.media_type
@@ -0,0 +1,372 @@
+"""
+Backend de cache partagé adossé à un unique fichier SQLite (mode WAL).
+Remplace FileBasedCache (un fichier par clé) : tous les workers d’un même
+hôte partagent les entrées sans service externe, avec incréments
+atomiques, suppression par préfixe ou motif, expiration et éviction LRU.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS cache_entry ("
+    " key TEXT PRIMARY KEY,"
+    " value BLOB NOT NULL,"
+    " expires REAL,"
+    " accessed REAL NOT NULL"
+    ") WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS cache_entry_expires"
+    " ON cache_entry (expires) WHERE expires IS NOT NULL",
+    "CREATE INDEX IF NOT EXISTS cache_entry_accessed"
+    " ON cache_entry (accessed)",
+)
+
+# Clause « entrée non expirée » (paramètre : instant courant)
+_ALIVE = "(expires IS NULL OR expires > ?)"
+
+# Résolution (s) de la date d’accès : une lecture n’écrit que si la date
+# enregistrée a plus d’une minute, précision suffisante pour l’éviction
+_ACCESS_RESOLUTION = 60.0
+
+# Intervalle (s) maximal entre deux comptages exacts des entrées
+_COUNT_REFRESH = 60.0
+
+
+def _escape_like(value):
+    """Échappe les jokers LIKE d’un préfixe littéral."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class SQLiteCache(BaseCache):
+    """
+    Cache Django stocké dans une base SQLite partagée.
+
+    - Les entiers sont conservés tels quels (`incr()` est une seule
+      instruction UPDATE, atomique entre processus) ; les autres valeurs
+      sont sérialisées avec pickle ;
+    - `delete_prefix()` / `delete_pattern()` suppriment un groupe de clés
+      (utilisés par `utils.cache_tools.safe_delete_pattern`) ;
+    - au-delà de `MAX_ENTRIES`, les entrées expirées puis les moins
+      récemment lues (1 / `CULL_FREQUENCY`) sont évincées ; le nombre
+      d’entrées est estimé entre deux comptages exacts (`_cull`).
+
+    `LOCATION` désigne le fichier SQLite (créé au besoin).
+    """
+
+    def __init__(self, location, params):
+        """Mémorise l’emplacement ; les connexions sont ouvertes à la demande."""
+        super().__init__(params)
+        self.location = str(location)
+        self._local = threading.local()
+        # Nombre d’entrées estimé et date du dernier comptage exact
+        self._estimate, self._counted_at = None, 0.0
+
+    # -----------------------------------------------------------------
+    # CONNEXION
+    # -----------------------------------------------------------------
+    def _connection(self):
+        """Connexion propre au thread et au processus (sûre après fork)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        directory = os.path.dirname(self.location)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.location, timeout=5, isolation_level=None)
+        for pragma in (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA busy_timeout=5000",
+        ):
+            conn.execute(pragma)
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    # -----------------------------------------------------------------
+    # SÉRIALISATION
+    # -----------------------------------------------------------------
+    @staticmethod
+    def _encode(value):
+        """Entiers natifs (incrémentables en SQL), pickle pour le reste."""
+        if type(value) is int and -(2**63) <= value < 2**63:
+            return value
+        return pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _decode(stored):
+        """Inverse de `_encode`."""
+        if isinstance(stored, int):
+            return stored
+        return pickle.loads(stored)
+
+    # -----------------------------------------------------------------
+    # LECTURE
+    # -----------------------------------------------------------------
+    def _touch_accessed(self, conn, rows, now):
+        """
+        Met à jour la date d’accès (LRU) des clés lues dont la date
+        enregistrée dépasse `_ACCESS_RESOLUTION` : une clé lue en continu
+        ne coûte qu’une écriture par minute, les autres lectures aucune.
+        """
+        stale = [
+            key
+            for key, accessed in rows
+            if accessed < now - _ACCESS_RESOLUTION
+        ]
+        if not stale:
+            return
+        placeholders = ",".join("?" * len(stale))
+        conn.execute(
+            f"UPDATE cache_entry SET accessed = ? "
+            f"WHERE key IN ({placeholders})",
+            (now, *stale),
+        )
+
+    def get(self, key, default=None, version=None):
+        """Renvoie la valeur d’une clé non expirée, sinon `default`."""
+        key = self.make_and_validate_key(key, version=version)
+        conn, now = self._connection(), time.time()
+        row = conn.execute(
+            "SELECT value, accessed FROM cache_entry "
+            f"WHERE key = ? AND {_ALIVE}",
+            (key, now),
+        ).fetchone()
+        if row is None:
+            return default
+        self._touch_accessed(conn, [(key, row[1])], now)
+        return self._decode(row[0])
+
+    def get_many(self, keys, version=None):
+        """Lit plusieurs clés en une requête."""
+        key_map = {
+            self.make_and_validate_key(key, version=version): key
+            for key in keys
+        }
+        if not key_map:
+            return {}
+        conn, now = self._connection(), time.time()
+        placeholders = ",".join("?" * len(key_map))
+        rows = conn.execute(
+            f"SELECT key, value, accessed FROM cache_entry "
+            f"WHERE key IN ({placeholders}) AND {_ALIVE}",
+            (*key_map, now),
+        ).fetchall()
+        self._touch_accessed(conn, [(k, a) for k, _, a in rows], now)
+        return {key_map[k]: self._decode(v) for k, v, _ in rows}
+
+    def has_key(self, key, version=None):
+        """Indique si une clé non expirée existe."""
+        key = self.make_and_validate_key(key, version=version)
+        row = (
+            self._connection()
+            .execute(
+                f"SELECT 1 FROM cache_entry WHERE key = ? AND {_ALIVE}",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return row is not None
+
+    # -----------------------------------------------------------------
+    # ÉCRITURE
+    # -----------------------------------------------------------------
+    def _write(self, rows, only_if_absent=False):
+        """
+        Écrit des couples (clé, valeur) dans une transaction IMMEDIATE.
+
+        Returns:
+            int: nombre de lignes écrites.
+        """
+        conn, now = self._connection(), time.time()
+        written = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for key, value, expires in rows:
+                if expires is not None and expires <= now:
+                    # Délai nul ou négatif : la clé expire immédiatement
+                    if not only_if_absent:
+                        conn.execute(
+                            "DELETE FROM cache_entry WHERE key = ?", (key,)
+                        )
+                    continue
+                if only_if_absent:
+                    conn.execute(
+                        "DELETE FROM cache_entry "
+                        "WHERE key = ? AND expires <= ?",
+                        (key, now),
+                    )
+                verb = "INSERT OR IGNORE" if only_if_absent else "REPLACE"
+                written += conn.execute(
+                    f"{verb} INTO cache_entry (key, value, expires, accessed)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, self._encode(value), expires, now),
+                ).rowcount
+            if written:
+                self._cull(conn, now, written)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return written
+
+    def _count(self, conn, now):
+        """Compte exactement les entrées et recale l’estimation."""
+        (count,) = conn.execute("SELECT COUNT(*) FROM cache_entry").fetchone()
+        self._estimate, self._counted_at = count, now
+        return count
+
+    def _cull(self, conn, now, written):
+        """
+        Évince les entrées expirées puis les moins récemment lues.
+
+        Le nombre d’entrées est estimé (dernier comptage + lignes écrites
+        depuis) : COUNT(*) ne s’exécute que si l’estimation dépasse
+        `MAX_ENTRIES` ou date de plus de `_COUNT_REFRESH` secondes, ce qui
+        borne l’écart dû aux écritures des autres processus.
+        """
+        if (
+            self._estimate is not None
+            and now - self._counted_at < _COUNT_REFRESH
+            and self._estimate + written <= self._max_entries
+        ):
+            self._estimate += written
+            return
+        if self._count(conn, now) <= self._max_entries:
+            return
+        conn.execute("DELETE FROM cache_entry WHERE expires <= ?", (now,))
+        count = self._count(conn, now)
+        if count <= self._max_entries:
+            return
+        if self._cull_frequency == 0:
+            conn.execute("DELETE FROM cache_entry")
+            self._estimate = 0
+            return
+        culled = max(count // self._cull_frequency, 1)
+        conn.execute(
+            "DELETE FROM cache_entry WHERE key IN ("
+            " SELECT key FROM cache_entry ORDER BY accessed LIMIT ?)",
+            (culled,),
+        )
+        self._estimate = count - culled
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """Écrit la clé seulement si elle est absente (ou expirée)."""
+        key = self.make_and_validate_key(key, version=version)
+        expires = self.get_backend_timeout(timeout)
+        return bool(self._write([(key, value, expires)], only_if_absent=True))
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """Écrit (ou remplace) une clé."""
+        key = self.make_and_validate_key(key, version=version)
+        self._write([(key, value, self.get_backend_timeout(timeout))])
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        """Écrit plusieurs clés dans une seule transaction."""
+        expires = self.get_backend_timeout(timeout)
+        self._write(
+            [
+                (self.make_and_validate_key(key, version=version), v, expires)
+                for key, v in data.items()
+            ]
+        )
+        return []
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        """Repousse l’expiration d’une clé existante."""
+        key = self.make_and_validate_key(key, version=version)
+        now = time.time()
+        return bool(
+            self._connection()
+            .execute(
+                f"UPDATE cache_entry SET expires = ? "
+                f"WHERE key = ? AND {_ALIVE}",
+                (self.get_backend_timeout(timeout), key, now),
+            )
+            .rowcount
+        )
+
+    def incr(self, key, delta=1, version=None):
+        """Incrémente un entier de façon atomique (une seule instruction)."""
+        key = self.make_and_validate_key(key, version=version)
+        row = (
+            self._connection()
+            .execute(
+                f"UPDATE cache_entry SET value = value + ? "
+                f"WHERE key = ? AND typeof(value) = 'integer' AND {_ALIVE} "
+                "RETURNING value",
+                (delta, key, time.time()),
+            )
+            .fetchone()
+        )
+        if row is None:
+            if self.has_key(key):
+                raise TypeError("La valeur en cache n’est pas un entier.")
+            raise ValueError(f"Clé '{key}' introuvable.")
+        return row[0]
+
+    # -----------------------------------------------------------------
+    # SUPPRESSION
+    # -----------------------------------------------------------------
+    def delete(self, key, version=None):
+        """Supprime une clé ; renvoie True si elle existait."""
+        key = self.make_and_validate_key(key, version=version)
+        return bool(
+            self._connection()
+            .execute("DELETE FROM cache_entry WHERE key = ?", (key,))
+            .rowcount
+        )
+
+    def delete_many(self, keys, version=None):
+        """Supprime plusieurs clés en une requête."""
+        keys = [self.make_and_validate_key(k, version=version) for k in keys]
+        if keys:
+            self._connection().execute(
+                "DELETE FROM cache_entry WHERE key IN "
+                f"({','.join('?' * len(keys))})",
+                keys,
+            )
+
+    def delete_prefix(self, prefix, version=None):
+        """
+        Supprime toutes les clés commençant par `prefix`.
+
+        Returns:
+            int: nombre d’entrées supprimées.
+        """
+        stored = self.make_key(prefix, version=version)
+        return (
+            self._connection()
+            .execute(
+                "DELETE FROM cache_entry WHERE key LIKE ? ESCAPE '\\'",
+                (_escape_like(stored) + "%",),
+            )
+            .rowcount
+        )
+
+    def delete_pattern(self, pattern, version=None):
+        """
+        Supprime les clés correspondant à un motif glob (`user_*`),
+        comme django-redis.
+
+        Returns:
+            int: nombre d’entrées supprimées.
+        """
+        stored = self.make_key(pattern, version=version)
+        return (
+            self._connection()
+            .execute("DELETE FROM cache_entry WHERE key GLOB ?", (stored,))
+            .rowcount
+        )
+
+    def clear(self):
+        """Vide tout le cache."""
+        self._connection().execute("DELETE FROM cache_entry")
+        self._estimate = 0
@@ -0,0 +1,79 @@
+"""
+Maintenance des bases SQLite en mode WAL.
+Le fichier `-wal` grossit tant qu’aucun checkpoint complet n’a lieu
+(lecteurs permanents) : le worker appelle `maybe_checkpoint()` pour
+recopier régulièrement le journal dans la base puis le tronquer.
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django.db import OperationalError, connections
+
+logger = logging.getLogger("db.sqlite")
+
+_last_checkpoint = {"time": 0.0}
+
+
+def wal_databases():
+    """Alias des bases SQLite configurées avec le profil WAL."""
+    return [
+        alias
+        for alias in connections
+        if connections[alias].vendor == "sqlite"
+        and "journal_mode=WAL"
+        in connections[alias]
+        .settings_dict.get("OPTIONS", {})
+        .get("init_command", "")
+    ]
+
+
+def checkpoint(alias="default", mode="TRUNCATE"):
+    """
+    Lance un checkpoint WAL.
+
+    Args:
+        alias (str): base concernée.
+        mode (str): PASSIVE, FULL, RESTART ou TRUNCATE.
+
+    Returns:
+        dict: `busy` (1 si bloqué par un lecteur ou un écrivain), pages
+        du journal (`log`) et pages recopiées (`checkpointed`).
+    """
+    if mode not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+        raise ValueError(f"Mode de checkpoint inconnu : {mode}")
+    with connections[alias].cursor() as cursor:
+        cursor.execute(f"PRAGMA wal_checkpoint({mode})")
+        busy, log, checkpointed = cursor.fetchone()
+    return {"busy": busy, "log": log, "checkpointed": checkpointed}
+
+
+def maybe_checkpoint(now=None):
+    """
+    Lance un checkpoint sur chaque base WAL si l’intervalle est écoulé.
+
+    Returns:
+        dict: résultats par alias (vide si rien n’a été fait).
+    """
+    interval = settings.SQLITE_CHECKPOINT_INTERVAL
+    now = time.monotonic() if now is None else now
+    if not interval or now - _last_checkpoint["time"] < interval:
+        return {}
+    _last_checkpoint["time"] = now
+
+    results = {}
+    for alias in wal_databases():
+        try:
+            results[alias] = checkpoint(alias)
+        except OperationalError as exc:
+            # Base occupée : le prochain intervalle retentera
+            logger.warning(
+                "sqlite_checkpoint_failed",
+                extra={"alias": alias, "error": str(exc)},
+            )
+            continue
+        logger.info(
+            "sqlite_checkpoint", extra={"alias": alias, **results[alias]}
+        )
+    return results
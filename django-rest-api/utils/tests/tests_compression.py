@@ -0,0 +1,136 @@
+"""
+Tests du middleware de compression des réponses.
+Couvre la négociation d’encodage, le seuil de taille, la compression à
+la volée et la réutilisation des octets compressés des réponses
+marquées, stockés dans leur cache dédié.
+"""
+
+import gzip
+import hashlib
+import json
+from unittest import mock
+
+import pytest
+from django.core.cache import cache, caches
+from django.http import HttpResponse, JsonResponse
+from utils import compression
+from utils.compression import (
+    CompressionMiddleware,
+    cache_compressed,
+    negotiate_encoding,
+)
+
+
+# ---------------------------------------------------------------------
+# FIXTURES
+# ---------------------------------------------------------------------
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Vide les caches avant et après chaque test."""
+    cache.clear()
+    caches["compression"].clear()
+    yield
+    cache.clear()
+    caches["compression"].clear()
+
+
+def _large_payload():
+    """Construit un corps JSON largement au-dessus du seuil."""
+    return {"results": [{"id": i, "title": "Issue"} for i in range(500)]}
+
+
+def _run(rf, response, accept="gzip"):
+    """Fait passer une réponse dans le middleware."""
+    request = rf.get("/api/issues/", HTTP_ACCEPT_ENCODING=accept)
+    middleware = CompressionMiddleware(lambda req: response)
+    return middleware(request)
+
+
+# ---------------------------------------------------------------------
+# NÉGOCIATION
+# ---------------------------------------------------------------------
+def test_negotiate_encoding_respects_quality_values():
+    """Les valeurs q et l’exclusion q=0 sont prises en compte."""
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0, deflate") is None
+    assert negotiate_encoding("") is None
+    assert negotiate_encoding("*") in compression.available_encodings()
+
+
+# ---------------------------------------------------------------------
+# COMPRESSION
+# ---------------------------------------------------------------------
+def test_large_json_response_is_gzipped(rf):
+    """Une réponse volumineuse est compressée et reste décodable."""
+    payload = _large_payload()
+    response = _run(rf, JsonResponse(payload))
+
+    assert response["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response["Vary"]
+    assert json.loads(gzip.decompress(response.content)) == payload
+
+
+def test_small_response_is_left_untouched(rf):
+    """Une réponse sous le seuil n’est pas compressée."""
+    response = _run(rf, JsonResponse({"detail": "ok"}))
+    assert not response.has_header("Content-Encoding")
+
+
+def test_binary_content_type_is_skipped(rf):
+    """Les contenus non textuels ne sont pas recompressés."""
+    response = _run(
+        rf, HttpResponse(b"\x89PNG" * 1000, content_type="image/png")
+    )
+    assert not response.has_header("Content-Encoding")
+
+
+def test_compressed_bytes_are_reused_from_cache(rf):
+    """Une réponse marquée identique n’est compressée qu’une seule fois."""
+    payload = _large_payload()
+    with mock.patch.object(
+        compression, "compress_bytes", wraps=compression.compress_bytes
+    ) as spy:
+        first = _run(rf, cache_compressed(JsonResponse(payload)))
+        second = _run(rf, cache_compressed(JsonResponse(payload)))
+
+    assert spy.call_count == 1
+    assert first.content == second.content
+
+
+def test_unmarked_responses_are_compressed_inline(rf):
+    """Sans marque, compression à la volée, sans empreinte ni cache."""
+    raw = JsonResponse(_large_payload())
+    key = _cache_key(raw)
+    with mock.patch.object(compression, "get_compressed_content") as cached:
+        response = _run(rf, raw)
+
+    assert response["Content-Encoding"] == "gzip"
+    cached.assert_not_called()
+    assert caches["compression"].get(key) is None
+
+
+def _cache_key(response):
+    """Clé sous laquelle les octets gzip d’une réponse sont rangés."""
+    digest = hashlib.sha1(response.content, usedforsecurity=False)
+    return f"compressed_gzip_{digest.hexdigest()}"
+
+
+def test_compressed_bytes_stay_out_of_default_cache(rf):
+    """Les octets compressés vont dans l’alias dédié, pas le cache commun."""
+    raw = cache_compressed(JsonResponse(_large_payload()))
+    key = _cache_key(raw)
+    _run(rf, raw)
+
+    assert cache.get(key) is None
+    assert caches["compression"].get(key) is not None
+
+
+def test_compression_cache_can_be_disabled(rf, settings):
+    """Sans alias configuré, la compression fonctionne sans cache."""
+    settings.COMPRESSION_CACHE_ALIAS = ""
+    raw = cache_compressed(JsonResponse(_large_payload()))
+    key = _cache_key(raw)
+    response = _run(rf, raw)
+
+    assert response["Content-Encoding"] == "gzip"
+    assert caches["compression"].get(key) is None
@@ -0,0 +1,49 @@
+"""
+Tests des métriques du pool de connexions.
+Le pool psycopg est simulé : seuls la sélection des bases concernées et
+le calcul des compteurs sont vérifiés.
+"""
+
+from django.db import connection
+from utils.db_pool import pool_stats
+
+
+class _FakePool:
+    """Pool minimal exposant les compteurs de psycopg_pool."""
+
+    def __init__(self):
+        """Initialise des compteurs cumulés."""
+        self.stats = {
+            "pool_size": 4,
+            "pool_available": 1,
+            "requests_num": 8,
+            "requests_wait_ms": 20,
+        }
+
+    def get_stats(self):
+        """Renvoie les compteurs sans les remettre à zéro."""
+        return dict(self.stats)
+
+    def pop_stats(self):
+        """Renvoie les compteurs puis remet à zéro les cumuls."""
+        stats = self.get_stats()
+        self.stats.update(requests_num=0, requests_wait_ms=0)
+        return stats
+
+
+def test_pool_stats_ignores_databases_without_pool():
+    """Sans `OPTIONS["pool"]`, aucune statistique n’est renvoyée."""
+    assert pool_stats() == {}
+
+
+def test_pool_stats_reports_wait_time(monkeypatch):
+    """Les compteurs sont complétés et l’attente moyenne calculée."""
+    monkeypatch.setitem(connection.settings_dict, "OPTIONS", {"pool": True})
+    monkeypatch.setattr(connection, "pool", _FakePool(), raising=False)
+
+    stats = pool_stats(reset=True)["default"]
+    assert stats["pool_size"] == 4
+    assert stats["requests_waiting"] == 0
+    assert stats["avg_wait_ms"] == 2.5
+
+    assert pool_stats()["default"]["avg_wait_ms"] == 0.0
@@ -0,0 +1,233 @@
+"""
+Tests du routage des lectures vers les réplicas.
+Vérifie la lecture sur réplica des requêtes GET, la bascule sur la base
+principale après une écriture et l’épinglage de l’utilisateur qui a
+écrit, y compris avec une base principale et un réplica distincts.
+"""
+
+import sqlite3
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connections
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from oauth2_provider.models import AccessToken
+from projects.access import get_project_access
+from projects.models import Contributor, Project
+from users.models import User
+from utils.db_routers import (
+    PrimaryReplicaRouter,
+    ReplicaRoutingMiddleware,
+    primary_reads,
+)
+
+router = PrimaryReplicaRouter()
+
+
+@pytest.fixture(autouse=True)
+def replicas():
+    """Déclare un réplica et vide le cache des épinglages."""
+    cache.clear()
+    with override_settings(READ_REPLICAS=["replica_1"]):
+        yield
+    cache.clear()
+
+
+class _User:
+    """Utilisateur authentifié minimal (sans base de données)."""
+
+    is_authenticated = True
+
+    def __init__(self, pk):
+        """Mémorise l’identifiant."""
+        self.pk = pk
+
+
+def _call(method, view=None, write=False, user=None, token="Bearer abc"):
+    """Traverse le middleware ; renvoie la base choisie pour les lectures."""
+    seen = {}
+
+    def default_view(request):
+        # Authentification DRF : l’utilisateur n’est connu que dans la vue
+        request.user = user or _User(1)
+        seen["read"] = router.db_for_read(Project)
+        if write:
+            router.db_for_write(Project)
+            seen["after_write"] = router.db_for_read(Project)
+        return HttpResponse()
+
+    request = getattr(RequestFactory(), method)(
+        "/api/projects/", HTTP_AUTHORIZATION=token
+    )
+    request.user = AnonymousUser()
+    ReplicaRoutingMiddleware(view or default_view)(request)
+    return seen
+
+
+def test_outside_requests_read_primary():
+    """Hors requête HTTP (commandes, worker), tout va sur la principale."""
+    assert router.db_for_read(Project) == "default"
+
+
+def test_safe_requests_read_replica_except_tokens():
+    """Les GET lisent sur le réplica, sauf applications épinglées."""
+    assert _call("get")["read"] == "replica_1"
+    assert _call("post")["read"] == "default"
+
+    seen = {}
+
+    def view(request):
+        seen["token"] = router.db_for_read(AccessToken)
+        return HttpResponse()
+
+    _call("get", view=view)
+    assert seen["token"] == "default"
+
+
+def test_write_pins_user_to_primary():
+    """Après une écriture, l’utilisateur relit sur la principale."""
+    seen = _call("post", write=True)
+    assert seen["after_write"] == "default"
+
+    assert _call("get")["read"] == "default"
+    # Même utilisateur, autre jeton (rafraîchi, autre appareil)
+    assert _call("get", token="Bearer autre")["read"] == "default"
+    # Un autre utilisateur n’est pas concerné
+    assert _call("get", user=_User(2))["read"] == "replica_1"
+
+
+# ---------------------------------------------------------------------
+# DEUX FICHIERS SQLITE
+# ---------------------------------------------------------------------
+@pytest.fixture
+def replica_file(tmp_path):
+    """
+    Réplica en retard : instantané de la base de test copié dans un
+    fichier SQLite distinct, ouvert sous l’alias `replica_1`.
+
+    Connexion créée hors `DATABASES` : les cas de test Django n’y
+    appliquent pas leur liste de bases autorisées.
+    """
+    path = tmp_path / "replica.sqlite3"
+    primary = connections["default"]
+
+    def snapshot():
+        primary.ensure_connection()
+        target = sqlite3.connect(path)
+        primary.connection.backup(target)
+        target.close()
+
+    settings_dict = {**primary.settings_dict, "NAME": str(path)}
+    replica = primary.__class__(settings_dict, alias="replica_1")
+    connections["replica_1"] = replica
+    yield snapshot
+    replica.close()
+    del connections["replica_1"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_read_your_writes_across_sqlite_files(replica_file):
+    """Écriture sur la principale : relue par son auteur, pas par un autre."""
+    author, other = (
+        User.objects.create_user(
+            username=username,
+            password="pass123",
+            age=25,
+            can_be_contacted=True,
+            can_data_be_shared=False,
+        )
+        for username in ("replica_author", "replica_other")
+    )
+    replica_file()
+
+    def create(request):
+        request.user = author
+        Project.objects.create(
+            title="Écrit sur la principale",
+            description="desc",
+            type="BACK_END",
+            author_user=author,
+        )
+        return HttpResponse()
+
+    def read_as(user):
+        seen = {}
+
+        def view(request):
+            request.user = user
+            seen["found"] = Project.objects.filter(
+                title="Écrit sur la principale"
+            ).exists()
+            return HttpResponse()
+
+        _call("get", view=view, token="Bearer nouveau")
+        return seen["found"]
+
+    _call("post", view=create)
+
+    # Réplica pas encore rattrapé : seul l’auteur voit sa ligne
+    assert read_as(author) is True
+    assert read_as(other) is False
+
+    # Épinglage expiré : l’auteur relit lui aussi sur le réplica
+    cache.clear()
+    assert read_as(author) is False
+
+
+def test_primary_reads_block_keeps_writes_pinned():
+    """Bloc `primary_reads` : principale, puis réplica sauf écriture."""
+    seen = {}
+
+    def view(request):
+        request.user = _User(1)
+        with primary_reads():
+            seen["inside"] = router.db_for_read(Project)
+        seen["after"] = router.db_for_read(Project)
+        with primary_reads():
+            router.db_for_write(Project)
+        seen["after_write"] = router.db_for_read(Project)
+        return HttpResponse()
+
+    _call("get", view=view)
+    assert seen == {
+        "inside": "default",
+        "after": "replica_1",
+        "after_write": "default",
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_shared_caches_rebuilt_from_primary(replica_file):
+    """Un nouveau membre, non épinglé, voit aussitôt le projet partagé."""
+    author, member = (
+        User.objects.create_user(
+            username=username,
+            password="pass123",
+            age=25,
+            can_be_contacted=True,
+            can_data_be_shared=False,
+        )
+        for username in ("shared_author", "shared_member")
+    )
+    project = Project.objects.create(
+        title="Projet partagé",
+        description="desc",
+        type="BACK_END",
+        author_user=author,
+    )
+    replica_file()
+    # Ajout écrit sur la principale, absent du réplica en retard
+    Contributor.objects.create(
+        user=member, project=project, permission="CONTRIBUTOR", role="Membre"
+    )
+    seen = {}
+
+    def view(request):
+        request.user = member
+        seen["access"] = get_project_access(member, request)
+        return HttpResponse()
+
+    _call("get", view=view)
+    assert seen["access"] == {project.id: "CONTRIBUTOR"}
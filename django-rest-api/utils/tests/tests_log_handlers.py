@@ -0,0 +1,166 @@
+"""
+Tests des handlers de logs non bloquants.
+Couvre le format JSON, le comptage des pertes sur file pleine, le
+vidage de la file à l’arrêt et la configuration par `dictConfig`.
+"""
+
+import json
+import logging
+import logging.config
+import threading
+from queue import Queue
+
+import pytest
+from utils import log_handlers
+from utils.log_handlers import BoundedQueueHandler, JsonFormatter
+
+
+class _CollectingHandler(logging.Handler):
+    """Handler cible mémorisant les messages, éventuellement bloqué."""
+
+    def __init__(self, gate=None):
+        """Initialise la liste des messages et le verrou optionnel."""
+        super().__init__()
+        self.messages = []
+        self.gate = gate
+
+    def emit(self, record):
+        """Attend l’ouverture du verrou puis mémorise le message."""
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture
+def make_queue_handler():
+    """Crée des handlers de file nommés, fermés en fin de test."""
+    created = []
+
+    def factory(target, name, **kwargs):
+        target.name = name
+        handler = BoundedQueueHandler(handlers=[name], **kwargs)
+        created.append((handler, target))
+        return handler
+
+    yield factory
+    for handler, target in created:
+        handler.close()
+        target.close()
+
+
+def _record(message, **extra):
+    """Construit un enregistrement de log."""
+    record = logging.LogRecord(
+        "projects.invites", logging.INFO, __file__, 1, message, (), None
+    )
+    record.__dict__.update(extra)
+    return record
+
+
+# ---------------------------------------------------------------------
+# TESTS
+# ---------------------------------------------------------------------
+def test_json_formatter_includes_extra_fields():
+    """Les champs `extra` figurent dans la ligne JSON."""
+    line = JsonFormatter().format(_record("invite_attempt", project_id=3))
+    payload = json.loads(line)
+
+    assert payload["message"] == "invite_attempt"
+    assert payload["logger"] == "projects.invites"
+    assert payload["project_id"] == 3
+    assert "lineno" not in payload
+
+
+def test_full_queue_drops_instead_of_blocking(make_queue_handler):
+    """Une file pleine abandonne et compte les enregistrements en trop."""
+    gate = threading.Event()
+    target = _CollectingHandler(gate)
+    handler = make_queue_handler(
+        target, "test_blocked_target", queue=Queue(maxsize=2)
+    )
+
+    for index in range(10):
+        handler.handle(_record(f"m{index}"))
+
+    # Le listener en retient un, la file en contient deux
+    assert handler.dropped >= 7
+    gate.set()
+    handler.flush()
+    assert len(target.messages) == 10 - handler.dropped
+
+
+def test_close_flushes_pending_records(make_queue_handler):
+    """L’arrêt du handler écrit tous les enregistrements en file."""
+    target = _CollectingHandler()
+    handler = make_queue_handler(target, "test_flush_target")
+
+    for index in range(100):
+        handler.handle(_record(f"m{index}"))
+    handler.close()
+
+    assert len(target.messages) == 100
+    assert handler.dropped == 0
+
+
+def test_unknown_target_is_rejected():
+    """Une cible non configurée est signalée explicitement."""
+    with pytest.raises(ValueError, match="introuvable"):
+        BoundedQueueHandler(handlers=["absent_handler"])
+
+
+def test_dict_config_native_keys(settings):
+    """Clés `queue` / `listener` / `handlers` : file bornée, pertes exposées."""
+    gate = threading.Event()
+    config = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {
+            "a_target": {"()": lambda: _CollectingHandler(gate)},
+            "b_queue": {
+                "class": "utils.log_handlers.BoundedQueueHandler",
+                "queue": {"()": "queue.Queue", "maxsize": 2},
+                "listener": "utils.log_handlers.DrainingQueueListener",
+                "handlers": ["a_target"],
+                "respect_handler_level": True,
+            },
+        },
+        "loggers": {
+            "tests.queue": {"handlers": ["b_queue"], "propagate": False}
+        },
+    }
+    try:
+        logging.config.dictConfig(config)
+        handler = logging.getLogger("tests.queue").handlers[0]
+        assert isinstance(handler.listener, log_handlers.DrainingQueueListener)
+
+        for index in range(10):
+            logging.getLogger("tests.queue").warning(f"m{index}")
+        assert log_handlers.queue_stats()["b_queue"]["dropped"] >= 7
+
+        gate.set()
+        handler.close()
+        target = handler.listener.handlers[0]
+        assert len(target.messages) == 10 - handler.dropped
+    finally:
+        gate.set()
+        logging.config.dictConfig(settings.LOGGING)
+
+
+def test_log_queue_stats_reports_drops(
+    make_queue_handler, caplog, monkeypatch
+):
+    """Les pertes de chaque file sont journalisées."""
+    gate = threading.Event()
+    handler = make_queue_handler(
+        _CollectingHandler(gate), "test_stats_target", queue=Queue(maxsize=1)
+    )
+    handler.name = "test_stats_queue"
+    for index in range(5):
+        handler.handle(_record(f"m{index}"))
+    gate.set()
+
+    monkeypatch.setattr(log_handlers.logger, "handlers", [caplog.handler])
+    log_handlers.log_queue_stats()
+    stats = [r for r in caplog.records if r.handler == "test_stats_queue"]
+    assert stats[0].dropped >= 3
+    assert stats[0].maxsize == 1
@@ -0,0 +1,93 @@
+"""
+Tests du schéma OpenAPI mémorisé (`utils.openapi_cache`).
+Vérifie la génération unique par processus, la revalidation par ETag,
+la réutilisation des octets compressés et le service des fichiers
+précompilés par `build_openapi_schema`.
+"""
+
+import pytest
+from django.core.cache import caches
+from django.core.management import call_command
+from drf_spectacular.generators import SchemaGenerator
+from rest_framework.test import APIClient
+from utils import compression
+from utils.openapi_cache import clear_schema_cache
+
+JSON = "application/vnd.oai.openapi+json"
+
+
+@pytest.fixture(autouse=True)
+def fresh_schema():
+    """Vide la mémoire des schémas avant et après chaque test."""
+    clear_schema_cache()
+    yield
+    clear_schema_cache()
+
+
+def _fail(*args, **kwargs):
+    """Remplace la génération : tout appel fait échouer le test."""
+    pytest.fail("schéma régénéré")
+
+
+def test_schema_generated_once_and_revalidated(monkeypatch):
+    """Un seul rendu par format ; un client à jour reçoit un 304 vide."""
+    client = APIClient()
+    res = client.get("/api/schema/", HTTP_ACCEPT=JSON)
+    assert res.status_code == 200
+    assert res["Content-Type"] == JSON
+    assert res.json()["info"]["title"] == "SoftDesk API"
+    tags = {
+        tag
+        for item in res.json()["paths"].values()
+        for operation in item.values()
+        for tag in operation.get("tags", [])
+    }
+    assert "-auth" not in tags
+    etag = res["ETag"]
+
+    monkeypatch.setattr(SchemaGenerator, "get_schema", _fail)
+    again = client.get("/api/schema/", HTTP_ACCEPT=JSON)
+    assert again.content == res.content
+    assert again["ETag"] == etag
+
+    res = client.get("/api/schema/", HTTP_ACCEPT=JSON, HTTP_IF_NONE_MATCH=etag)
+    assert res.status_code == 304
+    assert res.content == b""
+
+    # Le middleware affaiblit l’ETag des réponses compressées
+    res = client.get(
+        "/api/schema/", HTTP_ACCEPT=JSON, HTTP_IF_NONE_MATCH="W/" + etag
+    )
+    assert res.status_code == 304
+
+
+def test_precompiled_schema_is_served(monkeypatch, settings, tmp_path):
+    """Fichiers de build_openapi_schema servis tels quels, sans génération."""
+    call_command("build_openapi_schema", output=str(tmp_path))
+    assert (tmp_path / "schema.json").is_file()
+    assert (tmp_path / "schema.yaml").is_file()
+
+    settings.OPENAPI_SCHEMA_DIR = str(tmp_path)
+    monkeypatch.setattr(SchemaGenerator, "get_schema", _fail)
+    client = APIClient()
+    for name, accept in (("schema.json", JSON), ("schema.yaml", "*/*")):
+        res = client.get("/api/schema/", HTTP_ACCEPT=accept)
+        assert res.status_code == 200
+        assert res.content == (tmp_path / name).read_bytes()
+
+
+def test_schema_compressed_bytes_are_cached(monkeypatch):
+    """Schéma mémorisé : octets compressés réutilisés d’un appel à l’autre."""
+    caches["compression"].clear()
+    client = APIClient()
+    first = client.get(
+        "/api/schema/", HTTP_ACCEPT=JSON, HTTP_ACCEPT_ENCODING="gzip"
+    )
+    assert first["Content-Encoding"] == "gzip"
+
+    monkeypatch.setattr(compression, "compress_bytes", _fail)
+    again = client.get(
+        "/api/schema/", HTTP_ACCEPT=JSON, HTTP_ACCEPT_ENCODING="gzip"
+    )
+    assert again.content == first.content
+    caches["compression"].clear()
@@ -0,0 +1,132 @@
+"""
+Tests du backend de cache SQLite.
+Couvre la lecture / écriture, l’expiration, les incréments atomiques,
+la suppression par motif, l’éviction LRU et le coût des lectures
+(date d’accès grossière) et des écritures (nombre d’entrées estimé).
+"""
+
+import threading
+
+import pytest
+from utils.sqlite_cache import SQLiteCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache isolé dans un fichier temporaire, limité à 10 entrées."""
+    return SQLiteCache(
+        tmp_path / "cache.sqlite3",
+        {"OPTIONS": {"MAX_ENTRIES": 10, "CULL_FREQUENCY": 2}},
+    )
+
+
+def test_set_get_expire_and_add(cache):
+    """Valeurs pickle, expiration et `add()` sur clé existante."""
+    cache.set("projets", {"ids": [1, 2]})
+    assert cache.get("projets") == {"ids": [1, 2]}
+    assert cache.get_many(["projets", "absent"]) == {
+        "projets": {"ids": [1, 2]}
+    }
+
+    cache.set("éphémère", "x", timeout=0)
+    assert cache.get("éphémère", "défaut") == "défaut"
+
+    assert cache.add("projets", "autre") is False
+    assert cache.add("nouveau", "valeur") is True
+    assert cache.delete("nouveau") is True
+    assert cache.has_key("nouveau") is False
+
+
+def test_incr_is_atomic_across_threads(cache):
+    """Les incréments concurrents ne perdent aucune mise à jour."""
+    cache.set("compteur", 0)
+
+    def work():
+        for _ in range(50):
+            cache.incr("compteur")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.get("compteur") == 200
+    with pytest.raises(ValueError):
+        cache.incr("absent")
+
+
+def test_delete_pattern_and_prefix(cache):
+    """Seules les clés du motif ou du préfixe sont supprimées."""
+    cache.set_many(
+        {
+            "issues_user_1_project_1": 1,
+            "issues_user_1_project_2": 2,
+            "issues_user_2_project_1": 3,
+            "user_projects_1_qabc": 4,
+        }
+    )
+    assert cache.delete_pattern("issues_user_1_project_*") == 2
+    assert cache.delete_prefix("user_projects_1") == 1
+    assert list(cache.get_many(["issues_user_2_project_1"])) == [
+        "issues_user_2_project_1"
+    ]
+
+
+def test_cull_evicts_least_recently_used(cache):
+    """Au-delà de MAX_ENTRIES, les clés les moins lues partent d’abord."""
+    for i in range(10):
+        cache.set(f"k{i}", i)
+    # Rend k0 « récente » malgré son ancienneté d’écriture
+    cache._connection().execute(
+        "UPDATE cache_entry SET accessed = accessed + 3600 WHERE key = ?",
+        (cache.make_key("k0"),),
+    )
+
+    cache.set("k10", 10)
+
+    assert cache.has_key("k0")
+    assert cache.has_key("k10")
+    assert not cache.has_key("k1")
+    assert len(cache.get_many([f"k{i}" for i in range(11)])) == 6
+
+
+def _statements(cache):
+    """Enregistre les instructions SQL exécutées par la connexion."""
+    statements = []
+    cache._connection().set_trace_callback(statements.append)
+    return statements
+
+
+def test_reads_touch_access_time_coarsely(cache):
+    """Une lecture n’écrit que si la date d’accès a plus d’une minute."""
+    cache.set_many({"chaude": 1, "froide": 2})
+    statements = _statements(cache)
+    for _ in range(5):
+        assert cache.get("chaude") == 1
+        assert cache.get_many(["chaude", "froide"]) == {
+            "chaude": 1,
+            "froide": 2,
+        }
+    assert not [s for s in statements if s.startswith("UPDATE")]
+
+    cache._connection().execute(
+        "UPDATE cache_entry SET accessed = accessed - 3600"
+    )
+    statements.clear()
+    cache.get("chaude")
+    cache.get("chaude")
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 1
+
+
+def test_entry_count_is_estimated_between_counts(cache):
+    """COUNT(*) n’est exécuté qu’à l’approche de MAX_ENTRIES."""
+    cache.set("k0", 0)
+    statements = _statements(cache)
+    for i in range(1, 10):
+        cache.set(f"k{i}", i)
+    assert not [s for s in statements if "COUNT(*)" in s]
+
+    cache.set("k10", 10)
+    assert [s for s in statements if "COUNT(*)" in s]
+    assert len(cache.get_many([f"k{i}" for i in range(11)])) == 6
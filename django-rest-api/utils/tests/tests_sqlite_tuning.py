@@ -0,0 +1,43 @@
+"""
+Tests du profil SQLite optimisé et des checkpoints WAL.
+"""
+
+import sqlite3
+
+import pytest
+from django.conf import settings
+from django.test import override_settings
+from utils import sqlite_tuning
+
+
+def test_pragmas_enable_wal(tmp_path):
+    """Le profil active WAL, synchronous=NORMAL et l’attente des verrous."""
+    conn = sqlite3.connect(tmp_path / "tuned.sqlite3")
+    for pragma in settings.SQLITE_PRAGMAS:
+        conn.execute(pragma)
+
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == (
+        settings.SQLITE_BUSY_TIMEOUT
+    )
+    conn.close()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_checkpoint_runs_once_per_interval(monkeypatch):
+    """Le checkpoint n’est relancé qu’une fois l’intervalle écoulé."""
+    monkeypatch.setattr(sqlite_tuning, "_last_checkpoint", {"time": 0.0})
+    monkeypatch.setattr(sqlite_tuning, "wal_databases", lambda: ["default"])
+
+    with override_settings(SQLITE_CHECKPOINT_INTERVAL=60):
+        assert set(sqlite_tuning.maybe_checkpoint(now=100)["default"]) == {
+            "busy",
+            "log",
+            "checkpointed",
+        }
+        assert sqlite_tuning.maybe_checkpoint(now=130) == {}
+        assert "default" in sqlite_tuning.maybe_checkpoint(now=161)
+
+    with pytest.raises(ValueError):
+        sqlite_tuning.checkpoint(mode="NOW")
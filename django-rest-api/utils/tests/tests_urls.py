@@ -0,0 +1,72 @@
+"""
+Tests de la construction des URL absolues (`utils.urls`).
+Vérifie l’équivalence avec `reverse()` + `build_absolute_uri()`, la
+mémorisation par processus et par requête, et l’hôte réel des réponses.
+"""
+
+import pytest
+from django.test import RequestFactory
+from django.urls import reverse
+from projects.models import Contributor, Issue, Project
+from rest_framework.test import APIClient
+from users.models import User
+from utils.urls import absolute_prefix, build_url, route_template
+
+
+def test_build_url_matches_reverse(monkeypatch, settings):
+    """Même résultat que Django ; préfixe calculé une fois par requête."""
+    settings.ALLOWED_HOSTS = ["api.example.com"]
+    request = RequestFactory().get("/", HTTP_HOST="api.example.com")
+    expected = request.build_absolute_uri(reverse("issue-detail", args=[42]))
+    assert build_url("issue-detail", 42, request) == expected
+    assert build_url("issue-detail", 42) == reverse("issue-detail", args=[42])
+    assert route_template.cache_info().currsize >= 1
+
+    monkeypatch.setattr(
+        request, "build_absolute_uri", lambda *a: pytest.fail("recalcul")
+    )
+    assert absolute_prefix(request) == "http://api.example.com"
+
+
+@pytest.mark.django_db
+def test_comment_urls_use_request_host():
+    """Plus d’hôte codé en dur : l’URL suit l’hôte de la requête."""
+    user = User.objects.create_user(
+        username="url_user",
+        password="pass123",
+        age=25,
+        can_be_contacted=True,
+        can_data_be_shared=False,
+    )
+    project = Project.objects.create(
+        title="Projet URL", description="d", type="BACK_END", author_user=user
+    )
+    Contributor.objects.create(
+        user=user, project=project, permission="AUTHOR", role="Auteur"
+    )
+    issue = Issue.objects.create(
+        title="Issue URL",
+        description="d",
+        tag="BUG",
+        priority="LOW",
+        project=project,
+        author_user=user,
+    )
+    client = APIClient(HTTP_HOST="testserver")
+    client.force_authenticate(user=user)
+
+    res = client.post(
+        "/api/comments/",
+        {"issue": issue.id, "description": "Bonjour"},
+        format="json",
+        secure=True,
+    )
+    assert res.status_code == 201
+    assert (
+        res.data["issue_url"] == f"https://testserver/api/issues/{issue.id}/"
+    )
+
+    res = client.get("/api/comments/", {"fields": "id,issue_url"})
+    assert res.data["results"][0]["issue_url"] == (
+        f"http://testserver/api/issues/{issue.id}/"
+    )
@@ -0,0 +1,70 @@
+"""
+Construction rapide des URL absolues de l’API.
+Chaque route est résolue une seule fois par processus en un gabarit
+(`/api/issues/{}/`) et le préfixe `schéma://hôte` une seule fois par
+requête : une URL ne coûte plus qu’un formatage de chaîne, au lieu d’un
+`reverse()` et d’un `build_absolute_uri()` par ligne sérialisée.
+"""
+
+from functools import lru_cache
+
+from django.urls import reverse
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+# Identifiant sentinelle remplacé par `{}` dans le chemin résolu
+_MARKER = "7319846250"
+
+# Attribut de requête mémorisant le préfixe absolu
+_PREFIX_ATTR = "_absolute_url_prefix"
+
+
+@lru_cache(maxsize=None)
+def route_template(view_name):
+    """Chemin d’une route de détail avec `{}` à la place de l’identifiant."""
+    path = reverse(view_name, args=[_MARKER])
+    return path.replace("{", "{{").replace("}", "}}").replace(_MARKER, "{}")
+
+
+def absolute_prefix(request):
+    """`schéma://hôte` de la requête (en-têtes de proxy compris)."""
+    prefix = getattr(request, _PREFIX_ATTR, None)
+    if prefix is None:
+        prefix = request.build_absolute_uri("/").rstrip("/")
+        setattr(request, _PREFIX_ATTR, prefix)
+    return prefix
+
+
+def build_url(view_name, pk, request=None):
+    """
+    URL de détail d’un objet.
+
+    Args:
+        view_name (str): nom de la route (`issue-detail`…).
+        pk: identifiant de l’objet.
+        request: requête courante ; sans elle, chemin relatif.
+    """
+    path = route_template(view_name).format(pk)
+    if request is None:
+        return path
+    return absolute_prefix(request) + path
+
+
+@extend_schema_field(OpenApiTypes.URI)
+class AbsoluteURLField(serializers.Field):
+    """
+    Champ en lecture seule rendant l’URL de détail d’un identifiant.
+    Remplace `HyperlinkedRelatedField` / `HyperlinkedIdentityField` :
+    `source` désigne la colonne d’identifiant (`issue_id`, `id`…).
+    """
+
+    def __init__(self, view_name, **kwargs):
+        """Mémorise la route et force la lecture seule."""
+        self.view_name = view_name
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        """Formate l’identifiant dans le gabarit de la route."""
+        return build_url(self.view_name, value, self.context.get("request"))